@@ -19,166 +19,136 @@ if TYPE_CHECKING:
     from .coordinator import KomfoventCoordinator
 
 from . import registers
-from .const import DOMAIN
-from .helpers import build_device_info
-
-# Status bitmask values
-BITMASK_STARTING: Final = 1 << 0  # 1
-BITMASK_STOPPING: Final = 1 << 1  # 2
-BITMASK_FAN: Final = 1 << 2  # 4
-BITMASK_ROTOR: Final = 1 << 3  # 8
-BITMASK_HEATING: Final = 1 << 4  # 16
-BITMASK_COOLING: Final = 1 << 5  # 32
-BITMASK_HEATING_DENIED: Final = 1 << 6  # 64
-BITMASK_COOLING_DENIED: Final = 1 << 7  # 128
-BITMASK_FLOW_DOWN: Final = 1 << 8  # 256
-BITMASK_FREE_HEATING: Final = 1 << 9  # 512
-BITMASK_FREE_COOLING: Final = 1 << 10  # 1024
-BITMASK_ALARM_F: Final = 1 << 11  # 2048
-BITMASK_ALARM_W: Final = 1 << 12  # 4096
-
-
-async def create_binary_sensors(
-    coordinator: KomfoventCoordinator,
-) -> list[KomfoventBinarySensor]:
-    """Get list of binary sensor entities."""
-    return [
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_STARTING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_starting",
-                name="Status Starting",
-                entity_registry_enabled_default=False,
-            ),
+from .const import DOMAIN, StatusFlag
+
+STATUS_DESCRIPTIONS: Final[
+    tuple[tuple[BinarySensorEntityDescription, StatusFlag], ...]
+] = (
+    (
+        BinarySensorEntityDescription(
+            key="status_starting",
+            name="Status Starting",
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_STOPPING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_stopping",
-                name="Status Stopping",
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.STARTING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_stopping",
+            name="Status Stopping",
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_FAN,
-            entity_description=BinarySensorEntityDescription(
-                key="status_fan",
-                name="Status Fan",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.STOPPING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_fan",
+            name="Status Fan",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_ROTOR,
-            entity_description=BinarySensorEntityDescription(
-                key="status_rotor",
-                name="Status Rotor",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.FAN,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_rotor",
+            name="Status Rotor",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_HEATING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_heating",
-                name="Status Heating",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.ROTOR,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_heating",
+            name="Status Heating",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_COOLING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_cooling",
-                name="Status Cooling",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.HEATING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_cooling",
+            name="Status Cooling",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_HEATING_DENIED,
-            entity_description=BinarySensorEntityDescription(
-                key="status_heating_denied",
-                name="Status Heating Denied",
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.COOLING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_heating_denied",
+            name="Status Heating Denied",
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_COOLING_DENIED,
-            entity_description=BinarySensorEntityDescription(
-                key="status_cooling_denied",
-                name="Status Cooling Denied",
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.HEATING_DENIED,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_cooling_denied",
+            name="Status Cooling Denied",
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_FLOW_DOWN,
-            entity_description=BinarySensorEntityDescription(
-                key="status_flow_down",
-                name="Status Flow Down",
-                device_class=BinarySensorDeviceClass.PROBLEM,
-            ),
+        StatusFlag.COOLING_DENIED,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_flow_down",
+            name="Status Flow Down",
+            device_class=BinarySensorDeviceClass.PROBLEM,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_FREE_HEATING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_free_heating",
-                name="Status Free Heating",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.FLOW_DOWN,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_free_heating",
+            name="Status Free Heating",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_FREE_COOLING,
-            entity_description=BinarySensorEntityDescription(
-                key="status_free_cooling",
-                name="Status Free Cooling",
-                device_class=BinarySensorDeviceClass.RUNNING,
-                entity_registry_enabled_default=False,
-            ),
+        StatusFlag.FREE_HEATING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_free_cooling",
+            name="Status Free Cooling",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            entity_registry_enabled_default=False,
         ),
-        KomfoventStatusBinarySensor(
-            coordinator=coordinator,
-            register_id=registers.REG_STATUS,
-            bitmask=BITMASK_ALARM_F,
-            entity_description=BinarySensorEntityDescription(
-                key="status_alarm_fault",
-                name="Status Alarm Fault",
-                device_class=BinarySensorDeviceClass.PROBLEM,
-            ),
+        StatusFlag.FREE_COOLING,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_alarm_fault",
+            name="Status Alarm Fault",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        StatusFlag.ALARM_F,
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="status_alarm_warning",
+            name="Status Alarm Warning",
+            device_class=BinarySensorDeviceClass.PROBLEM,
         ),
+        StatusFlag.ALARM_W,
+    ),
+)
+
+
+def create_binary_sensors(
+    coordinator: KomfoventCoordinator,
+) -> list[KomfoventBinarySensor]:
+    """Get list of binary sensor entities."""
+    return [
         KomfoventStatusBinarySensor(
             coordinator=coordinator,
             register_id=registers.REG_STATUS,
-            bitmask=BITMASK_ALARM_W,
-            entity_description=BinarySensorEntityDescription(
-                key="status_alarm_warning",
-                name="Status Alarm Warning",
-                device_class=BinarySensorDeviceClass.PROBLEM,
-            ),
-        ),
+            bitmask=bitmask,
+            entity_description=description,
+        )
+        for description, bitmask in STATUS_DESCRIPTIONS
     ]
 
 
@@ -189,7 +159,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Komfovent binary sensor based on a config entry."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(await create_binary_sensors(coordinator))
+    async_add_entities(create_binary_sensors(coordinator))
 
 
 class KomfoventBinarySensor(
@@ -197,6 +167,8 @@ class KomfoventBinarySensor(
 ):
     """Base class for Komfovent binary sensors."""
 
+    __slots__ = ("register_id",)
+
     _attr_has_entity_name = True
     coordinator: KomfoventCoordinator
 
@@ -210,19 +182,17 @@ class KomfoventBinarySensor(
         super().__init__(coordinator)
         self.register_id = register_id
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data:
-            return None
-        value = self.coordinator.data.get(self.register_id)
-        if value is None:
+        if (
+            not (data := self.coordinator.data)
+            or (value := data.get(self.register_id)) is None
+        ):
             return None
         return bool(value)
 
@@ -230,11 +200,13 @@ class KomfoventBinarySensor(
 class KomfoventStatusBinarySensor(KomfoventBinarySensor):
     """Binary sensor for status register bitmask values."""
 
+    __slots__ = ("bitmask",)
+
     def __init__(
         self,
         coordinator: KomfoventCoordinator,
         register_id: int,
-        bitmask: int,
+        bitmask: StatusFlag,
         entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
@@ -244,9 +216,9 @@ class KomfoventStatusBinarySensor(KomfoventBinarySensor):
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data:
-            return None
-        value = self.coordinator.data.get(self.register_id)
-        if value is None:
+        if (
+            not (data := self.coordinator.data)
+            or (value := data.get(self.register_id)) is None
+        ):
             return None
         return bool(value & self.bitmask)
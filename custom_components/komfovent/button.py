@@ -17,7 +17,30 @@ if TYPE_CHECKING:
 
 from . import services
 from .const import DOMAIN
-from .helpers import build_device_info
+
+
+def create_buttons(
+    coordinator: KomfoventCoordinator,
+) -> list[KomfoventButtonEntity]:
+    """Get list of button entities."""
+    return [
+        KomfoventSetTimeButton(
+            coordinator,
+            ButtonEntityDescription(
+                key="set_system_time",
+                name="Set System Time",
+                entity_category=EntityCategory.CONFIG,
+            ),
+        ),
+        KomfoventCleanFiltersButton(
+            coordinator,
+            ButtonEntityDescription(
+                key="clean_filters",
+                name="Clean Filters Calibration",
+                entity_category=EntityCategory.CONFIG,
+            ),
+        ),
+    ]
 
 
 async def async_setup_entry(
@@ -27,27 +50,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Komfovent button from config entry."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-
-    async_add_entities(
-        [
-            KomfoventSetTimeButton(
-                coordinator,
-                ButtonEntityDescription(
-                    key="set_system_time",
-                    name="Set System Time",
-                    entity_category=EntityCategory.CONFIG,
-                ),
-            ),
-            KomfoventCleanFiltersButton(
-                coordinator,
-                ButtonEntityDescription(
-                    key="clean_filters",
-                    name="Clean Filters Calibration",
-                    entity_category=EntityCategory.CONFIG,
-                ),
-            ),
-        ]
-    )
+    async_add_entities(create_buttons(coordinator))
 
 
 class KomfoventButtonEntity(CoordinatorEntity["KomfoventCoordinator"], ButtonEntity):
@@ -64,11 +67,9 @@ class KomfoventButtonEntity(CoordinatorEntity["KomfoventCoordinator"], ButtonEnt
         """Initialize the button."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
 
 class KomfoventSetTimeButton(KomfoventButtonEntity):
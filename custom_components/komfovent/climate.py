@@ -15,17 +15,12 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import registers, services
-from .binary_sensor import (
-    BITMASK_COOLING,
-    BITMASK_FAN,
-    BITMASK_HEATING,
-)
 from .const import (
     DOMAIN,
     OperationMode,
-    TemperatureControl,
+    StatusFlag,
 )
-from .helpers import build_device_info
+from .helpers import option_names
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -38,6 +33,16 @@ _LOGGER = logging.getLogger(__name__)
 
 SETPOINT_MIN_TEMP: Final = 5  # Minimum temperature supported by device (raw value 50)
 SETPOINT_MAX_TEMP: Final = 40  # Maximum temperature supported by device (raw value 400)
+SETPOINT_RAW_MIN: Final = SETPOINT_MIN_TEMP * 10
+SETPOINT_RAW_MAX: Final = SETPOINT_MAX_TEMP * 10
+
+OPERATION_MODE_NAMES: Final[dict[int, str]] = option_names(OperationMode)
+PRESET_MODES: Final[list[str]] = list(OPERATION_MODE_NAMES.values())
+
+
+def create_climate(coordinator: KomfoventCoordinator) -> list[KomfoventClimate]:
+    """Get list of climate entities."""
+    return [KomfoventClimate(coordinator)]
 
 
 async def async_setup_entry(
@@ -47,7 +52,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Komfovent climate device."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([KomfoventClimate(coordinator)])
+    async_add_entities(create_climate(coordinator))
 
 
 class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity):
@@ -60,66 +65,55 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
     _attr_supported_features: ClassVar[int] = (
         ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
     )
-    _attr_preset_modes: ClassVar[list[str]] = [
-        mode.name.lower() for mode in OperationMode
-    ]
+    _attr_preset_modes: ClassVar[list[str]] = PRESET_MODES
     _attr_translation_key = "komfovent_climate"
     coordinator: KomfoventCoordinator
 
     def __init__(self, coordinator: KomfoventCoordinator) -> None:
         """Initialize the climate device."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_climate"
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_unique_id = coordinator.unique_id_prefix + "climate"
+        self._attr_device_info = coordinator.device_info
         self._eco_mode = False
         self._auto_mode = False
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return None
 
-        try:
-            temp_control = TemperatureControl(
-                self.coordinator.data.get(registers.REG_TEMP_CONTROL)
-            )
-            temp_key = TEMP_CONTROL_MAPPING[temp_control]
-
-            if (temp := self.coordinator.data.get(temp_key)) is not None:
-                return float(temp) / 10
-        except (ValueError, KeyError):
+        temp_control = data.get(registers.REG_TEMP_CONTROL)
+        if temp_control is None or not 0 <= temp_control < len(TEMP_CONTROL_MAPPING):
             _LOGGER.warning("Invalid temperature control mode")
+            return None
 
-        return None
+        if (temp := data.get(TEMP_CONTROL_MAPPING[temp_control])) is None:
+            return None
+        return float(temp) / 10
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return None
 
-        try:
-            mode = OperationMode(
-                self.coordinator.data.get(registers.REG_OPERATION_MODE)
-            )
-            temp_reg = MODE_TEMP_MAPPING[mode]
-            if (temp := self.coordinator.data.get(temp_reg)) is not None:
-                return float(temp) / 10
-        except (ValueError, KeyError):
+        mode = data.get(registers.REG_OPERATION_MODE)
+        if mode is None or not 0 <= mode < len(MODE_TEMP_MAPPING):
             _LOGGER.warning("Invalid operation mode or temperature value")
+            return None
 
-        return None
+        if (temp := data.get(MODE_TEMP_MAPPING[mode])) is None:
+            return None
+        return float(temp) / 10
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return hvac operation mode."""
-        if not self.coordinator.data:
-            return None
-
-        power = self.coordinator.data.get(registers.REG_POWER)
-
-        if power is None:
+        if (
+            not (data := self.coordinator.data)
+            or (power := data.get(registers.REG_POWER)) is None
+        ):
             return None
 
         if power:
@@ -129,11 +123,11 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
     @property
     def hvac_action(self) -> HVACAction | None:  # noqa: PLR0911
         """Return the current HVAC action."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return None
 
-        power = self.coordinator.data.get(registers.REG_POWER)
-        status = self.coordinator.data.get(registers.REG_STATUS)
+        power = data.get(registers.REG_POWER)
+        status = data.get(registers.REG_STATUS)
 
         # Return None if either power or status is missing, or if device is off
         if power is None or status is None:
@@ -142,11 +136,11 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
             return HVACAction.OFF
 
         # Check status bits for active operations (priority: heating > cooling > fan)
-        if status & BITMASK_HEATING:
+        if status & StatusFlag.HEATING:
             return HVACAction.HEATING
-        if status & BITMASK_COOLING:
+        if status & StatusFlag.COOLING:
             return HVACAction.COOLING
-        if status & BITMASK_FAN:
+        if status & StatusFlag.FAN:
             return HVACAction.FAN
 
         # Device is on but not actively doing anything
@@ -155,14 +149,12 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        if not self.coordinator.data:
-            return None
-
-        mode = self.coordinator.data.get(registers.REG_OPERATION_MODE)
-        try:
-            return OperationMode(mode).name.lower()
-        except ValueError:
+        if (
+            not (data := self.coordinator.data)
+            or (mode := data.get(registers.REG_OPERATION_MODE)) is None
+        ):
             return None
+        return OPERATION_MODE_NAMES.get(mode)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -170,12 +162,10 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
             return
 
         # Get current mode and its temperature register
-        try:
-            mode = OperationMode(
-                self.coordinator.data.get(registers.REG_OPERATION_MODE)
-            )
+        mode = self.coordinator.data.get(registers.REG_OPERATION_MODE)
+        if mode is not None and 0 <= mode < len(MODE_TEMP_MAPPING):
             reg = MODE_TEMP_MAPPING[mode]
-        except (ValueError, KeyError):
+        else:
             _LOGGER.warning("Invalid operation mode, using normal setpoint")
             reg = registers.REG_NORMAL_SETPOINT
 
@@ -184,8 +174,7 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
         if SETPOINT_MIN_TEMP <= temp <= SETPOINT_MAX_TEMP:
             value = int(temp * 10)
             try:
-                await self.coordinator.client.write(reg, value)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write(reg, value)
             except (ConnectionError, TimeoutError):
                 _LOGGER.exception("Failed to set temperature")
         else:
@@ -194,41 +183,39 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
                 temp,
                 SETPOINT_MIN_TEMP,
                 SETPOINT_MAX_TEMP,
-                SETPOINT_MIN_TEMP * 10,
-                SETPOINT_MAX_TEMP * 10,
+                SETPOINT_RAW_MIN,
+                SETPOINT_RAW_MAX,
             )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.OFF:
-            await self.coordinator.client.write(registers.REG_POWER, 0)
+            await self.coordinator.async_write(registers.REG_POWER, 0)
         else:
-            await self.coordinator.client.write(registers.REG_POWER, 1)
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write(registers.REG_POWER, 1)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         await services.set_operation_mode(self.coordinator, preset_mode)
 
 
-MODE_TEMP_MAPPING = {
-    OperationMode.STANDBY: registers.REG_NORMAL_SETPOINT,  # Use normal temp for standby
-    OperationMode.AWAY: registers.REG_AWAY_TEMP,
-    OperationMode.NORMAL: registers.REG_NORMAL_SETPOINT,
-    OperationMode.INTENSIVE: registers.REG_INTENSIVE_TEMP,
-    OperationMode.BOOST: registers.REG_BOOST_TEMP,
-    OperationMode.KITCHEN: registers.REG_KITCHEN_TEMP,
-    OperationMode.FIREPLACE: registers.REG_FIREPLACE_TEMP,
-    OperationMode.OVERRIDE: registers.REG_OVERRIDE_TEMP,
-    OperationMode.HOLIDAY: registers.REG_HOLIDAYS_TEMP,
-    OperationMode.AIR_QUALITY: registers.REG_AQ_TEMP_SETPOINT,
-    OperationMode.OFF: registers.REG_NORMAL_SETPOINT,  # Use normal temp when off
-}
-TEMP_CONTROL_MAPPING = {
-    TemperatureControl.SUPPLY: registers.REG_SUPPLY_TEMP,
-    TemperatureControl.EXTRACT: registers.REG_EXTRACT_TEMP,
-    # Using panel1 temp for room temperature
-    TemperatureControl.ROOM: registers.REG_PANEL1_TEMP,
-    # Using extract temp for balance mode
-    TemperatureControl.BALANCE: registers.REG_EXTRACT_TEMP,
-}
+# Indexed by raw register value, in enum order
+MODE_TEMP_MAPPING: Final[tuple[int, ...]] = (
+    registers.REG_NORMAL_SETPOINT,  # STANDBY: use normal temp for standby
+    registers.REG_AWAY_TEMP,  # AWAY
+    registers.REG_NORMAL_SETPOINT,  # NORMAL
+    registers.REG_INTENSIVE_TEMP,  # INTENSIVE
+    registers.REG_BOOST_TEMP,  # BOOST
+    registers.REG_KITCHEN_TEMP,  # KITCHEN
+    registers.REG_FIREPLACE_TEMP,  # FIREPLACE
+    registers.REG_OVERRIDE_TEMP,  # OVERRIDE
+    registers.REG_HOLIDAYS_TEMP,  # HOLIDAY
+    registers.REG_AQ_TEMP_SETPOINT,  # AIR_QUALITY
+    registers.REG_NORMAL_SETPOINT,  # OFF: use normal temp when off
+)
+TEMP_CONTROL_MAPPING: Final[tuple[int, ...]] = (
+    registers.REG_SUPPLY_TEMP,  # SUPPLY
+    registers.REG_EXTRACT_TEMP,  # EXTRACT
+    registers.REG_PANEL1_TEMP,  # ROOM: using panel1 temp for room temperature
+    registers.REG_EXTRACT_TEMP,  # BALANCE: using extract temp for balance mode
+)
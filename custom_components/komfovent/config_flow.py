@@ -1,6 +1,6 @@
 """Config flow for Komfovent integration."""
 
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.config_entries import (
@@ -33,43 +33,48 @@ from .const import (
     OPT_UPDATE_INTERVAL,
 )
 
-CONFIG_SCHEMA = vol.Schema(
+CONFIG_SCHEMA: Final = vol.Schema(
     {
         vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
     }
 )
-OPTIONS_SCHEMA = vol.Schema(
+
+UPDATE_INTERVAL_SELECTOR: Final = NumberSelector(
+    NumberSelectorConfig(
+        min=10,
+        max=300,
+        step=5,
+        mode=NumberSelectorMode.SLIDER,
+        unit_of_measurement="seconds",
+    )
+)
+EMA_TIME_CONSTANT_SELECTOR: Final = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=900,
+        step=30,
+        mode=NumberSelectorMode.SLIDER,
+        unit_of_measurement="seconds",
+    )
+)
+STEP_VALIDATOR: Final = vol.Coerce(float)
+
+OPTIONS_SCHEMA: Final = vol.Schema(
     {
         vol.Optional(
             OPT_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=10,
-                max=300,
-                step=5,
-                mode=NumberSelectorMode.SLIDER,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): UPDATE_INTERVAL_SELECTOR,
         vol.Optional(
             OPT_EMA_TIME_CONSTANT, default=DEFAULT_EMA_TIME_CONSTANT
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=0,
-                max=900,
-                step=30,
-                mode=NumberSelectorMode.SLIDER,
-                unit_of_measurement="seconds",
-            )
-        ),
-        vol.Optional(OPT_STEP_FLOW): vol.Coerce(float),
-        vol.Optional(OPT_STEP_TEMPERATURE): vol.Coerce(float),
-        vol.Optional(OPT_STEP_HUMIDITY): vol.Coerce(float),
-        vol.Optional(OPT_STEP_CO2): vol.Coerce(float),
-        vol.Optional(OPT_STEP_VOC): vol.Coerce(float),
-        vol.Optional(OPT_STEP_TIMER): vol.Coerce(float),
+        ): EMA_TIME_CONSTANT_SELECTOR,
+        vol.Optional(OPT_STEP_FLOW): STEP_VALIDATOR,
+        vol.Optional(OPT_STEP_TEMPERATURE): STEP_VALIDATOR,
+        vol.Optional(OPT_STEP_HUMIDITY): STEP_VALIDATOR,
+        vol.Optional(OPT_STEP_CO2): STEP_VALIDATOR,
+        vol.Optional(OPT_STEP_VOC): STEP_VALIDATOR,
+        vol.Optional(OPT_STEP_TIMER): STEP_VALIDATOR,
     }
 )
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 from typing import Final
 
 DOMAIN = "komfovent"
@@ -33,6 +33,15 @@ DEFAULT_STEP_CO2: Final = 25.0
 DEFAULT_STEP_VOC: Final = 5.0
 DEFAULT_STEP_TIMER: Final = 5.0
 
+# Firmware versions only change on a device update, re-read them hourly (seconds)
+FIRMWARE_CACHE_TTL: Final = 3600
+
+# Mode and eco/AQ settings rarely change outside of our own writes (seconds)
+SETTINGS_CACHE_TTL: Final = 60
+
+# Modbus block read planning
+MODBUS_MAX_READ_COUNT: Final = 125  # Registers per read request (protocol limit)
+
 
 class Controller(IntEnum):
     """Controllers."""
@@ -43,6 +52,9 @@ class Controller(IntEnum):
     NA = 15
 
 
+C6_CONTROLLERS: Final = frozenset({Controller.C6, Controller.C6M})
+
+
 class OperationMode(IntEnum):
     """Operation modes."""
 
@@ -59,6 +71,24 @@ class OperationMode(IntEnum):
     OFF = 10
 
 
+class StatusFlag(IntFlag):
+    """Unit status bitmask flags."""
+
+    STARTING = 1 << 0
+    STOPPING = 1 << 1
+    FAN = 1 << 2
+    ROTOR = 1 << 3
+    HEATING = 1 << 4
+    COOLING = 1 << 5
+    HEATING_DENIED = 1 << 6
+    COOLING_DENIED = 1 << 7
+    FLOW_DOWN = 1 << 8
+    FREE_HEATING = 1 << 9
+    FREE_COOLING = 1 << 10
+    ALARM_F = 1 << 11
+    ALARM_W = 1 << 12
+
+
 class SchedulerMode(IntEnum):
     """Scheduler operation modes."""
 
@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -18,25 +19,44 @@ from pymodbus.exceptions import ModbusException
 
 from . import registers
 from .const import (
+    C6_CONTROLLERS,
     DEFAULT_EMA_TIME_CONSTANT,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    FIRMWARE_CACHE_TTL,
+    SETTINGS_CACHE_TTL,
     ConnectedPanels,
     Controller,
 )
 from .core.ema import apply_ema
-from .helpers import get_version_from_int
-from .modbus import KomfoventModbusClient
+from .helpers import build_device_info, get_version_from_int
+from .modbus import KomfoventModbusClient, plan_reads
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
 FUNC_VER_AQ_HUMIDITY = 38
 FUNC_VER_EXHAUST_TEMP = 67
 
+# Firmware version ranges to read for each panel topology. The controller and
+# adjacent panel versions are merged into a single request
+FIRMWARE_RANGES: Final[dict[int, tuple[tuple[int, int], ...]]] = {
+    ConnectedPanels.NONE: ((registers.REG_FIRMWARE, 2),),
+    ConnectedPanels.PANEL1: ((registers.REG_FIRMWARE, 2), (registers.REG_PANEL1_FW, 2)),
+    ConnectedPanels.PANEL2: ((registers.REG_FIRMWARE, 2), (registers.REG_PANEL2_FW, 2)),
+    ConnectedPanels.BOTH: (
+        (registers.REG_FIRMWARE, 2),
+        (registers.REG_PANEL1_FW, 2),
+        (registers.REG_PANEL2_FW, 2),
+    ),
+}
+
 
 class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
     """Class to manage fetching Komfovent data."""
@@ -47,6 +67,12 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
     client: KomfoventModbusClient
     ema_time_constant: int
     _cooldown_until: datetime | None = None
+    _firmware_expires: datetime | None = None
+    _firmware_panels: int = ConnectedPanels.NONE
+    _read_plan: list[tuple[int, int]]
+    _settings_plan: list[tuple[int, int]]
+    _settings_expires: datetime | None = None
+    _optional_plan: list[tuple[str, int, int, int]]
 
     def __init__(
         self,
@@ -59,6 +85,8 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
         """Initialize."""
         kwargs.setdefault("name", DOMAIN)
         kwargs.setdefault("update_interval", timedelta(seconds=DEFAULT_UPDATE_INTERVAL))
+        # Only notify entities when the polled register values actually changed
+        kwargs.setdefault("always_update", False)
 
         super().__init__(hass, _LOGGER, config_entry=config_entry, **kwargs)
 
@@ -67,6 +95,67 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
             port=config_entry.data[CONF_PORT],
         )
         self.ema_time_constant = ema_time_constant
+        self._firmware_cache: dict[int, int] = {}
+        self._settings_cache: dict[int, int] = {}
+        self._build_read_plan()
+
+    def _build_read_plan(self) -> None:
+        """Build the block reads for the detected controller and panels."""
+        legacy_aq = (
+            self.controller in C6_CONTROLLERS
+            and self.func_version < FUNC_VER_AQ_HUMIDITY
+        )
+        self._read_plan = [
+            # Read primary control (1-34)
+            (registers.REG_POWER, 34),
+            # Read connectivity, extra control (35-44)
+            # This has not been tested yet, it may be implemented in the future
+            # Skip scheduler (300-555)
+            # Read active alarms (600-610)
+            (registers.REG_ACTIVE_ALARMS_COUNT, 11),
+            # Skip alarm history (611-861)
+            # Read monitoring (900-957)
+            (registers.REG_STATUS, 56 if legacy_aq else 58),
+        ]
+        # Settings are re-read every SETTINGS_CACHE_TTL seconds or after a write
+        self._settings_plan = [
+            # Read modes (100-158)
+            (registers.REG_AWAY_FAN_SUPPLY, 59),
+            # Read humidity setpoints (159-162)
+            # This has not been tested yet, it may be implemented in the future
+            # Read Eco and air quality (200-217)
+            (registers.REG_ECO_MIN_TEMP, 15 if legacy_aq else 18),
+        ]
+        # Optional reads as (description, log level, register, count)
+        self._optional_plan = []
+        if (
+            self.controller in C6_CONTROLLERS
+            and self.func_version >= FUNC_VER_EXHAUST_TEMP
+        ):
+            # Read exhaust temperature (961)
+            self._optional_plan.append(
+                ("exhaust temperature", logging.DEBUG, registers.REG_EXHAUST_TEMP, 1)
+            )
+
+    @property
+    def read_plan(self) -> list[tuple[int, int]]:
+        """Return the register ranges read on every poll."""
+        return self._read_plan
+
+    @property
+    def settings_plan(self) -> list[tuple[int, int]]:
+        """Return the settings ranges read every SETTINGS_CACHE_TTL seconds."""
+        return self._settings_plan
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared by all entities of this coordinator."""
+        return build_device_info(self)
+
+    @cached_property
+    def unique_id_prefix(self) -> str:
+        """Return the unique ID prefix shared by all entities of this coordinator."""
+        return f"{self.config_entry.entry_id}_"
 
     def set_cooldown(self, seconds: float) -> None:
         """Set a cooldown period before the next update can proceed."""
@@ -99,100 +188,180 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
             _LOGGER.warning("%s: %s", error_msg, error)
             raise ConfigEntryNotReady(error_msg) from error
 
+        self._build_read_plan()
+
         return True
 
+    async def async_write(self, register: int, value: int) -> None:
+        """
+        Write a register, publish the value and read the device state back.
+
+        The written value is shown right away, then a debounced refresh picks up
+        what the controller actually applied, e.g. a clamped setpoint or the
+        registers that follow a mode change.
+
+        """
+        await self.client.write(register, value)
+
+        if self.data is not None:
+            self.async_set_updated_data({**self.data, register: value})
+        await self.async_request_refresh()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that also re-reads the cached settings."""
+        self._settings_expires = None
+        await super().async_request_refresh()
+
     async def _async_update_data(self) -> dict[int, Any]:
         """Fetch data from Komfovent."""
         await self._wait_for_cooldown()
 
-        data = {}
-
         try:
-            # Read primary control (1-34)
-            data.update(await self.client.read(registers.REG_POWER, 34))
+            # Blocks are read concurrently, use the returned dict directly instead
+            # of copying it into a new one
+            data = await self._async_read_blocks()
 
-            # Read connectivity, extra control (35-44)
+            # Read digital outputs (958-960)
             # This has not been tested yet, it may be implemented in the future
 
-            # Read modes (100-158)
-            data.update(await self.client.read(registers.REG_AWAY_FAN_SUPPLY, 59))
+            # Read controller and connected panel firmware versions (1000-1005)
+            optional_reads = {
+                "firmware versions": (
+                    logging.WARNING,
+                    self._async_read_firmware_versions(
+                        data.get(registers.REG_CONNECTED_PANELS, ConnectedPanels.NONE)
+                    ),
+                ),
+                **{
+                    name: (level, self.client.read(register, count))
+                    for name, level, register, count in self._optional_plan
+                },
+            }
+            data.update(await self._async_read_optional(optional_reads))
 
-            # Read humidity setpoints (159-162)
-            # This has not been tested yet, it may be implemented in the future
+        except (ConnectionError, ModbusException) as error:
+            self._firmware_expires = None
+            self._settings_expires = None
+            _LOGGER.warning("Error communicating with Komfovent: %s", error)
+            raise UpdateFailed from error
 
-            # Read Eco and air quality (200-217)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version < FUNC_VER_AQ_HUMIDITY
-            ):
-                data.update(await self.client.read(registers.REG_ECO_MIN_TEMP, 15))
-            else:
-                data.update(await self.client.read(registers.REG_ECO_MIN_TEMP, 18))
+        self._apply_ema_on_update_data(data)
+        return data
 
-            # Skip scheduler (300-555)
+    async def _async_read_blocks(self) -> dict[int, int]:
+        """
+        Read the monitoring blocks, and the settings blocks when they are due.
+
+        Settings are cached for SETTINGS_CACHE_TTL seconds, until a refresh is
+        requested after a write, or until communication with the device fails.
+
+        Returns:
+            Dictionary of register values
+
+        """
+        if self._settings_expires is not None and utcnow() < self._settings_expires:
+            data = await self.client.read_blocks(self._read_plan)
+            data.update(self._settings_cache)
+            return data
+
+        self._settings_expires = None
+        data = await self.client.read_blocks(self._read_plan + self._settings_plan)
+        self._settings_cache = {
+            reg: data[reg]
+            for start, count in self._settings_plan
+            for reg in range(start, start + count)
+            if reg in data
+        }
+        self._settings_expires = utcnow() + timedelta(seconds=SETTINGS_CACHE_TTL)
+        return data
 
-            # Read active alarms (600-610)
-            data.update(await self.client.read(registers.REG_ACTIVE_ALARMS_COUNT, 11))
+    async def _async_read_optional(
+        self, reads: dict[str, tuple[int, Awaitable[dict[int, int]]]]
+    ) -> dict[int, int]:
+        """
+        Run optional register reads concurrently.
 
-            # Skip alarm history (611-861)
+        A failing read is logged and skipped, so it does not fail the update and
+        the other reads still contribute their registers.
 
-            # Read monitoring (900-957)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version < FUNC_VER_AQ_HUMIDITY
-            ):
-                data.update(await self.client.read(registers.REG_STATUS, 56))
+        Args:
+            reads: Pending reads keyed by description, with the log level to
+                report their communication errors at
+
+        Returns:
+            Dictionary of registers from all successful reads
+
+        """
+        results = await asyncio.gather(
+            *(read for _level, read in reads.values()), return_exceptions=True
+        )
+
+        data = {}
+        for (name, (level, _read)), result in zip(reads.items(), results, strict=True):
+            if isinstance(result, (ConnectionError, ModbusException)):
+                _LOGGER.log(level, "Failed to read %s: %s", name, result)
+            elif isinstance(result, BaseException):
+                raise result
             else:
-                data.update(await self.client.read(registers.REG_STATUS, 58))
+                data.update(result)
+        return data
 
-            # Read digital outputs (958-960)
-            # This has not been tested yet, it may be implemented in the future
+    async def _async_read_firmware_versions(
+        self, connected_panels: int
+    ) -> dict[int, int]:
+        """
+        Return controller and connected panel firmware versions.
 
-            # Read exhaust temperature (961)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version >= FUNC_VER_EXHAUST_TEMP
-            ):
-                try:
-                    data.update(await self.client.read(registers.REG_EXHAUST_TEMP, 1))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.debug("Failed to read exhaust temperature: %s", error)
-
-            # Read controller firmware version (1000-1001)
-            try:
-                data.update(await self.client.read(registers.REG_FIRMWARE, 2))
-            except (ConnectionError, ModbusException) as error:
-                _LOGGER.warning("Failed to read controller firmware version: %s", error)
-
-            # Read panel 1 firmware version (1002-1003)
-            if data.get(registers.REG_CONNECTED_PANELS, 0) in [
-                ConnectedPanels.PANEL1,
-                ConnectedPanels.BOTH,
-            ]:
-                try:
-                    data.update(await self.client.read(registers.REG_PANEL1_FW, 2))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.warning(
-                        "Failed to read panel 1 firmware version: %s", error
-                    )
-
-            # Read panel 2 firmware version (1004-1005)
-            if data.get(registers.REG_CONNECTED_PANELS, 0) in [
-                ConnectedPanels.PANEL2,
-                ConnectedPanels.BOTH,
-            ]:
-                try:
-                    data.update(await self.client.read(registers.REG_PANEL2_FW, 2))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.warning(
-                        "Failed to read panel 2 firmware version: %s", error
-                    )
+        Adjacent versions are read in a single block request and cached for
+        FIRMWARE_CACHE_TTL seconds, until the connected panels change, or until
+        communication with the device fails. If a merged block is rejected, each
+        version is read on its own so one failing panel does not hide the others.
 
-        except (ConnectionError, ModbusException) as error:
-            _LOGGER.warning("Error communicating with Komfovent: %s", error)
-            raise UpdateFailed from error
+        Args:
+            connected_panels: Connected panels from the latest poll
 
-        self._apply_ema_on_update_data(data)
+        Returns:
+            Dictionary of firmware version registers
+
+        """
+        if (
+            self._firmware_expires is not None
+            and utcnow() < self._firmware_expires
+            and self._firmware_panels == connected_panels
+        ):
+            return self._firmware_cache
+
+        self._firmware_expires = None
+        ranges = FIRMWARE_RANGES.get(
+            connected_panels, FIRMWARE_RANGES[ConnectedPanels.NONE]
+        )
+        try:
+            data = {}
+            for start, count in plan_reads(ranges):
+                data.update(await self.client.read(start, count))
+        except ModbusException as error:
+            if len(ranges) == 1:
+                raise
+            _LOGGER.debug("Reading firmware versions separately: %s", error)
+            return await self._async_read_firmware_ranges(ranges)
+
+        self._firmware_cache = data
+        self._firmware_panels = connected_panels
+        self._firmware_expires = utcnow() + timedelta(seconds=FIRMWARE_CACHE_TTL)
+        return data
+
+    async def _async_read_firmware_ranges(
+        self, ranges: tuple[tuple[int, int], ...]
+    ) -> dict[int, int]:
+        """Read each firmware version separately, skipping the ones that fail."""
+        data = {}
+        for start, count in ranges:
+            try:
+                data.update(await self.client.read(start, count))
+            except ModbusException as error:
+                _LOGGER.warning(
+                    "Failed to read firmware version at %d: %s", start, error
+                )
         return data
 
     def _apply_ema_on_update_data(self, data: dict[int, Any]) -> None:
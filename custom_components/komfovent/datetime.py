@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import zoneinfo
-from datetime import datetime, timedelta
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from homeassistant.components.datetime import DateTimeEntity, DateTimeEntityDescription
@@ -19,7 +18,7 @@ if TYPE_CHECKING:
 
 from . import registers
 from .const import DOMAIN
-from .helpers import build_device_info
+from .helpers import get_local_epoch
 
 
 async def async_setup_entry(
@@ -61,6 +60,8 @@ async def async_setup_entry(
 class KomfoventDateTime(CoordinatorEntity["KomfoventCoordinator"], DateTimeEntity):
     """Representation of a Komfovent datetime entity."""
 
+    __slots__ = ("register_id",)
+
     _attr_has_entity_name = True
     coordinator: KomfoventCoordinator
 
@@ -74,45 +75,40 @@ class KomfoventDateTime(CoordinatorEntity["KomfoventCoordinator"], DateTimeEntit
         super().__init__(coordinator)
         self.register_id = register_id
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> datetime | None:
         """Return the datetime value."""
-        if not self.coordinator.data:
-            return None
-
-        value = self.coordinator.data.get(self.register_id)
-        if value is None:
+        if (
+            not (data := self.coordinator.data)
+            or (value := data.get(self.register_id)) is None
+        ):
             return None
 
         try:
-            # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-            local_tz = zoneinfo.ZoneInfo(str(self.coordinator.hass.config.time_zone))
-            local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
-
-            # Convert seconds since local epoch to datetime
-            return local_epoch + timedelta(seconds=value)
-        except (ValueError, TypeError, OSError):
+            local_tz = get_local_epoch(
+                str(self.coordinator.hass.config.time_zone)
+            ).tzinfo
+
+            # Seconds since local epoch count wall-clock time, so convert them as UTC
+            # and attach the local timezone
+            return datetime.fromtimestamp(value, tz=UTC).replace(tzinfo=local_tz)
+        except (ValueError, TypeError, OSError, OverflowError):
             return None
 
     async def async_set_value(self, value: datetime) -> None:
         """Update the datetime value."""
-        # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-        local_tz = zoneinfo.ZoneInfo(str(self.coordinator.hass.config.time_zone))
-        local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
+        local_epoch = get_local_epoch(str(self.coordinator.hass.config.time_zone))
 
         if not value.tzinfo:
             # If datetime has no timezone, assume local timezone
-            value = value.replace(tzinfo=local_tz)
+            value = value.replace(tzinfo=local_epoch.tzinfo)
 
         # Calculate seconds since local epoch
         seconds = int((value - local_epoch).total_seconds())
 
         # Write value to register
-        await self.coordinator.client.write(self.register_id, seconds)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.register_id, seconds)
@@ -9,10 +9,12 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from pymodbus import ModbusException
 from pymodbus.client import AsyncModbusTcpClient
 
-from .const import DOMAIN
+from .const import DOMAIN, SETTINGS_CACHE_TTL
 from .registers import REGISTERS_32BIT_UNSIGNED
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from pymodbus.pdu import ModbusPDU
@@ -76,6 +78,20 @@ def _check_response(response: ModbusPDU) -> None:
         raise ModbusException(ERR_READ_FAILED)
 
 
+def describe_read_plan(ranges: Iterable[tuple[int, int]]) -> list[dict[str, Any]]:
+    """
+    Describe the block reads issued for the given register ranges.
+
+    Args:
+        ranges: Tuples of (first register, register count) read together
+
+    Returns:
+        One entry per block request with its start and count
+
+    """
+    return [{"start": start, "count": count} for start, count in ranges]
+
+
 async def dump_registers(host: str, port: int) -> dict[int, list[int]]:
     """
     Query all holding registers one by one and return values as dictionary.
@@ -165,4 +181,15 @@ async def async_get_config_entry_diagnostics(
         "config_entry": entry.as_dict(),
         "registers": registers,
         "coordinator_data": coordinator.data,
+        "read_plan": {
+            "poll": {
+                "interval": coordinator.update_interval.total_seconds(),
+                "blocks": describe_read_plan(coordinator.read_plan),
+            },
+            # Read together with the poll ranges once the cache expires or after a write
+            "settings": {
+                "interval": SETTINGS_CACHE_TTL,
+                "blocks": describe_read_plan(coordinator.settings_plan),
+            },
+        },
     }
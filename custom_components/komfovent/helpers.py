@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import zoneinfo
+from datetime import datetime
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Final
 
-from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_HOST, PERCENTAGE, UnitOfVolumeFlowRate
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, Controller
+from . import registers
+from .const import C6_CONTROLLERS, DOMAIN, Controller, FlowControl, FlowUnit
 
 if TYPE_CHECKING:
+    from enum import IntEnum
+
     from .coordinator import KomfoventCoordinator
 
+FLOW_UNIT_MAPPING: Final[dict[int, str]] = {
+    FlowUnit.M3H: UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+    FlowUnit.LS: UnitOfVolumeFlowRate.LITERS_PER_SECOND,
+}
+
 
 def build_device_info(coordinator: KomfoventCoordinator) -> DeviceInfo:
     """
@@ -43,6 +54,73 @@ def build_device_info(coordinator: KomfoventCoordinator) -> DeviceInfo:
     )
 
 
+def get_flow_unit(coordinator: KomfoventCoordinator) -> str | None:
+    """
+    Return the unit of measurement of flow values for the current settings.
+
+    Args:
+        coordinator: The Komfovent coordinator instance
+
+    Returns:
+        Percentage without flow control or on C8, otherwise the configured flow
+        unit. None when the data or flow unit is not available.
+
+    """
+    data = coordinator.data
+    if not data:
+        return None
+
+    if coordinator.controller in C6_CONTROLLERS:
+        if data.get(registers.REG_FLOW_CONTROL) == FlowControl.OFF:
+            return PERCENTAGE
+        flow_unit = data.get(registers.REG_FLOW_UNIT)
+        return None if flow_unit is None else FLOW_UNIT_MAPPING.get(flow_unit)
+
+    if coordinator.controller is Controller.C8:
+        # no flow control or flow unit support
+        return PERCENTAGE
+
+    return None
+
+
+@cache
+def option_names(enum_class: type[IntEnum]) -> dict[int, str]:
+    """
+    Return the lowercase member name for each value of an enum.
+
+    Select options and enum-valued sensor states use these names. The table is
+    built once per enum, so lookups on state reads are a single dict hit.
+
+    Args:
+        enum_class: Register value enum
+
+    Returns:
+        Mapping of enum value to lowercase member name
+
+    """
+    return {mode.value: mode.name.lower() for mode in enum_class}
+
+
+@lru_cache(maxsize=4)
+def get_local_epoch(time_zone: str) -> datetime:
+    """
+    Return the controller epoch (1970-01-01 00:00:00) in the given time zone.
+
+    The controller counts time in seconds since the local epoch. The result is
+    cached by time zone name, so a changed Home Assistant time zone simply
+    resolves to a new entry.
+
+    Args:
+        time_zone: IANA time zone name
+
+    Returns:
+        Timezone-aware datetime of the local epoch
+
+    """
+    return datetime(1970, 1, 1, tzinfo=zoneinfo.ZoneInfo(time_zone))
+
+
+@lru_cache(maxsize=8)
 def get_version_from_int(value: int) -> tuple[Controller, int, int, int, int]:
     """
     Convert integer version to component numbers.
@@ -1,23 +1,188 @@
 """Modbus communication handler for Komfovent."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
+import struct
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 from pymodbus import ModbusException
 from pymodbus.client import AsyncModbusTcpClient
 
+from .const import (
+    MODBUS_MAX_READ_COUNT,
+)
 from .registers import (
+    KIND_16BIT_SIGNED,
+    KIND_16BIT_UNSIGNED,
+    KIND_32BIT_UNSIGNED,
+    REGISTER_KIND,
     REGISTERS_16BIT_SIGNED,
     REGISTERS_16BIT_UNSIGNED,
     REGISTERS_32BIT_UNSIGNED,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def plan_reads(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merge adjacent register ranges into as few block read requests as possible.
+
+    Only ranges that touch or overlap are merged, so no register outside the
+    requested ranges is ever read, and a merged block still fits into a single
+    read request.
+
+    Args:
+        ranges: Tuples of (first register, register count) to read
+
+    Returns:
+        Tuples of (first register, register count) sorted by register
+
+    """
+    planned: list[tuple[int, int]] = []
+    for start, count in sorted(ranges):
+        if planned:
+            prev_start, prev_count = planned[-1]
+            end = max(prev_start + prev_count, start + count)
+            if (
+                start <= prev_start + prev_count
+                and end - prev_start <= MODBUS_MAX_READ_COUNT
+            ):
+                planned[-1] = (prev_start, end - prev_start)
+                continue
+        planned.append((start, count))
+    return planned
+
+
+def _uint16(value: int) -> int:
+    """Return a 16-bit unsigned value as-is."""
+    return value
+
+
+def _to_uint16(value: int) -> int:
+    """Convert a signed value to 16-bit unsigned for Modbus."""
+    return value & 0xFFFF
+
+
+# Value conversions for writes keyed by register number, built once at import.
+# 32-bit registers are not listed, they are split into two words.
+ENCODERS_16BIT: Final[dict[int, Callable[[int], int]]] = {
+    **dict.fromkeys(REGISTERS_16BIT_UNSIGNED, _uint16),
+    **dict.fromkeys(REGISTERS_16BIT_SIGNED, _to_uint16),
+}
+
+
+@lru_cache(maxsize=64)
+def block_layout(
+    register: int, count: int
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Return the offsets of each register type within a block of registers.
+
+    The layout only depends on the register map, so it is computed once per
+    block and reused for every poll.
+
+    Args:
+        register: First register of the block
+        count: Number of registers in the block
+
+    Returns:
+        Offsets of 16-bit unsigned, 16-bit signed and 32-bit unsigned registers
+
+    Raises:
+        ValueError: If the block ends in the middle of a 32-bit register
+        NotImplementedError: If the block contains a register of unknown type
+
+    """
+    unsigned = []
+    signed = []
+    wide = []
+    not_converted = set()
+    offsets = iter(range(count))
+
+    for offset in offsets:
+        reg = register + offset
+        kind = REGISTER_KIND.get(reg)
+        if kind == KIND_16BIT_UNSIGNED:
+            unsigned.append(offset)
+        elif kind == KIND_16BIT_SIGNED:
+            signed.append(offset)
+        elif kind == KIND_32BIT_UNSIGNED:
+            # For 32-bit registers, combine with next register
+            if next(offsets, None) is None:
+                msg = f"Register {reg + 1} value not retrieved"
+                raise ValueError(msg)
+            wide.append(offset)
+        else:
+            not_converted.add(reg)
+
+    if not_converted:
+        msg = (
+            f"Registers {not_converted} not found in either "
+            "16-bit or 32-bit register sets"
+        )
+        raise NotImplementedError(msg)
+
+    return tuple(unsigned), tuple(signed), tuple(wide)
+
+
+@lru_cache(maxsize=64)
+def block_decoder(
+    register: int, count: int
+) -> tuple[tuple[int, ...], struct.Struct | None, struct.Struct | None]:
+    """
+    Return a compiled decoder for a block of registers.
+
+    The raw words are packed big-endian and unpacked again with a format that
+    reads each register as uint16, int16 or uint32, so a whole block is decoded
+    by two C-level calls.
+
+    Args:
+        register: First register of the block
+        count: Number of registers in the block
+
+    Returns:
+        Registers in decoding order, the raw word packer and the value unpacker.
+        Packer and unpacker are None for blocks of only 16-bit unsigned values.
+
+    """
+    unsigned, signed, wide = block_layout(register, count)
+    codes = {
+        **dict.fromkeys(unsigned, "H"),
+        **dict.fromkeys(signed, "h"),
+        **dict.fromkeys(wide, "I"),
+    }
+    offsets = sorted(codes)
+    keys = tuple(register + offset for offset in offsets)
+    if not signed and not wide:
+        # Raw words already are the values
+        return keys, None, None
+    return (
+        keys,
+        struct.Struct(f">{count}H"),
+        struct.Struct(">" + "".join(codes[offset] for offset in offsets)),
+    )
+
+
+def decode_registers(register: int, values: list[int]) -> dict[int, int]:
+    """Convert raw register values into a dict keyed by absolute register numbers."""
+    keys, packer, unpacker = block_decoder(register, len(values))
+    if unpacker is None:
+        return dict(zip(keys, values, strict=True))
+    return dict(zip(keys, unpacker.unpack(packer.pack(*values)), strict=True))
+
+
 class KomfoventModbusClient:
     """Modbus client for Komfovent devices."""
 
+    __slots__ = ("_last_ranges", "_reconnect", "client")
+
     def __init__(self, host: str, port: int = 502) -> None:
         """Initialize the Modbus client."""
         self.client = AsyncModbusTcpClient(
@@ -28,7 +193,10 @@ class KomfoventModbusClient:
             reconnect_delay=5,
             reconnect_delay_max=60,
         )
-        self._lock = asyncio.Lock()
+        # Raw words and decoded values of each range from the last block read
+        self._last_ranges: dict[tuple[int, int], tuple[list[int], dict[int, int]]] = {}
+        # In-flight connect, awaited by every request that finds the link down
+        self._reconnect: asyncio.Task[bool] | None = None
 
     async def connect(self) -> bool:
         """Connect to the Modbus device."""
@@ -36,76 +204,103 @@ class KomfoventModbusClient:
 
     async def close(self) -> None:
         """Close the Modbus connection."""
+        if self._reconnect is not None:
+            self._reconnect.cancel()
         self.client.close()
 
-    async def read(self, register: int, count: int) -> dict[int, int]:
-        """Read holding registers and return dict keyed by absolute register numbers."""
-        async with self._lock:
-            result = await self.client.read_holding_registers(
-                address=register - 1, count=count
-            )
+    async def _ensure_connected(self) -> None:
+        """Connect if the link is down and pymodbus is not already reconnecting."""
+        if self.client.connected:
+            return
+
+        # pymodbus owns reconnecting after a dropped connection, so fail fast
+        # instead of opening a second transport next to its reconnect task
+        if self.client.ctx.reconnect_task is None:
+            if self._reconnect is None:
+                self._reconnect = asyncio.create_task(self.client.connect())
+                self._reconnect.add_done_callback(self._reconnect_done)
+
+            # Shielded so a cancelled request does not abort the attempt for others
+            if await asyncio.shield(self._reconnect):
+                return
+
+        msg = "Not connected to Komfovent device"
+        raise ConnectionError(msg)
+
+    def _reconnect_done(self, _task: asyncio.Task[bool]) -> None:
+        """Let the next request start a fresh attempt."""
+        self._reconnect = None
+
+    async def _read_raw(self, register: int, count: int) -> list[int]:
+        """Read holding registers and return the raw register values."""
+        await self._ensure_connected()
+        result = await self.client.read_holding_registers(
+            address=register - 1, count=count
+        )
 
         if result.isError():
             msg = f"Error reading registers at {register}"
             raise ModbusException(msg)
 
-        # Create dictionary with absolute register numbers as keys
-        block = dict(enumerate(result.registers, start=register))
-        converted = set()
-        data = {}
+        return result.registers
 
-        for reg, value in block.items():
-            if reg in REGISTERS_16BIT_UNSIGNED:
-                # For 16-bit unsigned registers, use value directly
-                converted.add(reg)
-                data[reg] = value
-            elif reg in REGISTERS_16BIT_SIGNED:
-                # For 16-bit signed registers, use need to convert uint16 to int16
-                converted.add(reg)
-                data[reg] = value - (value >> 15 << 16)
-            elif reg in REGISTERS_32BIT_UNSIGNED:
-                # For 32-bit registers, combine with next register
-                if reg + 1 not in block:
-                    msg = f"Register {reg + 1} value not retrieved"
-                    raise ValueError(msg)
-                converted.add(reg)
-                converted.add(reg + 1)
-                data[reg] = (value << 16) + block[reg + 1]
-
-        if not_converted := set(block.keys()) - converted:
-            msg = (
-                f"Registers {not_converted} not found in either "
-                "16-bit or 32-bit register sets"
-            )
-            raise NotImplementedError(msg)
+    async def read(self, register: int, count: int) -> dict[int, int]:
+        """Read holding registers and return dict keyed by absolute register numbers."""
+        return decode_registers(register, await self._read_raw(register, count))
 
+    async def read_blocks(self, ranges: Iterable[tuple[int, int]]) -> dict[int, int]:
+        """
+        Read several register ranges with one request per range.
+
+        The requests are issued concurrently. Ranges whose raw words did not
+        change since the previous read reuse their decoded values.
+
+        Args:
+            ranges: Tuples of (first register, register count) to read
+
+        Returns:
+            Dictionary of converted values keyed by absolute register numbers
+
+        """
+        ranges = tuple(ranges)
+        results = await asyncio.gather(
+            *(self._read_raw(start, count) for start, count in ranges)
+        )
+
+        data = {}
+        for (start, count), values in zip(ranges, results, strict=True):
+            previous = self._last_ranges.get((start, count))
+            if previous is not None and previous[0] == values:
+                # Unchanged raw words decode to the same values
+                decoded = previous[1]
+            else:
+                decoded = decode_registers(start, values)
+                self._last_ranges[start, count] = (values, decoded)
+            data.update(decoded)
         return data
 
     async def write(self, register: int, value: int) -> None:
         """Write to holding register."""
-        async with self._lock:
-            if register in REGISTERS_16BIT_UNSIGNED:
-                # Write unsigned value as-is
-                result = await self.client.write_register(register - 1, value)
-            elif register in REGISTERS_16BIT_SIGNED:
-                # Convert signed value to 16-bit unsigned for Modbus
-                unsigned_value = value & 0xFFFF
-                result = await self.client.write_register(register - 1, unsigned_value)
-            elif register in REGISTERS_32BIT_UNSIGNED:
-                # Split 32-bit value into two 16-bit values
-                high_word = (value >> 16) & 0xFFFF
-                low_word = value & 0xFFFF
-
-                # Write both words in a single transaction
-                result = await self.client.write_registers(
-                    address=register - 1, values=[high_word, low_word]
-                )
-            else:
-                msg = (
-                    f"Register {register} not found in either "
-                    "16-bit or 32-bit register sets"
-                )
-                raise NotImplementedError(msg)
+        await self._ensure_connected()
+
+        # pymodbus serializes transactions on the connection, no extra lock needed
+        if (encode := ENCODERS_16BIT.get(register)) is not None:
+            result = await self.client.write_register(register - 1, encode(value))
+        elif register in REGISTERS_32BIT_UNSIGNED:
+            # Split 32-bit value into two 16-bit values
+            high_word = (value >> 16) & 0xFFFF
+            low_word = value & 0xFFFF
+
+            # Write both words in a single transaction
+            result = await self.client.write_registers(
+                address=register - 1, values=[high_word, low_word]
+            )
+        else:
+            msg = (
+                f"Register {register} not found in either "
+                "16-bit or 32-bit register sets"
+            )
+            raise NotImplementedError(msg)
 
         if result.isError():
             msg = f"Error writing register at {register}"
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from dataclasses import replace
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -15,8 +16,8 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfTemperature,
     UnitOfTime,
-    UnitOfVolumeFlowRate,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 if TYPE_CHECKING:
@@ -43,10 +44,8 @@ from .const import (
     OPT_STEP_VOC,
     AirQualitySensorType,
     Controller,
-    FlowControl,
-    FlowUnit,
 )
-from .helpers import build_device_info
+from .helpers import get_flow_unit
 from .registers import REG_ECO_MAX_TEMP, REG_ECO_MIN_TEMP
 
 AQ_INTENSITY_MIN = 20
@@ -59,6 +58,15 @@ CO2_MAX = 2000
 VOC_MIN = 0
 VOC_MAX = 100
 
+STEP_DEFAULTS: Final[tuple[tuple[str, float], ...]] = (
+    (OPT_STEP_TEMPERATURE, DEFAULT_STEP_TEMPERATURE),
+    (OPT_STEP_FLOW, DEFAULT_STEP_FLOW),
+    (OPT_STEP_TIMER, DEFAULT_STEP_TIMER),
+    (OPT_STEP_CO2, DEFAULT_STEP_CO2),
+    (OPT_STEP_VOC, DEFAULT_STEP_VOC),
+    (OPT_STEP_HUMIDITY, DEFAULT_STEP_HUMIDITY),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -68,567 +76,44 @@ async def async_setup_entry(
     """Set up Komfovent number entities."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    step_temperature = entry.options.get(OPT_STEP_TEMPERATURE, DEFAULT_STEP_TEMPERATURE)
-    step_flow = entry.options.get(OPT_STEP_FLOW, DEFAULT_STEP_FLOW)
-    step_timer = entry.options.get(OPT_STEP_TIMER, DEFAULT_STEP_TIMER)
-    step_co2 = entry.options.get(OPT_STEP_CO2, DEFAULT_STEP_CO2)
-    step_voc = entry.options.get(OPT_STEP_VOC, DEFAULT_STEP_VOC)
-    step_humidity = entry.options.get(OPT_STEP_HUMIDITY, DEFAULT_STEP_HUMIDITY)
+    steps = {
+        option: entry.options.get(option, default) for option, default in STEP_DEFAULTS
+    }
 
-    entities = [
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=REG_ECO_MIN_TEMP,
-            entity_description=NumberEntityDescription(
-                key="eco_min_supply_temperature",
-                name="ECO Min Supply Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=REG_ECO_MAX_TEMP,
-            entity_description=NumberEntityDescription(
-                key="eco_max_supply_temperature",
-                name="ECO Max Supply Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_MIN_INTENSITY,
-            entity_description=NumberEntityDescription(
-                key="aq_minimum_intensity",
-                name="AQ Minimum Intensity",
-                entity_category=EntityCategory.CONFIG,
-                native_min_value=AQ_INTENSITY_MIN,
-                native_max_value=AQ_INTENSITY_MAX,
-                native_step=step_flow,
-                native_unit_of_measurement=PERCENTAGE,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_MAX_INTENSITY,
-            entity_description=NumberEntityDescription(
-                key="aq_maximum_intensity",
-                name="AQ Maximum Intensity",
-                entity_category=EntityCategory.CONFIG,
-                native_min_value=AQ_INTENSITY_MIN,
-                native_max_value=AQ_INTENSITY_MAX,
-                native_step=step_flow,
-                native_unit_of_measurement=PERCENTAGE,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_CHECK_PERIOD,
-            entity_description=NumberEntityDescription(
-                key="aq_check_period",
-                name="AQ Check Period",
-                entity_category=EntityCategory.CONFIG,
-                native_min_value=1,
-                native_max_value=24,
-                native_step=1,
-                native_unit_of_measurement=UnitOfTime.HOURS,
-                device_class=NumberDeviceClass.DURATION,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_TEMP_SETPOINT,
-            entity_description=NumberEntityDescription(
-                key="aq_temperature_setpoint",
-                name="AQ Temperature Setpoint",
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                device_class=NumberDeviceClass.TEMPERATURE,
-            ),
-        ),
-        # Away mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AWAY_FAN_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="away_supply_flow",
-                name="Away Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AWAY_FAN_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="away_extract_flow",
-                name="Away Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_AWAY_TEMP,
-            entity_description=NumberEntityDescription(
-                key="away_temperature",
-                name="Away Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Normal mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_NORMAL_FAN_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="normal_supply_flow",
-                name="Normal Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_NORMAL_FAN_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="normal_extract_flow",
-                name="Normal Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_NORMAL_SETPOINT,
-            entity_description=NumberEntityDescription(
-                key="normal_temperature",
-                name="Normal Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Intensive mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_INTENSIVE_FAN_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="intensive_supply_flow",
-                name="Intensive Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_INTENSIVE_FAN_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="intensive_extract_flow",
-                name="Intensive Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_INTENSIVE_TEMP,
-            entity_description=NumberEntityDescription(
-                key="intensive_temperature",
-                name="Intensive Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Boost mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_BOOST_FAN_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="boost_supply_flow",
-                name="Boost Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_BOOST_FAN_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="boost_extract_flow",
-                name="Boost Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_BOOST_TEMP,
-            entity_description=NumberEntityDescription(
-                key="boost_temperature",
-                name="Boost Temperature",
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Kitchen mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_KITCHEN_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="kitchen_supply_flow",
-                name="Kitchen Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_KITCHEN_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="kitchen_extract_flow",
-                name="Kitchen Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_KITCHEN_TEMP,
-            entity_description=NumberEntityDescription(
-                key="kitchen_temperature",
-                name="Kitchen Temperature",
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_KITCHEN_TIMER,
-            entity_description=NumberEntityDescription(
-                key="kitchen_timer",
-                name="Kitchen Timer",
-                native_unit_of_measurement=UnitOfTime.MINUTES,
-                native_min_value=0,
-                native_max_value=300,
-                native_step=step_timer,
-                device_class=NumberDeviceClass.DURATION,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Fireplace mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_FIREPLACE_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="fireplace_supply_flow",
-                name="Fireplace Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_FIREPLACE_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="fireplace_extract_flow",
-                name="Fireplace Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_FIREPLACE_TEMP,
-            entity_description=NumberEntityDescription(
-                key="fireplace_temperature",
-                name="Fireplace Temperature",
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_FIREPLACE_TIMER,
-            entity_description=NumberEntityDescription(
-                key="fireplace_timer",
-                name="Fireplace Timer",
-                native_unit_of_measurement=UnitOfTime.MINUTES,
-                native_min_value=0,
-                native_max_value=300,
-                native_step=step_timer,
-                device_class=NumberDeviceClass.DURATION,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Override mode controls
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_SUPPLY,
-            entity_description=NumberEntityDescription(
-                key="override_supply_flow",
-                name="Override Supply Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        FlowNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_EXTRACT,
-            entity_description=NumberEntityDescription(
-                key="override_extract_flow",
-                name="Override Extract Flow",
-                native_min_value=0,
-                native_max_value=200000,
-                native_step=step_flow,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_TEMP,
-            entity_description=NumberEntityDescription(
-                key="override_temperature",
-                name="Override Temperature",
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_TIMER,
-            entity_description=NumberEntityDescription(
-                key="override_timer",
-                name="Override Timer",
-                native_unit_of_measurement=UnitOfTime.MINUTES,
-                native_min_value=0,
-                native_max_value=300,
-                native_step=step_timer,
-                device_class=NumberDeviceClass.DURATION,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_DELAY_START,
-            entity_description=NumberEntityDescription(
-                key="override_delay_start",
-                name="Override Delay Start",
-                native_unit_of_measurement=UnitOfTime.MINUTES,
-                native_min_value=0,
-                native_max_value=10,
-                native_step=1,
-                device_class=NumberDeviceClass.DURATION,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_DELAY_STOP,
-            entity_description=NumberEntityDescription(
-                key="override_delay_stop",
-                name="Override Delay Stop",
-                native_unit_of_measurement=UnitOfTime.MINUTES,
-                native_min_value=0,
-                native_max_value=30,
-                native_step=1,
-                device_class=NumberDeviceClass.DURATION,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        # Holiday mode controls
-        TemperatureNumber(
-            coordinator=coordinator,
-            register_id=registers.REG_HOLIDAYS_TEMP,
-            entity_description=NumberEntityDescription(
-                key="holidays_temperature",
-                name="Holidays Temperature",
-                native_min_value=TEMP_SETPOINT_MIN,
-                native_max_value=TEMP_SETPOINT_MAX,
-                native_step=step_temperature,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-    ]
+    descriptions = list(NUMBER_DESCRIPTIONS)
 
     # Check AQ sensor types to determine if we should add the impurity setpoint
-    sensor1_type = coordinator.data.get(registers.REG_AQ_SENSOR1_TYPE)
-    sensor2_type = coordinator.data.get(registers.REG_AQ_SENSOR2_TYPE)
+    sensor_types = (
+        coordinator.data.get(registers.REG_AQ_SENSOR1_TYPE),
+        coordinator.data.get(registers.REG_AQ_SENSOR2_TYPE),
+    )
 
     # Check if either sensor is a CO2 sensor
-    if AirQualitySensorType.CO2 in {sensor1_type, sensor2_type}:
-        entities.append(
-            KomfoventNumber(
-                coordinator=coordinator,
-                register_id=registers.REG_AQ_IMPURITY_SETPOINT,
-                entity_description=NumberEntityDescription(
-                    key="aq_co2_setpoint",
-                    name="AQ CO2 Setpoint",
-                    native_step=step_co2,
-                    native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                    native_min_value=CO2_MIN,
-                    native_max_value=CO2_MAX,
-                    device_class=NumberDeviceClass.CO2,
-                ),
-            ),
-        )
+    if AirQualitySensorType.CO2 in sensor_types:
+        descriptions.append(AQ_CO2_SETPOINT)
     # Check if either sensor is a VOC sensor (and CO2 sensor is not already added)
-    elif AirQualitySensorType.VOC in {sensor1_type, sensor2_type}:
-        entities.append(
-            KomfoventNumber(
-                coordinator=coordinator,
-                register_id=registers.REG_AQ_IMPURITY_SETPOINT,
-                entity_description=NumberEntityDescription(
-                    key="aq_voc_setpoint",
-                    name="AQ VOC Setpoint",
-                    native_step=step_voc,
-                    native_unit_of_measurement=PERCENTAGE,
-                ),
-            ),
-        )
+    elif AirQualitySensorType.VOC in sensor_types:
+        descriptions.append(AQ_VOC_SETPOINT)
 
     # Check if either sensor is a humidity sensor (independent of CO2/VOC)
     if (
-        AirQualitySensorType.HUMIDITY
-        in {
-            sensor1_type,
-            sensor2_type,
-        }
-        or coordinator.controller == Controller.C8
+        AirQualitySensorType.HUMIDITY in sensor_types
+        or coordinator.controller is Controller.C8
     ):
-        entities.append(
-            KomfoventNumber(
-                coordinator=coordinator,
-                register_id=registers.REG_AQ_HUMIDITY_SETPOINT,
-                entity_description=NumberEntityDescription(
-                    key="aq_humidity_setpoint",
-                    name="AQ Humidity Setpoint",
-                    native_step=step_humidity,
-                    native_unit_of_measurement=PERCENTAGE,
-                    native_min_value=0,
-                    native_max_value=100,
-                    device_class=NumberDeviceClass.HUMIDITY,
-                ),
+        descriptions.append(AQ_HUMIDITY_SETPOINT)
+
+    entities = [
+        entity_cls(
+            coordinator=coordinator,
+            register_id=register_id,
+            entity_description=(
+                replace(description, native_step=steps[option])
+                if option
+                else description
             ),
         )
+        for entity_cls, register_id, description, option in descriptions
+    ]
 
     async_add_entities(entities)
 
@@ -636,6 +121,8 @@ async def async_setup_entry(
 class KomfoventNumber(CoordinatorEntity["KomfoventCoordinator"], NumberEntity):
     """Base representation of a Komfovent number entity."""
 
+    __slots__ = ("register_id",)
+
     _attr_has_entity_name: ClassVar[bool] = True
     coordinator: KomfoventCoordinator
 
@@ -649,73 +136,458 @@ class KomfoventNumber(CoordinatorEntity["KomfoventCoordinator"], NumberEntity):
         super().__init__(coordinator)
         self.register_id = register_id
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        if not self.coordinator.data:
-            return None
-
-        value = self.coordinator.data.get(self.register_id)
-
-        if value is None:
+        self._attr_device_info = coordinator.device_info
+        self._attr_native_value = self._value_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached value from the latest coordinator data."""
+        self._attr_native_value = self._value_from_data()
+        super()._handle_coordinator_update()
+
+    def _value_from_data(self) -> float | None:
+        """Return the current value from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
             return None
 
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        value = data.get(self.register_id)
+        return float(value) if isinstance(value, (int, float)) else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.coordinator.client.write(self.register_id, int(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.register_id, int(value))
 
 
 class FlowNumber(KomfoventNumber):
     """Flow number with dynamic units based on flow unit setting."""
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data:
-            return None
-
-        if self.coordinator.controller in {Controller.C6, Controller.C6M}:
-            flow_control = self.coordinator.data.get(registers.REG_FLOW_CONTROL)
-            if flow_control == FlowControl.OFF:
-                return PERCENTAGE
+    __slots__ = ()
 
-            flow_unit = self.coordinator.data.get(registers.REG_FLOW_UNIT)
-            if flow_unit == FlowUnit.M3H:
-                return UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR
-            if flow_unit == FlowUnit.LS:
-                return UnitOfVolumeFlowRate.LITERS_PER_SECOND
-        elif self.coordinator.controller == Controller.C8:
-            # no flow control or flow unit support
-            return PERCENTAGE
+    def __init__(
+        self,
+        coordinator: KomfoventCoordinator,
+        register_id: int,
+        entity_description: NumberEntityDescription,
+    ) -> None:
+        """Initialize the flow number entity."""
+        super().__init__(coordinator, register_id, entity_description)
+        self._attr_native_unit_of_measurement = get_flow_unit(self.coordinator)
 
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the unit of measurement from the latest flow settings."""
+        if self.coordinator.controller is not Controller.C8:
+            self._attr_native_unit_of_measurement = get_flow_unit(self.coordinator)
+        super()._handle_coordinator_update()
 
 
 class TemperatureNumber(KomfoventNumber):
     """Temperature number with x10 scaling."""
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        value = super().native_value
+    __slots__ = ()
 
-        if value is None:
+    def _value_from_data(self) -> float | None:
+        """Return the current value from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
             return None
 
-        return value / 10
+        value = data.get(self.register_id)
+        return value / 10 if isinstance(value, (int, float)) else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         await super().async_set_native_value(value * 10)
+
+
+# Shared settings for the per-mode controls; entries override key and name
+FLOW_TEMPLATE: Final = NumberEntityDescription(
+    key="flow",
+    native_min_value=0,
+    native_max_value=200000,
+    entity_registry_enabled_default=True,
+    entity_registry_visible_default=False,
+    entity_category=EntityCategory.CONFIG,
+)
+
+MODE_TEMPERATURE_TEMPLATE: Final = NumberEntityDescription(
+    key="temperature",
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    native_min_value=TEMP_SETPOINT_MIN,
+    native_max_value=TEMP_SETPOINT_MAX,
+    device_class=NumberDeviceClass.TEMPERATURE,
+    entity_registry_enabled_default=True,
+    entity_registry_visible_default=False,
+    entity_category=EntityCategory.CONFIG,
+)
+
+MODE_TIMER_TEMPLATE: Final = NumberEntityDescription(
+    key="timer",
+    native_unit_of_measurement=UnitOfTime.MINUTES,
+    native_min_value=0,
+    native_max_value=300,
+    device_class=NumberDeviceClass.DURATION,
+    entity_registry_enabled_default=True,
+    entity_registry_visible_default=False,
+    entity_category=EntityCategory.CONFIG,
+)
+
+# (entity class, register, description, step option or None for a fixed step)
+NumberDescription = tuple[
+    type[KomfoventNumber], int, NumberEntityDescription, str | None
+]
+
+NUMBER_DESCRIPTIONS: Final[tuple[NumberDescription, ...]] = (
+    (
+        TemperatureNumber,
+        REG_ECO_MIN_TEMP,
+        NumberEntityDescription(
+            key="eco_min_supply_temperature",
+            name="ECO Min Supply Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            native_min_value=TEMP_SETPOINT_MIN,
+            native_max_value=TEMP_SETPOINT_MAX,
+            device_class=NumberDeviceClass.TEMPERATURE,
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    (
+        TemperatureNumber,
+        REG_ECO_MAX_TEMP,
+        NumberEntityDescription(
+            key="eco_max_supply_temperature",
+            name="ECO Max Supply Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            native_min_value=TEMP_SETPOINT_MIN,
+            native_max_value=TEMP_SETPOINT_MAX,
+            device_class=NumberDeviceClass.TEMPERATURE,
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_AQ_MIN_INTENSITY,
+        NumberEntityDescription(
+            key="aq_minimum_intensity",
+            name="AQ Minimum Intensity",
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=AQ_INTENSITY_MIN,
+            native_max_value=AQ_INTENSITY_MAX,
+            native_unit_of_measurement=PERCENTAGE,
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_AQ_MAX_INTENSITY,
+        NumberEntityDescription(
+            key="aq_maximum_intensity",
+            name="AQ Maximum Intensity",
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=AQ_INTENSITY_MIN,
+            native_max_value=AQ_INTENSITY_MAX,
+            native_unit_of_measurement=PERCENTAGE,
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_AQ_CHECK_PERIOD,
+        NumberEntityDescription(
+            key="aq_check_period",
+            name="AQ Check Period",
+            entity_category=EntityCategory.CONFIG,
+            native_min_value=1,
+            native_max_value=24,
+            native_step=1,
+            native_unit_of_measurement=UnitOfTime.HOURS,
+            device_class=NumberDeviceClass.DURATION,
+        ),
+        None,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_AQ_TEMP_SETPOINT,
+        NumberEntityDescription(
+            key="aq_temperature_setpoint",
+            name="AQ Temperature Setpoint",
+            native_min_value=TEMP_SETPOINT_MIN,
+            native_max_value=TEMP_SETPOINT_MAX,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=NumberDeviceClass.TEMPERATURE,
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    # Away mode controls
+    (
+        FlowNumber,
+        registers.REG_AWAY_FAN_SUPPLY,
+        replace(FLOW_TEMPLATE, key="away_supply_flow", name="Away Supply Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_AWAY_FAN_EXTRACT,
+        replace(FLOW_TEMPLATE, key="away_extract_flow", name="Away Extract Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_AWAY_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE, key="away_temperature", name="Away Temperature"
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    # Normal mode controls
+    (
+        FlowNumber,
+        registers.REG_NORMAL_FAN_SUPPLY,
+        replace(FLOW_TEMPLATE, key="normal_supply_flow", name="Normal Supply Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_NORMAL_FAN_EXTRACT,
+        replace(FLOW_TEMPLATE, key="normal_extract_flow", name="Normal Extract Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_NORMAL_SETPOINT,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="normal_temperature",
+            name="Normal Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    # Intensive mode controls
+    (
+        FlowNumber,
+        registers.REG_INTENSIVE_FAN_SUPPLY,
+        replace(
+            FLOW_TEMPLATE, key="intensive_supply_flow", name="Intensive Supply Flow"
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_INTENSIVE_FAN_EXTRACT,
+        replace(
+            FLOW_TEMPLATE, key="intensive_extract_flow", name="Intensive Extract Flow"
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_INTENSIVE_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="intensive_temperature",
+            name="Intensive Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    # Boost mode controls
+    (
+        FlowNumber,
+        registers.REG_BOOST_FAN_SUPPLY,
+        replace(FLOW_TEMPLATE, key="boost_supply_flow", name="Boost Supply Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_BOOST_FAN_EXTRACT,
+        replace(FLOW_TEMPLATE, key="boost_extract_flow", name="Boost Extract Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_BOOST_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE, key="boost_temperature", name="Boost Temperature"
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    # Kitchen mode controls
+    (
+        FlowNumber,
+        registers.REG_KITCHEN_SUPPLY,
+        replace(FLOW_TEMPLATE, key="kitchen_supply_flow", name="Kitchen Supply Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_KITCHEN_EXTRACT,
+        replace(FLOW_TEMPLATE, key="kitchen_extract_flow", name="Kitchen Extract Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_KITCHEN_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="kitchen_temperature",
+            name="Kitchen Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_KITCHEN_TIMER,
+        replace(MODE_TIMER_TEMPLATE, key="kitchen_timer", name="Kitchen Timer"),
+        OPT_STEP_TIMER,
+    ),
+    # Fireplace mode controls
+    (
+        FlowNumber,
+        registers.REG_FIREPLACE_SUPPLY,
+        replace(
+            FLOW_TEMPLATE, key="fireplace_supply_flow", name="Fireplace Supply Flow"
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_FIREPLACE_EXTRACT,
+        replace(
+            FLOW_TEMPLATE, key="fireplace_extract_flow", name="Fireplace Extract Flow"
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_FIREPLACE_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="fireplace_temperature",
+            name="Fireplace Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_FIREPLACE_TIMER,
+        replace(MODE_TIMER_TEMPLATE, key="fireplace_timer", name="Fireplace Timer"),
+        OPT_STEP_TIMER,
+    ),
+    # Override mode controls
+    (
+        FlowNumber,
+        registers.REG_OVERRIDE_SUPPLY,
+        replace(FLOW_TEMPLATE, key="override_supply_flow", name="Override Supply Flow"),
+        OPT_STEP_FLOW,
+    ),
+    (
+        FlowNumber,
+        registers.REG_OVERRIDE_EXTRACT,
+        replace(
+            FLOW_TEMPLATE, key="override_extract_flow", name="Override Extract Flow"
+        ),
+        OPT_STEP_FLOW,
+    ),
+    (
+        TemperatureNumber,
+        registers.REG_OVERRIDE_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="override_temperature",
+            name="Override Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_OVERRIDE_TIMER,
+        replace(MODE_TIMER_TEMPLATE, key="override_timer", name="Override Timer"),
+        OPT_STEP_TIMER,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_OVERRIDE_DELAY_START,
+        NumberEntityDescription(
+            key="override_delay_start",
+            name="Override Delay Start",
+            native_unit_of_measurement=UnitOfTime.MINUTES,
+            native_min_value=0,
+            native_max_value=10,
+            native_step=1,
+            device_class=NumberDeviceClass.DURATION,
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+        None,
+    ),
+    (
+        KomfoventNumber,
+        registers.REG_OVERRIDE_DELAY_STOP,
+        NumberEntityDescription(
+            key="override_delay_stop",
+            name="Override Delay Stop",
+            native_unit_of_measurement=UnitOfTime.MINUTES,
+            native_min_value=0,
+            native_max_value=30,
+            native_step=1,
+            device_class=NumberDeviceClass.DURATION,
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+        None,
+    ),
+    # Holiday mode controls
+    (
+        TemperatureNumber,
+        registers.REG_HOLIDAYS_TEMP,
+        replace(
+            MODE_TEMPERATURE_TEMPLATE,
+            key="holidays_temperature",
+            name="Holidays Temperature",
+        ),
+        OPT_STEP_TEMPERATURE,
+    ),
+)
+
+AQ_CO2_SETPOINT: Final[NumberDescription] = (
+    KomfoventNumber,
+    registers.REG_AQ_IMPURITY_SETPOINT,
+    NumberEntityDescription(
+        key="aq_co2_setpoint",
+        name="AQ CO2 Setpoint",
+        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+        native_min_value=CO2_MIN,
+        native_max_value=CO2_MAX,
+        device_class=NumberDeviceClass.CO2,
+    ),
+    OPT_STEP_CO2,
+)
+
+AQ_VOC_SETPOINT: Final[NumberDescription] = (
+    KomfoventNumber,
+    registers.REG_AQ_IMPURITY_SETPOINT,
+    NumberEntityDescription(
+        key="aq_voc_setpoint",
+        name="AQ VOC Setpoint",
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    OPT_STEP_VOC,
+)
+
+AQ_HUMIDITY_SETPOINT: Final[NumberDescription] = (
+    KomfoventNumber,
+    registers.REG_AQ_HUMIDITY_SETPOINT,
+    NumberEntityDescription(
+        key="aq_humidity_setpoint",
+        name="AQ Humidity Setpoint",
+        native_unit_of_measurement=PERCENTAGE,
+        native_min_value=0,
+        native_max_value=100,
+        device_class=NumberDeviceClass.HUMIDITY,
+    ),
+    OPT_STEP_HUMIDITY,
+)
@@ -227,197 +227,216 @@ REG_RESET_SETTINGS = 1050  # Reset settings
 REG_CLEAN_FILTERS = 1051  # Clean filters calibration
 
 # Sets of 16-bit and 32-bit registers
-REGISTERS_16BIT_UNSIGNED = {
-    REG_POWER,
-    REG_AUTO_MODE_CONTROL,
-    REG_ECO_MODE,
-    REG_AUTO_MODE,
-    REG_OPERATION_MODE,
-    REG_SCHEDULER_MODE,
-    REG_NEXT_MODE,
-    REG_NEXT_MODE_TIME,
-    REG_NEXT_MODE_WEEKDAY,
-    REG_BEFORE_MODE_MASK,
-    REG_TEMP_CONTROL,
-    REG_FLOW_CONTROL,
-    REG_MAX_SUPPLY_PRESSURE,
-    REG_MAX_EXTRACT_PRESSURE,
-    REG_ROOM_SENSOR,
-    REG_STAGE1,
-    REG_STAGE2,
-    REG_STAGE3,
-    REG_EXTERNAL_COIL_TYPE,
-    REG_ICING_PROTECTION,
-    REG_INDOOR_HUMIDITY,
-    REG_DHCP,
-    REG_BACNET_PORT,
-    REG_LANGUAGE,
-    REG_FLOW_UNIT,
-    REG_FIRE_ALARM_RESTART,
-    REG_TIME,
-    REG_YEAR,
-    REG_MONTH_DAY,
-    REG_WEEK_DAY,
-    REG_AWAY_HEATER,
-    REG_NORMAL_HEATER,
-    REG_INTENSIVE_HEATER,
-    REG_BOOST_HEATER,
-    REG_KITCHEN_HEATER,
-    REG_KITCHEN_TIMER,
-    REG_FIREPLACE_HEATER,
-    REG_FIREPLACE_TIMER,
-    REG_OVERRIDE_HEATER,
-    REG_OVERRIDE_ACTIVATION,
-    REG_OVERRIDE_ACTIVATION,
-    REG_OVERRIDE_TIMER,
-    REG_OVERRIDE_DELAY_START,
-    REG_OVERRIDE_DELAY_STOP,
-    REG_HOLIDAYS_MICRO_VENT,
-    REG_HOLIDAYS_HEATER,
-    REG_HOLIDAYS_YEAR_FROM,
-    REG_HOLIDAYS_DATE_FROM,
-    REG_HOLIDAYS_YEAR_TILL,
-    REG_HOLIDAYS_DATE_TILL,
-    REG_ECO_MIN_TEMP,
-    REG_ECO_MAX_TEMP,
-    REG_ECO_FREE_HEAT_COOL,
-    REG_ECO_HEATER_BLOCKING,
-    REG_ECO_COOLER_BLOCKING,
-    REG_AQ_IMPURITY_CONTROL,
-    REG_AQ_IMPURITY_SETPOINT,
-    REG_AQ_HUMIDITY_SETPOINT,
-    REG_AQ_MIN_INTENSITY,
-    REG_AQ_MAX_INTENSITY,
-    REG_AQ_ELECTRIC_HEATER,
-    REG_AQ_CHECK_PERIOD,
-    REG_AQ_SENSOR1_TYPE,
-    REG_AQ_SENSOR2_TYPE,
-    REG_AQ_HUMIDITY_CONTROL,
-    REG_AQ_OUTDOOR_HUMIDITY,
-    REG_ECO_HEAT_RECOVERY,
-    REG_ACTIVE_ALARMS_COUNT,
-    REG_ACTIVE_ALARM1,
-    REG_ACTIVE_ALARM2,
-    REG_ACTIVE_ALARM3,
-    REG_ACTIVE_ALARM4,
-    REG_ACTIVE_ALARM5,
-    REG_ACTIVE_ALARM6,
-    REG_ACTIVE_ALARM7,
-    REG_ACTIVE_ALARM8,
-    REG_ACTIVE_ALARM9,
-    REG_ACTIVE_ALARM10,
-    REG_STATUS,
-    REG_HEATING_CONFIG,
-    REG_SUPPLY_FAN,
-    REG_EXTRACT_FAN,
-    REG_HEAT_EXCHANGER,
-    REG_ELECTRIC_HEATER,
-    REG_WATER_HEATER,
-    REG_WATER_COOLER,
-    REG_FILTER_CLOGGING,
-    REG_AIR_DAMPERS,
-    REG_SUPPLY_PRESSURE,
-    REG_EXTRACT_PRESSURE,
-    REG_POWER_CONSUMPTION,
-    REG_HEATER_POWER,
-    REG_HEAT_RECOVERY,
-    REG_HEAT_EFFICIENCY,
-    REG_ENERGY_SAVING,
-    REG_SPI,
-    REG_SPI_DAY,
-    REG_PANEL1_AQ,
-    REG_PANEL2_AQ,
-    REG_EXTRACT_AQ_1,
-    REG_EXTRACT_AQ_2,
-    REG_CONNECTED_PANELS,
-    REG_HEAT_EXCHANGER_TYPE,
-    REG_INDOOR_ABS_HUMIDITY,
-    REG_OUTDOOR_ABS_HUMIDITY,
-    REG_DO_ALARM,
-    REG_DO_HEATING,
-    REG_DO_COOLING,
-    REG_RESET_SETTINGS,
-    REG_CLEAN_FILTERS,
-}
-REGISTERS_16BIT_SIGNED = {
-    REG_AWAY_TEMP,
-    REG_NORMAL_SETPOINT,
-    REG_INTENSIVE_TEMP,
-    REG_BOOST_TEMP,
-    REG_KITCHEN_TEMP,
-    REG_FIREPLACE_TEMP,
-    REG_OVERRIDE_TEMP,
-    REG_HOLIDAYS_TEMP,
-    REG_AQ_TEMP_SETPOINT,
-    REG_SUPPLY_TEMP,
-    REG_EXTRACT_TEMP,
-    REG_OUTDOOR_TEMP,
-    REG_WATER_TEMP,
-    REG_DX_UNIT,
-    REG_PANEL1_TEMP,
-    REG_PANEL1_RH,
-    REG_PANEL2_TEMP,
-    REG_PANEL2_RH,
-    REG_EXHAUST_TEMP,
-}
-REGISTERS_32BIT_UNSIGNED = {
-    REG_MAX_SUPPLY_FLOW,
-    REG_MAX_EXTRACT_FLOW,
-    REG_IP,
-    REG_MASK,
-    REG_GATEWAY,
-    REG_BACNET_ID,
-    REG_EPOCH_TIME,
-    REG_AWAY_FAN_SUPPLY,
-    REG_AWAY_FAN_EXTRACT,
-    REG_NORMAL_FAN_SUPPLY,
-    REG_NORMAL_FAN_EXTRACT,
-    REG_INTENSIVE_FAN_SUPPLY,
-    REG_INTENSIVE_FAN_EXTRACT,
-    REG_BOOST_FAN_SUPPLY,
-    REG_BOOST_FAN_EXTRACT,
-    REG_KITCHEN_SUPPLY,
-    REG_KITCHEN_EXTRACT,
-    REG_FIREPLACE_SUPPLY,
-    REG_FIREPLACE_EXTRACT,
-    REG_OVERRIDE_SUPPLY,
-    REG_OVERRIDE_EXTRACT,
-    REG_HOLIDAYS_FROM,
-    REG_HOLIDAYS_UNTIL,
-    REG_SUPPLY_FLOW,
-    REG_EXTRACT_FLOW,
-    REG_AHU_DAY,
-    REG_AHU_MONTH,
-    REG_AHU_TOTAL,
-    REG_HEATER_DAY,
-    REG_HEATER_MONTH,
-    REG_HEATER_TOTAL,
-    REG_RECOVERY_DAY,
-    REG_RECOVERY_MONTH,
-    REG_RECOVERY_TOTAL,
-    REG_FIRMWARE,
-    REG_PANEL1_FW,
-    REG_PANEL2_FW,
-}
-REGISTERS_APPLY_EMA = {
-    REG_SUPPLY_TEMP,
-    REG_EXTRACT_TEMP,
-    REG_OUTDOOR_TEMP,
-    REG_WATER_TEMP,
-    REG_PANEL1_TEMP,
-    REG_PANEL1_RH,
-    REG_PANEL2_TEMP,
-    REG_PANEL2_RH,
-    REG_EXHAUST_TEMP,
-    REG_HEAT_EXCHANGER,
-    REG_HEAT_RECOVERY,
-    REG_HEAT_EFFICIENCY,
-    REG_SUPPLY_PRESSURE,
-    REG_EXTRACT_PRESSURE,
-    REG_INDOOR_ABS_HUMIDITY,
-    REG_OUTDOOR_ABS_HUMIDITY,
-    REG_EXTRACT_AQ_1,
-    REG_EXTRACT_AQ_2,
-    REG_SPI,
-    REG_ENERGY_SAVING,
+REGISTERS_16BIT_UNSIGNED = frozenset(
+    {
+        REG_POWER,
+        REG_AUTO_MODE_CONTROL,
+        REG_ECO_MODE,
+        REG_AUTO_MODE,
+        REG_OPERATION_MODE,
+        REG_SCHEDULER_MODE,
+        REG_NEXT_MODE,
+        REG_NEXT_MODE_TIME,
+        REG_NEXT_MODE_WEEKDAY,
+        REG_BEFORE_MODE_MASK,
+        REG_TEMP_CONTROL,
+        REG_FLOW_CONTROL,
+        REG_MAX_SUPPLY_PRESSURE,
+        REG_MAX_EXTRACT_PRESSURE,
+        REG_ROOM_SENSOR,
+        REG_STAGE1,
+        REG_STAGE2,
+        REG_STAGE3,
+        REG_EXTERNAL_COIL_TYPE,
+        REG_ICING_PROTECTION,
+        REG_INDOOR_HUMIDITY,
+        REG_DHCP,
+        REG_BACNET_PORT,
+        REG_LANGUAGE,
+        REG_FLOW_UNIT,
+        REG_FIRE_ALARM_RESTART,
+        REG_TIME,
+        REG_YEAR,
+        REG_MONTH_DAY,
+        REG_WEEK_DAY,
+        REG_AWAY_HEATER,
+        REG_NORMAL_HEATER,
+        REG_INTENSIVE_HEATER,
+        REG_BOOST_HEATER,
+        REG_KITCHEN_HEATER,
+        REG_KITCHEN_TIMER,
+        REG_FIREPLACE_HEATER,
+        REG_FIREPLACE_TIMER,
+        REG_OVERRIDE_HEATER,
+        REG_OVERRIDE_ACTIVATION,
+        REG_OVERRIDE_TIMER,
+        REG_OVERRIDE_DELAY_START,
+        REG_OVERRIDE_DELAY_STOP,
+        REG_HOLIDAYS_MICRO_VENT,
+        REG_HOLIDAYS_HEATER,
+        REG_HOLIDAYS_YEAR_FROM,
+        REG_HOLIDAYS_DATE_FROM,
+        REG_HOLIDAYS_YEAR_TILL,
+        REG_HOLIDAYS_DATE_TILL,
+        REG_ECO_MIN_TEMP,
+        REG_ECO_MAX_TEMP,
+        REG_ECO_FREE_HEAT_COOL,
+        REG_ECO_HEATER_BLOCKING,
+        REG_ECO_COOLER_BLOCKING,
+        REG_AQ_IMPURITY_CONTROL,
+        REG_AQ_IMPURITY_SETPOINT,
+        REG_AQ_HUMIDITY_SETPOINT,
+        REG_AQ_MIN_INTENSITY,
+        REG_AQ_MAX_INTENSITY,
+        REG_AQ_ELECTRIC_HEATER,
+        REG_AQ_CHECK_PERIOD,
+        REG_AQ_SENSOR1_TYPE,
+        REG_AQ_SENSOR2_TYPE,
+        REG_AQ_HUMIDITY_CONTROL,
+        REG_AQ_OUTDOOR_HUMIDITY,
+        REG_ECO_HEAT_RECOVERY,
+        REG_ACTIVE_ALARMS_COUNT,
+        REG_ACTIVE_ALARM1,
+        REG_ACTIVE_ALARM2,
+        REG_ACTIVE_ALARM3,
+        REG_ACTIVE_ALARM4,
+        REG_ACTIVE_ALARM5,
+        REG_ACTIVE_ALARM6,
+        REG_ACTIVE_ALARM7,
+        REG_ACTIVE_ALARM8,
+        REG_ACTIVE_ALARM9,
+        REG_ACTIVE_ALARM10,
+        REG_STATUS,
+        REG_HEATING_CONFIG,
+        REG_SUPPLY_FAN,
+        REG_EXTRACT_FAN,
+        REG_HEAT_EXCHANGER,
+        REG_ELECTRIC_HEATER,
+        REG_WATER_HEATER,
+        REG_WATER_COOLER,
+        REG_FILTER_CLOGGING,
+        REG_AIR_DAMPERS,
+        REG_SUPPLY_PRESSURE,
+        REG_EXTRACT_PRESSURE,
+        REG_POWER_CONSUMPTION,
+        REG_HEATER_POWER,
+        REG_HEAT_RECOVERY,
+        REG_HEAT_EFFICIENCY,
+        REG_ENERGY_SAVING,
+        REG_SPI,
+        REG_SPI_DAY,
+        REG_PANEL1_AQ,
+        REG_PANEL2_AQ,
+        REG_EXTRACT_AQ_1,
+        REG_EXTRACT_AQ_2,
+        REG_CONNECTED_PANELS,
+        REG_HEAT_EXCHANGER_TYPE,
+        REG_INDOOR_ABS_HUMIDITY,
+        REG_OUTDOOR_ABS_HUMIDITY,
+        REG_DO_ALARM,
+        REG_DO_HEATING,
+        REG_DO_COOLING,
+        REG_RESET_SETTINGS,
+        REG_CLEAN_FILTERS,
+    }
+)
+REGISTERS_16BIT_SIGNED = frozenset(
+    {
+        REG_AWAY_TEMP,
+        REG_NORMAL_SETPOINT,
+        REG_INTENSIVE_TEMP,
+        REG_BOOST_TEMP,
+        REG_KITCHEN_TEMP,
+        REG_FIREPLACE_TEMP,
+        REG_OVERRIDE_TEMP,
+        REG_HOLIDAYS_TEMP,
+        REG_AQ_TEMP_SETPOINT,
+        REG_SUPPLY_TEMP,
+        REG_EXTRACT_TEMP,
+        REG_OUTDOOR_TEMP,
+        REG_WATER_TEMP,
+        REG_DX_UNIT,
+        REG_PANEL1_TEMP,
+        REG_PANEL1_RH,
+        REG_PANEL2_TEMP,
+        REG_PANEL2_RH,
+        REG_EXHAUST_TEMP,
+    }
+)
+REGISTERS_32BIT_UNSIGNED = frozenset(
+    {
+        REG_MAX_SUPPLY_FLOW,
+        REG_MAX_EXTRACT_FLOW,
+        REG_IP,
+        REG_MASK,
+        REG_GATEWAY,
+        REG_BACNET_ID,
+        REG_EPOCH_TIME,
+        REG_AWAY_FAN_SUPPLY,
+        REG_AWAY_FAN_EXTRACT,
+        REG_NORMAL_FAN_SUPPLY,
+        REG_NORMAL_FAN_EXTRACT,
+        REG_INTENSIVE_FAN_SUPPLY,
+        REG_INTENSIVE_FAN_EXTRACT,
+        REG_BOOST_FAN_SUPPLY,
+        REG_BOOST_FAN_EXTRACT,
+        REG_KITCHEN_SUPPLY,
+        REG_KITCHEN_EXTRACT,
+        REG_FIREPLACE_SUPPLY,
+        REG_FIREPLACE_EXTRACT,
+        REG_OVERRIDE_SUPPLY,
+        REG_OVERRIDE_EXTRACT,
+        REG_HOLIDAYS_FROM,
+        REG_HOLIDAYS_UNTIL,
+        REG_SUPPLY_FLOW,
+        REG_EXTRACT_FLOW,
+        REG_AHU_DAY,
+        REG_AHU_MONTH,
+        REG_AHU_TOTAL,
+        REG_HEATER_DAY,
+        REG_HEATER_MONTH,
+        REG_HEATER_TOTAL,
+        REG_RECOVERY_DAY,
+        REG_RECOVERY_MONTH,
+        REG_RECOVERY_TOTAL,
+        REG_FIRMWARE,
+        REG_PANEL1_FW,
+        REG_PANEL2_FW,
+    }
+)
+
+# Register value types, resolved with a single lookup in REGISTER_KIND
+KIND_16BIT_UNSIGNED = 0
+KIND_16BIT_SIGNED = 1
+KIND_32BIT_UNSIGNED = 2
+
+REGISTER_KIND = {
+    **dict.fromkeys(REGISTERS_16BIT_UNSIGNED, KIND_16BIT_UNSIGNED),
+    **dict.fromkeys(REGISTERS_16BIT_SIGNED, KIND_16BIT_SIGNED),
+    **dict.fromkeys(REGISTERS_32BIT_UNSIGNED, KIND_32BIT_UNSIGNED),
 }
+
+REGISTERS_APPLY_EMA = frozenset(
+    {
+        REG_SUPPLY_TEMP,
+        REG_EXTRACT_TEMP,
+        REG_OUTDOOR_TEMP,
+        REG_WATER_TEMP,
+        REG_PANEL1_TEMP,
+        REG_PANEL1_RH,
+        REG_PANEL2_TEMP,
+        REG_PANEL2_RH,
+        REG_EXHAUST_TEMP,
+        REG_HEAT_EXCHANGER,
+        REG_HEAT_RECOVERY,
+        REG_HEAT_EFFICIENCY,
+        REG_SUPPLY_PRESSURE,
+        REG_EXTRACT_PRESSURE,
+        REG_INDOOR_ABS_HUMIDITY,
+        REG_OUTDOOR_ABS_HUMIDITY,
+        REG_EXTRACT_AQ_1,
+        REG_EXTRACT_AQ_2,
+        REG_SPI,
+        REG_ENERGY_SAVING,
+    }
+)
@@ -3,21 +3,21 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, ClassVar
-
-if TYPE_CHECKING:
-    from enum import IntEnum
+from enum import IntEnum
+from functools import cache
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import registers, services
 from .const import (
+    C6_CONTROLLERS,
     DOMAIN,
     AirQualitySensorType,
     CoilType,
-    Controller,
     ControlStage,
     FlowControl,
     HeatRecoveryControl,
@@ -28,7 +28,7 @@ from .const import (
     SchedulerMode,
     TemperatureControl,
 )
-from .helpers import build_device_info
+from .helpers import option_names
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -40,6 +40,17 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@cache
+def option_values(enum_class: type[IntEnum]) -> dict[str, int]:
+    """Return the enum value for each option name, built once per enum."""
+    return {name: value for value, name in option_names(enum_class).items()}
+
+
+def enum_options(enum_class: type[IntEnum]) -> list[str]:
+    """Return the select options for an enum."""
+    return list(option_names(enum_class).values())
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -47,186 +58,29 @@ async def async_setup_entry(
 ) -> None:
     """Set up Komfovent select entities."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [
-        KomfoventOperationModeSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_OPERATION_MODE,
-            enum_class=OperationMode,
-            entity_description=SelectEntityDescription(
-                key="operation_mode",
-                name="Operation mode",
-                options=[mode.name.lower() for mode in OperationMode],
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_SCHEDULER_MODE,
-            enum_class=SchedulerMode,
-            entity_description=SelectEntityDescription(
-                key="scheduler_mode",
-                name="Scheduler mode",
-                options=[mode.name.lower() for mode in SchedulerMode],
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_TEMP_CONTROL,
-            enum_class=TemperatureControl,
-            entity_description=SelectEntityDescription(
-                key="temperature_control",
-                name="Temperature control",
-                entity_category=EntityCategory.CONFIG,
-                options=[mode.name.lower() for mode in TemperatureControl],
-                entity_registry_enabled_default=False,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_SENSOR1_TYPE,
-            enum_class=AirQualitySensorType,
-            entity_description=SelectEntityDescription(
-                key="aq_sensor1_type",
-                name="AQ Sensor 1 Type",
-                entity_category=EntityCategory.CONFIG,
-                options=[mode.name.lower() for mode in AirQualitySensorType],
-                entity_registry_enabled_default=False,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_OUTDOOR_HUMIDITY,
-            enum_class=OutdoorHumiditySensor,
-            entity_description=SelectEntityDescription(
-                key="aq_outdoor_humidity_sensor",
-                name="AQ Outdoor Humidity Sensor",
-                entity_category=EntityCategory.CONFIG,
-                options=[mode.name.lower() for mode in OutdoorHumiditySensor],
-                entity_registry_enabled_default=False,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_ECO_HEAT_RECOVERY,
-            enum_class=HeatRecoveryControl,
-            entity_description=SelectEntityDescription(
-                key="eco_heat_recovery",
-                name="ECO Heat Recovery",
-                options=[mode.name.lower() for mode in HeatRecoveryControl],
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_ACTIVATION,
-            enum_class=OverrideActivation,
-            entity_description=SelectEntityDescription(
-                key="override_activation",
-                name="Override Activation",
-                options=[mode.name.lower() for mode in OverrideActivation],
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_HOLIDAYS_MICRO_VENT,
-            enum_class=MicroVentilation,
-            entity_description=SelectEntityDescription(
-                key="holidays_micro_ventilation",
-                name="Holidays Micro-ventilation",
-                options=[mode.name.lower() for mode in MicroVentilation],
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_STAGE1,
-            enum_class=ControlStage,
-            entity_description=SelectEntityDescription(
-                key="control_stage_1",
-                name="Control Stage 1",
-                options=[mode.name.lower() for mode in ControlStage],
-                entity_registry_enabled_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_STAGE2,
-            enum_class=ControlStage,
-            entity_description=SelectEntityDescription(
-                key="control_stage_2",
-                name="Control Stage 2",
-                options=[mode.name.lower() for mode in ControlStage],
-                entity_registry_enabled_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSelect(
-            coordinator=coordinator,
-            register_id=registers.REG_EXTERNAL_COIL_TYPE,
-            enum_class=CoilType,
-            entity_description=SelectEntityDescription(
-                key="external_coil_type",
-                name="External Coil Type",
-                options=[mode.name.lower() for mode in CoilType],
-                entity_registry_enabled_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-    ]
+
+    descriptions = list(SELECT_DESCRIPTIONS)
 
     # Flow control, AQ Sensor 2 & Control Stage 3 only available on C6/C6M
-    if coordinator.controller in {Controller.C6, Controller.C6M}:
-        entities.extend(
-            [
-                KomfoventSelect(
-                    coordinator=coordinator,
-                    register_id=registers.REG_FLOW_CONTROL,
-                    enum_class=FlowControl,
-                    entity_description=SelectEntityDescription(
-                        key="flow_control",
-                        name="Flow control",
-                        entity_category=EntityCategory.CONFIG,
-                        options=[mode.name.lower() for mode in FlowControl],
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-                KomfoventSelect(
-                    coordinator=coordinator,
-                    register_id=registers.REG_AQ_SENSOR2_TYPE,
-                    enum_class=AirQualitySensorType,
-                    entity_description=SelectEntityDescription(
-                        key="aq_sensor2_type",
-                        name="AQ Sensor 2 Type",
-                        entity_category=EntityCategory.CONFIG,
-                        options=[mode.name.lower() for mode in AirQualitySensorType],
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-                KomfoventSelect(
-                    coordinator=coordinator,
-                    register_id=registers.REG_STAGE3,
-                    enum_class=ControlStage,
-                    entity_description=SelectEntityDescription(
-                        key="control_stage_3",
-                        name="Control Stage 3",
-                        options=[mode.name.lower() for mode in ControlStage],
-                        entity_registry_enabled_default=False,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-            ]
-        )
+    if coordinator.controller in C6_CONTROLLERS:
+        descriptions.extend(C6_SELECT_DESCRIPTIONS)
 
-    async_add_entities(entities)
+    async_add_entities(
+        entity_cls(
+            coordinator=coordinator,
+            register_id=register_id,
+            enum_class=enum_class,
+            entity_description=description,
+        )
+        for entity_cls, register_id, enum_class, description in descriptions
+    )
 
 
 class KomfoventSelect(CoordinatorEntity["KomfoventCoordinator"], SelectEntity):
     """Representation of a Komfovent select entity."""
 
+    __slots__ = ("_option_names", "_option_values", "enum_class", "register_id")
+
     _attr_has_entity_name: ClassVar[bool] = True
     coordinator: KomfoventCoordinator
 
@@ -241,41 +95,222 @@ class KomfoventSelect(CoordinatorEntity["KomfoventCoordinator"], SelectEntity):
         super().__init__(coordinator)
         self.register_id = register_id
         self.enum_class = enum_class
+        self._option_names = option_names(enum_class)
+        self._option_values = option_values(enum_class)
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
+        self._attr_current_option = self._option_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached option from the latest coordinator data."""
+        self._attr_current_option = self._option_from_data()
+        super()._handle_coordinator_update()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if not self.coordinator.data:
+    def _option_from_data(self) -> str | None:
+        """Return the current option from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
             return None
 
-        mode = self.coordinator.data.get(self.register_id)
-        try:
-            return self.enum_class(mode).name.lower()
-        except ValueError:
+        mode = data.get(self.register_id)
+        if mode is None:
             return None
 
+        return self._option_names.get(mode)
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        try:
-            mode = self.enum_class[option.upper()]
-        except ValueError:
-            _LOGGER.warning("Invalid operation mode: %s", option)
+        value = self._option_values.get(option.lower())
+        if value is None:
+            _LOGGER.warning("Invalid option: %s", option)
             return
 
-        await self.coordinator.client.write(self.register_id, mode.value)
-
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.register_id, value)
 
 
 class KomfoventOperationModeSelect(KomfoventSelect):
     """Special select entity for operation mode that handles power and auto mode."""
 
+    __slots__ = ()
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         await services.set_operation_mode(self.coordinator, option)
+
+
+SelectDescription = tuple[
+    type[KomfoventSelect], int, type[IntEnum], SelectEntityDescription
+]
+
+SELECT_DESCRIPTIONS: Final[tuple[SelectDescription, ...]] = (
+    (
+        KomfoventOperationModeSelect,
+        registers.REG_OPERATION_MODE,
+        OperationMode,
+        SelectEntityDescription(
+            key="operation_mode",
+            name="Operation mode",
+            options=enum_options(OperationMode),
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_SCHEDULER_MODE,
+        SchedulerMode,
+        SelectEntityDescription(
+            key="scheduler_mode",
+            name="Scheduler mode",
+            options=enum_options(SchedulerMode),
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_TEMP_CONTROL,
+        TemperatureControl,
+        SelectEntityDescription(
+            key="temperature_control",
+            name="Temperature control",
+            entity_category=EntityCategory.CONFIG,
+            options=enum_options(TemperatureControl),
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_AQ_SENSOR1_TYPE,
+        AirQualitySensorType,
+        SelectEntityDescription(
+            key="aq_sensor1_type",
+            name="AQ Sensor 1 Type",
+            entity_category=EntityCategory.CONFIG,
+            options=enum_options(AirQualitySensorType),
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_AQ_OUTDOOR_HUMIDITY,
+        OutdoorHumiditySensor,
+        SelectEntityDescription(
+            key="aq_outdoor_humidity_sensor",
+            name="AQ Outdoor Humidity Sensor",
+            entity_category=EntityCategory.CONFIG,
+            options=enum_options(OutdoorHumiditySensor),
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_ECO_HEAT_RECOVERY,
+        HeatRecoveryControl,
+        SelectEntityDescription(
+            key="eco_heat_recovery",
+            name="ECO Heat Recovery",
+            options=enum_options(HeatRecoveryControl),
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_OVERRIDE_ACTIVATION,
+        OverrideActivation,
+        SelectEntityDescription(
+            key="override_activation",
+            name="Override Activation",
+            options=enum_options(OverrideActivation),
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_HOLIDAYS_MICRO_VENT,
+        MicroVentilation,
+        SelectEntityDescription(
+            key="holidays_micro_ventilation",
+            name="Holidays Micro-ventilation",
+            options=enum_options(MicroVentilation),
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_STAGE1,
+        ControlStage,
+        SelectEntityDescription(
+            key="control_stage_1",
+            name="Control Stage 1",
+            options=enum_options(ControlStage),
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_STAGE2,
+        ControlStage,
+        SelectEntityDescription(
+            key="control_stage_2",
+            name="Control Stage 2",
+            options=enum_options(ControlStage),
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_EXTERNAL_COIL_TYPE,
+        CoilType,
+        SelectEntityDescription(
+            key="external_coil_type",
+            name="External Coil Type",
+            options=enum_options(CoilType),
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+)
+
+C6_SELECT_DESCRIPTIONS: Final[tuple[SelectDescription, ...]] = (
+    (
+        KomfoventSelect,
+        registers.REG_FLOW_CONTROL,
+        FlowControl,
+        SelectEntityDescription(
+            key="flow_control",
+            name="Flow control",
+            entity_category=EntityCategory.CONFIG,
+            options=enum_options(FlowControl),
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_AQ_SENSOR2_TYPE,
+        AirQualitySensorType,
+        SelectEntityDescription(
+            key="aq_sensor2_type",
+            name="AQ Sensor 2 Type",
+            entity_category=EntityCategory.CONFIG,
+            options=enum_options(AirQualitySensorType),
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSelect,
+        registers.REG_STAGE3,
+        ControlStage,
+        SelectEntityDescription(
+            key="control_stage_3",
+            name="Control Stage 3",
+            options=enum_options(ControlStage),
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+)
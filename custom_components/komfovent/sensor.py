@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import zoneinfo
-from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,15 +20,21 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfPressure,
     UnitOfTemperature,
-    UnitOfVolumeFlowRate,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .helpers import build_device_info, get_version_from_int
+from .helpers import (
+    get_flow_unit,
+    get_local_epoch,
+    get_version_from_int,
+    option_names,
+)
 
 if TYPE_CHECKING:
     from decimal import Decimal
+    from enum import IntEnum
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -39,6 +45,7 @@ if TYPE_CHECKING:
 
 from . import registers
 from .const import (
+    C6_CONTROLLERS,
     DOMAIN,
     AirQualitySensorType,
     ConnectedPanels,
@@ -62,640 +69,102 @@ MAX_CO2_PPM = 2500
 MAX_SPI = 5
 MAX_VOC = 125
 
-ABS_HUMIDITY_ERRORS = {65534, 65535}
+ABS_HUMIDITY_ERRORS = frozenset({65534, 65535})
+
+PANEL1_CONNECTED = frozenset({ConnectedPanels.PANEL1, ConnectedPanels.BOTH})
+PANEL2_CONNECTED = frozenset({ConnectedPanels.PANEL2, ConnectedPanels.BOTH})
+
+# AQ value register -> (sensor type register, outdoor humidity sensor setting)
+AQ_TYPE_REGISTERS: Final = {
+    registers.REG_EXTRACT_AQ_1: (
+        registers.REG_AQ_SENSOR1_TYPE,
+        OutdoorHumiditySensor.SENSOR1,
+    ),
+    registers.REG_EXTRACT_AQ_2: (
+        registers.REG_AQ_SENSOR2_TYPE,
+        OutdoorHumiditySensor.SENSOR2,
+    ),
+}
 
 
 def create_aq_sensor(
     coordinator: KomfoventCoordinator, register_id: int
 ) -> KomfoventSensor | None:
     """Create an air quality sensor if installed."""
-    if not coordinator.data:
-        return None
-
-    if register_id == registers.REG_EXTRACT_AQ_1:
-        sensor_type_int = coordinator.data.get(registers.REG_AQ_SENSOR1_TYPE)
-    elif register_id == registers.REG_EXTRACT_AQ_2:
-        sensor_type_int = coordinator.data.get(registers.REG_AQ_SENSOR2_TYPE)
-    else:
-        sensor_type_int = AirQualitySensorType.NOT_INSTALLED
-
-    sensor_type = AirQualitySensorType(sensor_type_int)
-
-    if sensor_type == AirQualitySensorType.NOT_INSTALLED:
+    if not coordinator.data or register_id not in AQ_TYPE_REGISTERS:
         return None
 
-    if sensor_type == AirQualitySensorType.CO2:
-        key = "extract_co2"
-        name = "Extract CO2"
-        sensor_class = CO2Sensor
-        unit = CONCENTRATION_PARTS_PER_MILLION
-        device_class = SensorDeviceClass.CO2
-    elif sensor_type == AirQualitySensorType.VOC:
-        key = "extract_voc"
-        name = "Extract VOC"
-        sensor_class = VOCSensor
-        unit = PERCENTAGE
-        device_class = None
-    elif sensor_type == AirQualitySensorType.HUMIDITY:
-        outdoor_humidity_sensor = coordinator.data.get(
-            registers.REG_AQ_OUTDOOR_HUMIDITY
-        )
-        is_outdoor = (
-            register_id == registers.REG_EXTRACT_AQ_1
-            and outdoor_humidity_sensor == OutdoorHumiditySensor.SENSOR1
-        ) or (
-            register_id == registers.REG_EXTRACT_AQ_2
-            and outdoor_humidity_sensor == OutdoorHumiditySensor.SENSOR2
-        )
+    type_register, outdoor_sensor = AQ_TYPE_REGISTERS[register_id]
+    sensor_type = coordinator.data.get(
+        type_register, AirQualitySensorType.NOT_INSTALLED
+    )
 
-        if is_outdoor:
-            key = "outdoor_humidity"
-            name = "Outdoor Humidity"
-        else:
-            key = "extract_humidity"
-            name = "Extract Humidity"
-
-        sensor_class = RelativeHumiditySensor
-        unit = PERCENTAGE
-        device_class = SensorDeviceClass.HUMIDITY
-    else:
+    if (
+        sensor_type == AirQualitySensorType.HUMIDITY
+        and coordinator.data.get(registers.REG_AQ_OUTDOOR_HUMIDITY) == outdoor_sensor
+    ):
+        spec = OUTDOOR_HUMIDITY_SENSOR
+    elif (spec := AQ_SENSOR_DESCRIPTIONS.get(sensor_type)) is None:
         return None
 
-    return sensor_class(
+    sensor_cls, description = spec
+    return sensor_cls(
         coordinator=coordinator,
         register_id=register_id,
-        entity_description=SensorEntityDescription(
-            key=key,
-            name=name,
-            native_unit_of_measurement=unit,
-            device_class=device_class,
-            state_class=SensorStateClass.MEASUREMENT,
-            suggested_display_precision=0,
-        ),
+        entity_description=description,
     )
 
 
-async def create_sensors(coordinator: KomfoventCoordinator) -> list[KomfoventSensor]:
+def create_sensors(coordinator: KomfoventCoordinator) -> list[KomfoventSensor]:
     """Get list of sensor entities."""
-    entities = []
-
-    # Add core sensors
-    entities.extend(
-        [
-            TemperatureSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_SUPPLY_TEMP,
-                entity_description=SensorEntityDescription(
-                    key="supply_temperature",
-                    name="Supply Temperature",
-                    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=1,
-                ),
-            ),
-            TemperatureSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_EXTRACT_TEMP,
-                entity_description=SensorEntityDescription(
-                    key="extract_temperature",
-                    name="Extract Temperature",
-                    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=1,
-                ),
-            ),
-            TemperatureSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_OUTDOOR_TEMP,
-                entity_description=SensorEntityDescription(
-                    key="outdoor_temperature",
-                    name="Outdoor Temperature",
-                    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=1,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_SUPPLY_FAN,
-                entity_description=SensorEntityDescription(
-                    key="supply_fan",
-                    name="Supply Fan",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_EXTRACT_FAN,
-                entity_description=SensorEntityDescription(
-                    key="extract_fan",
-                    name="Extract Fan",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_HEAT_EXCHANGER,
-                entity_description=SensorEntityDescription(
-                    key="heat_exchanger",
-                    name="Heat Exchanger",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_ELECTRIC_HEATER,
-                entity_description=SensorEntityDescription(
-                    key="electric_heater",
-                    name="Electric Heater",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_WATER_HEATER,
-                entity_description=SensorEntityDescription(
-                    key="water_heater",
-                    name="Water Heater",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_WATER_COOLER,
-                entity_description=SensorEntityDescription(
-                    key="water_cooler",
-                    name="Water Cooler",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            DutyCycleSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_DX_UNIT,
-                entity_description=SensorEntityDescription(
-                    key="dx_unit",
-                    name="DX Unit",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_FILTER_CLOGGING,
-                entity_description=SensorEntityDescription(
-                    key="filter_clogging",
-                    name="Filter Clogging",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_AIR_DAMPERS,
-                entity_description=SensorEntityDescription(
-                    key="air_dampers",
-                    name="Air Dampers",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_POWER_CONSUMPTION,
-                entity_description=SensorEntityDescription(
-                    key="power_consumption",
-                    name="Power Consumption",
-                    native_unit_of_measurement=UnitOfPower.WATT,
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_HEATER_POWER,
-                entity_description=SensorEntityDescription(
-                    key="heater_power",
-                    name="Heater Power",
-                    native_unit_of_measurement=UnitOfPower.WATT,
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_HEAT_RECOVERY,
-                entity_description=SensorEntityDescription(
-                    key="heat_recovery",
-                    name="Heat Recovery",
-                    native_unit_of_measurement=UnitOfPower.WATT,
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_HEAT_EFFICIENCY,
-                entity_description=SensorEntityDescription(
-                    key="heat_exchanger_efficiency",
-                    name="Heat Exchanger Efficiency",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            KomfoventSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_ENERGY_SAVING,
-                entity_description=SensorEntityDescription(
-                    key="energy_saving",
-                    name="Energy Saving",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            ConnectedPanelsSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_CONNECTED_PANELS,
-                entity_description=SensorEntityDescription(
-                    key="connected_panels",
-                    name="Connected Panels",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            HeatExchangerTypeSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_HEAT_EXCHANGER_TYPE,
-                entity_description=SensorEntityDescription(
-                    key="heat_exchanger_type",
-                    name="Heat Exchanger Type",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            FlowSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_MAX_SUPPLY_FLOW,
-                entity_description=SensorEntityDescription(
-                    key="max_supply_flow",
-                    name="Maximum Supply Flow",
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            FlowSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_MAX_EXTRACT_FLOW,
-                entity_description=SensorEntityDescription(
-                    key="max_extract_flow",
-                    name="Maximum Extract Flow",
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-            FlowSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_SUPPLY_FLOW,
-                entity_description=SensorEntityDescription(
-                    key="supply_flow",
-                    name="Supply Flow",
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            FlowSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_EXTRACT_FLOW,
-                entity_description=SensorEntityDescription(
-                    key="extract_flow",
-                    name="Extract Flow",
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                ),
-            ),
-            FirmwareVersionSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_FIRMWARE,
-                entity_description=SensorEntityDescription(
-                    key="controller_firmware",
-                    name="Controller firmware",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                ),
-            ),
-            SystemTimeSensor(
-                coordinator=coordinator,
-                register_id=registers.REG_EPOCH_TIME,
-                entity_description=SensorEntityDescription(
-                    key="system_time",
-                    name="System Time",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    device_class=SensorDeviceClass.TIMESTAMP,
-                    entity_registry_enabled_default=False,
-                ),
-            ),
-        ]
-    )
+    data = coordinator.data or {}
+    descriptions = list(SENSOR_DESCRIPTIONS)
 
     # Flow, SPI and total energy counters only available on C6 and C6M controllers
-    if coordinator.controller in {Controller.C6, Controller.C6M}:
-        entities.extend(
-            [
-                FlowUnitSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_FLOW_UNIT,
-                    entity_description=SensorEntityDescription(
-                        key="flow_unit",
-                        name="Flow Unit",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-                SPISensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_SPI,
-                    entity_description=SensorEntityDescription(
-                        key="specific_power_input",
-                        name="Specific Power Input",
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=2,
-                    ),
-                ),
-                FloatX1000Sensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_AHU_TOTAL,
-                    entity_description=SensorEntityDescription(
-                        key="total_ahu_energy",
-                        name="Total AHU Energy",
-                        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        device_class=SensorDeviceClass.ENERGY,
-                        state_class=SensorStateClass.TOTAL_INCREASING,
-                        suggested_display_precision=3,
-                    ),
-                ),
-                FloatX1000Sensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_HEATER_TOTAL,
-                    entity_description=SensorEntityDescription(
-                        key="total_heater_energy",
-                        name="Total Heater Energy",
-                        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        device_class=SensorDeviceClass.ENERGY,
-                        state_class=SensorStateClass.TOTAL_INCREASING,
-                        suggested_display_precision=3,
-                    ),
-                ),
-                FloatX1000Sensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_RECOVERY_TOTAL,
-                    entity_description=SensorEntityDescription(
-                        key="total_recovered_energy",
-                        name="Total Recovered Energy",
-                        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        device_class=SensorDeviceClass.ENERGY,
-                        state_class=SensorStateClass.TOTAL_INCREASING,
-                        suggested_display_precision=3,
-                    ),
-                ),
-            ]
-        )
+    if coordinator.controller in C6_CONTROLLERS:
+        descriptions.extend(C6_SENSOR_DESCRIPTIONS)
 
     # Add pressure sensors if using a flow control mode is variable air volume
-    if (
-        coordinator.data
-        and coordinator.data.get(registers.REG_FLOW_CONTROL) == FlowControl.VARIABLE
-    ):
-        entities.extend(
-            [
-                KomfoventSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_MAX_SUPPLY_PRESSURE,
-                    entity_description=SensorEntityDescription(
-                        key="max_supply_pressure",
-                        name="Maximum Supply Pressure",
-                        native_unit_of_measurement=UnitOfPressure.PA,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    ),
-                ),
-                KomfoventSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_MAX_EXTRACT_PRESSURE,
-                    entity_description=SensorEntityDescription(
-                        key="max_extract_pressure",
-                        name="Maximum Extract Pressure",
-                        native_unit_of_measurement=UnitOfPressure.PA,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    ),
-                ),
-                KomfoventSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_SUPPLY_PRESSURE,
-                    entity_description=SensorEntityDescription(
-                        key="supply_pressure",
-                        name="Supply Pressure",
-                        native_unit_of_measurement=UnitOfPressure.PA,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                    ),
-                ),
-                KomfoventSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_EXTRACT_PRESSURE,
-                    entity_description=SensorEntityDescription(
-                        key="extract_pressure",
-                        name="Extract Pressure",
-                        native_unit_of_measurement=UnitOfPressure.PA,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                    ),
-                ),
-            ]
-        )
+    if data.get(registers.REG_FLOW_CONTROL) == FlowControl.VARIABLE:
+        descriptions.extend(VAV_SENSOR_DESCRIPTIONS)
 
     # Add indoor absolute humidity if value indicates sensor is present
-    indoor_humidity = coordinator.data.get(registers.REG_INDOOR_ABS_HUMIDITY)
+    indoor_humidity = data.get(registers.REG_INDOOR_ABS_HUMIDITY)
     if indoor_humidity is not None and indoor_humidity not in ABS_HUMIDITY_ERRORS:
-        entities.extend(
-            [
-                AbsoluteHumiditySensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_INDOOR_ABS_HUMIDITY,
-                    entity_description=SensorEntityDescription(
-                        key="indoor_absolute_humidity",
-                        name="Indoor Absolute Humidity",
-                        native_unit_of_measurement=CONCENTRATION_GRAMS_PER_CUBIC_METER,
-                        device_class=SensorDeviceClass.ABSOLUTE_HUMIDITY,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=2,
-                    ),
-                ),
-            ]
-        )
+        descriptions.append(INDOOR_ABS_HUMIDITY_SENSOR)
 
     # Add outdoor absolute humidity if value indicates sensor is present
-    outdoor_humidity = coordinator.data.get(registers.REG_OUTDOOR_ABS_HUMIDITY)
+    outdoor_humidity = data.get(registers.REG_OUTDOOR_ABS_HUMIDITY)
     if outdoor_humidity is not None and outdoor_humidity not in ABS_HUMIDITY_ERRORS:
-        entities.extend(
-            [
-                AbsoluteHumiditySensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_OUTDOOR_ABS_HUMIDITY,
-                    entity_description=SensorEntityDescription(
-                        key="outdoor_absolute_humidity",
-                        name="Outdoor Absolute Humidity",
-                        native_unit_of_measurement=CONCENTRATION_GRAMS_PER_CUBIC_METER,
-                        device_class=SensorDeviceClass.ABSOLUTE_HUMIDITY,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=2,
-                    ),
-                ),
-            ]
-        )
+        descriptions.append(OUTDOOR_ABS_HUMIDITY_SENSOR)
 
     # Add exhaust temperature if value is present
-    if coordinator.data and registers.REG_EXHAUST_TEMP in coordinator.data:
-        entities.extend(
-            [
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_EXHAUST_TEMP,
-                    entity_description=SensorEntityDescription(
-                        key="exhaust_temperature",
-                        name="Exhaust Temperature",
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
-                ),
-            ]
-        )
+    if registers.REG_EXHAUST_TEMP in data:
+        descriptions.append(EXHAUST_TEMP_SENSOR)
 
     # Add panel 1 sensors if panel is present
-    if coordinator.data and coordinator.data.get(registers.REG_CONNECTED_PANELS) in [
-        ConnectedPanels.PANEL1,
-        ConnectedPanels.BOTH,
-    ]:
-        entities.extend(
-            [
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL1_TEMP,
-                    entity_description=SensorEntityDescription(
-                        key="panel_1_temperature",
-                        name="Panel 1 Temperature",
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
-                ),
-                RelativeHumiditySensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL1_RH,
-                    entity_description=SensorEntityDescription(
-                        key="panel_1_humidity",
-                        name="Panel 1 Humidity",
-                        native_unit_of_measurement=PERCENTAGE,
-                        device_class=SensorDeviceClass.HUMIDITY,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                    ),
-                ),
-                FirmwareVersionSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL1_FW,
-                    entity_description=SensorEntityDescription(
-                        key="panel_1_firmware",
-                        name="Panel 1 firmware",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    ),
-                ),
-            ]
-        )
+    if data.get(registers.REG_CONNECTED_PANELS) in PANEL1_CONNECTED:
+        descriptions.extend(PANEL1_SENSOR_DESCRIPTIONS)
 
     # Add panel 2 sensors if panel is present
-    if coordinator.data and coordinator.data.get(registers.REG_CONNECTED_PANELS) in [
-        ConnectedPanels.PANEL2,
-        ConnectedPanels.BOTH,
-    ]:
-        entities.extend(
-            [
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL2_TEMP,
-                    entity_description=SensorEntityDescription(
-                        key="panel_2_temperature",
-                        name="Panel 2 Temperature",
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=1,
-                    ),
-                ),
-                RelativeHumiditySensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL2_RH,
-                    entity_description=SensorEntityDescription(
-                        key="panel_2_humidity",
-                        name="Panel 2 Humidity",
-                        native_unit_of_measurement=PERCENTAGE,
-                        device_class=SensorDeviceClass.HUMIDITY,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                    ),
-                ),
-                FirmwareVersionSensor(
-                    coordinator=coordinator,
-                    register_id=registers.REG_PANEL2_FW,
-                    entity_description=SensorEntityDescription(
-                        key="panel_2_firmware",
-                        name="Panel 2 firmware",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    ),
-                ),
-            ]
+    if data.get(registers.REG_CONNECTED_PANELS) in PANEL2_CONNECTED:
+        descriptions.extend(PANEL2_SENSOR_DESCRIPTIONS)
+
+    entities = [
+        sensor_cls(
+            coordinator=coordinator,
+            register_id=register_id,
+            entity_description=description,
         )
+        for sensor_cls, register_id, description in descriptions
+    ]
 
     # Add AQ sensors if installed
-    if aq_sensor := create_aq_sensor(coordinator, registers.REG_EXTRACT_AQ_1):
-        entities.append(aq_sensor)
-    if aq_sensor := create_aq_sensor(coordinator, registers.REG_EXTRACT_AQ_2):
-        entities.append(aq_sensor)
+    entities.extend(
+        aq_sensor
+        for register_id in AQ_TYPE_REGISTERS
+        if (aq_sensor := create_aq_sensor(coordinator, register_id))
+    )
 
     return entities
 
@@ -708,12 +177,14 @@ async def async_setup_entry(
     """Set up the Komfovent sensors."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(await create_sensors(coordinator))
+    async_add_entities(create_sensors(coordinator))
 
 
 class KomfoventSensor(CoordinatorEntity["KomfoventCoordinator"], SensorEntity):
     """Base representation of a Komfovent sensor."""
 
+    __slots__ = ("register_id",)
+
     _attr_has_entity_name = True
     coordinator: KomfoventCoordinator
 
@@ -727,33 +198,39 @@ class KomfoventSensor(CoordinatorEntity["KomfoventCoordinator"], SensorEntity):
         super().__init__(coordinator)
         self.register_id = register_id
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return None
 
-        return self.coordinator.data.get(self.register_id)
+        return data.get(self.register_id)
 
 
 class FloatSensor(KomfoventSensor):
-    """Temperature sensor with x10 scaling."""
+    """Sensor that reports its value as a float, divided by a fixed scale."""
+
+    __slots__ = ()
+
+    scale: ClassVar[int] = 1
 
     @property
     def native_value(self) -> float | None:
         """Return the float value of the sensor."""
-        value = super().native_value
+        data = self.coordinator.data
+        if not data:
+            return None
+
+        value = data.get(self.register_id)
         if value is None:
             return None
 
         try:
-            return float(value)  # type: ignore[arg-type]
+            return float(value) / self.scale
         except (ValueError, TypeError):
             return None
 
@@ -761,48 +238,32 @@ class FloatSensor(KomfoventSensor):
 class FloatX10Sensor(FloatSensor):
     """Sensor that divides its value by 10."""
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the sensor value divided by 10."""
-        value = super().native_value
-        if value is None:
-            return None
+    __slots__ = ()
 
-        return value / 10
+    scale = 10
 
 
 class FloatX100Sensor(FloatSensor):
     """Sensor that divides its value by 100."""
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the value divided by 100."""
-        value = super().native_value
-        if value is None:
-            return None
+    __slots__ = ()
 
-        return value / 100
+    scale = 100
 
 
-class FloatX1000Sensor(KomfoventSensor):
+class FloatX1000Sensor(FloatSensor):
     """Sensor that divides its value by 1000."""
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the energy value in kWh."""
-        raw_value = super().native_value
-        if raw_value is None:
-            return None
+    __slots__ = ()
 
-        try:
-            return float(raw_value) / 1000  # type: ignore[arg-type]
-        except (ValueError, TypeError):
-            return None
+    scale = 1000
 
 
 class FirmwareVersionSensor(KomfoventSensor):
     """Firmware version sensor."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> str | None:
         """Return the firmware version string."""
@@ -825,6 +286,8 @@ class FirmwareVersionSensor(KomfoventSensor):
 class DutyCycleSensor(FloatX10Sensor):
     """Temperature sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> float | None:
         """Return the temperature value if within valid range."""
@@ -840,6 +303,8 @@ class DutyCycleSensor(FloatX10Sensor):
 class TemperatureSensor(FloatX10Sensor):
     """Temperature sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> float | None:
         """Return the temperature value if within valid range."""
@@ -855,6 +320,8 @@ class TemperatureSensor(FloatX10Sensor):
 class RelativeHumiditySensor(KomfoventSensor):
     """Humidity sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> int | None:
         """Return the humidity value if within valid range."""
@@ -875,6 +342,8 @@ class RelativeHumiditySensor(KomfoventSensor):
 class AbsoluteHumiditySensor(FloatX100Sensor):
     """Humidity sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> float | None:
         """Return the humidity value if within valid range."""
@@ -890,6 +359,8 @@ class AbsoluteHumiditySensor(FloatX100Sensor):
 class CO2Sensor(KomfoventSensor):
     """CO2 sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> int | None:
         """Return the CO2 value if within valid range."""
@@ -910,6 +381,8 @@ class CO2Sensor(KomfoventSensor):
 class SPISensor(FloatX1000Sensor):
     """SPI sensor with scaling and range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> float | None:
         """Return the SPI value if within valid range."""
@@ -925,6 +398,8 @@ class SPISensor(FloatX1000Sensor):
 class VOCSensor(KomfoventSensor):
     """VOC sensor with range validation."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> int | None:
         """Return the VOC value if within valid range."""
@@ -945,80 +420,76 @@ class VOCSensor(KomfoventSensor):
 class FlowSensor(FloatSensor):
     """Flow sensor with dynamic units based on flow unit setting."""
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data:
-            return None
+    __slots__ = ()
 
-        if self.coordinator.controller in {Controller.C6, Controller.C6M}:
-            flow_control = self.coordinator.data.get(registers.REG_FLOW_CONTROL)
-            if flow_control == FlowControl.OFF:
-                return PERCENTAGE
+    def __init__(
+        self,
+        coordinator: KomfoventCoordinator,
+        register_id: int,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the flow sensor."""
+        super().__init__(coordinator, register_id, entity_description)
+        self._attr_native_unit_of_measurement = get_flow_unit(self.coordinator)
 
-            flow_unit = self.coordinator.data.get(registers.REG_FLOW_UNIT)
-            if flow_unit == FlowUnit.M3H:
-                return UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR
-            if flow_unit == FlowUnit.LS:
-                return UnitOfVolumeFlowRate.LITERS_PER_SECOND
-        elif self.coordinator.controller == Controller.C8:
-            # no flow control or flow unit support
-            return PERCENTAGE
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the unit of measurement from the latest flow settings."""
+        if self.coordinator.controller is not Controller.C8:
+            self._attr_native_unit_of_measurement = get_flow_unit(self.coordinator)
+        super()._handle_coordinator_update()
 
-        return None
 
+class EnumSensor(KomfoventSensor):
+    """Sensor that reports an enum register as its lowercase member name."""
 
-class HeatExchangerTypeSensor(KomfoventSensor):
-    """Heat exchanger type sensor."""
+    __slots__ = ()
+
+    enum_class: ClassVar[type[IntEnum]]
 
     @property
     def native_value(self) -> str | None:
-        """Return the heat exchanger type name."""
-        raw_value = super().native_value
-        if raw_value is None:
+        """Return the enum member name of the sensor value."""
+        data = self.coordinator.data
+        if not data:
             return None
 
-        try:
-            return HeatExchangerType(raw_value).name.lower()  # type: ignore[arg-type]
-        except (ValueError, TypeError):
+        value = data.get(self.register_id)
+        if value is None:
             return None
 
+        return option_names(self.enum_class).get(value)
+
+
+class HeatExchangerTypeSensor(EnumSensor):
+    """Heat exchanger type sensor."""
+
+    __slots__ = ()
+
+    enum_class = HeatExchangerType
 
-class ConnectedPanelsSensor(KomfoventSensor):
+
+class ConnectedPanelsSensor(EnumSensor):
     """Connected panels sensor."""
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the connected panels state name."""
-        raw_value = super().native_value
-        if raw_value is None:
-            return None
+    __slots__ = ()
 
-        try:
-            return ConnectedPanels(raw_value).name.lower()  # type: ignore[arg-type]
-        except (ValueError, TypeError):
-            return None
+    enum_class = ConnectedPanels
 
 
-class FlowUnitSensor(KomfoventSensor):
+class FlowUnitSensor(EnumSensor):
     """Flow unit sensor."""
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the flow units state name."""
-        raw_value = super().native_value
-        if raw_value is None:
-            return None
+    __slots__ = ()
 
-        try:
-            return FlowUnit(raw_value).name.lower()  # type: ignore[arg-type]
-        except (ValueError, TypeError):
-            return None
+    enum_class = FlowUnit
 
 
 class SystemTimeSensor(KomfoventSensor):
     """System time sensor."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> datetime | None:
         """Return the system time as datetime from Unix timestamp."""
@@ -1028,11 +499,475 @@ class SystemTimeSensor(KomfoventSensor):
 
         try:
             value = int(raw_value)  # type: ignore[arg-type]
-            # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-            local_tz = zoneinfo.ZoneInfo(str(self.coordinator.hass.config.time_zone))
-            local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
-
-            # Convert seconds since local epoch to datetime
-            return local_epoch + timedelta(seconds=value)
-        except (ValueError, TypeError, OSError):
+            local_tz = get_local_epoch(
+                str(self.coordinator.hass.config.time_zone)
+            ).tzinfo
+
+            # Seconds since local epoch count wall-clock time, so convert them as UTC
+            # and attach the local timezone
+            return datetime.fromtimestamp(value, tz=UTC).replace(tzinfo=local_tz)
+        except (ValueError, TypeError, OSError, OverflowError):
             return None
+
+
+PERCENTAGE_TEMPLATE: Final = SensorEntityDescription(
+    key="percentage",
+    native_unit_of_measurement=PERCENTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+)
+
+TEMPERATURE_TEMPLATE: Final = SensorEntityDescription(
+    key="temperature",
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=1,
+)
+
+HUMIDITY_TEMPLATE: Final = SensorEntityDescription(
+    key="humidity",
+    native_unit_of_measurement=PERCENTAGE,
+    device_class=SensorDeviceClass.HUMIDITY,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+)
+
+POWER_TEMPLATE: Final = SensorEntityDescription(
+    key="power",
+    native_unit_of_measurement=UnitOfPower.WATT,
+    device_class=SensorDeviceClass.POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+)
+
+ENERGY_TEMPLATE: Final = SensorEntityDescription(
+    key="energy",
+    native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    suggested_display_precision=3,
+)
+
+SensorDescription = tuple[type[KomfoventSensor], int, SensorEntityDescription]
+
+SENSOR_DESCRIPTIONS: Final[tuple[SensorDescription, ...]] = (
+    (
+        TemperatureSensor,
+        registers.REG_SUPPLY_TEMP,
+        replace(
+            TEMPERATURE_TEMPLATE,
+            key="supply_temperature",
+            name="Supply Temperature",
+        ),
+    ),
+    (
+        TemperatureSensor,
+        registers.REG_EXTRACT_TEMP,
+        replace(
+            TEMPERATURE_TEMPLATE,
+            key="extract_temperature",
+            name="Extract Temperature",
+        ),
+    ),
+    (
+        TemperatureSensor,
+        registers.REG_OUTDOOR_TEMP,
+        replace(
+            TEMPERATURE_TEMPLATE,
+            key="outdoor_temperature",
+            name="Outdoor Temperature",
+        ),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_SUPPLY_FAN,
+        replace(PERCENTAGE_TEMPLATE, key="supply_fan", name="Supply Fan"),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_EXTRACT_FAN,
+        replace(PERCENTAGE_TEMPLATE, key="extract_fan", name="Extract Fan"),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_HEAT_EXCHANGER,
+        replace(PERCENTAGE_TEMPLATE, key="heat_exchanger", name="Heat Exchanger"),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_ELECTRIC_HEATER,
+        replace(PERCENTAGE_TEMPLATE, key="electric_heater", name="Electric Heater"),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_WATER_HEATER,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="water_heater",
+            name="Water Heater",
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_WATER_COOLER,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="water_cooler",
+            name="Water Cooler",
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        DutyCycleSensor,
+        registers.REG_DX_UNIT,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="dx_unit",
+            name="DX Unit",
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_FILTER_CLOGGING,
+        replace(PERCENTAGE_TEMPLATE, key="filter_clogging", name="Filter Clogging"),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_AIR_DAMPERS,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="air_dampers",
+            name="Air Dampers",
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_POWER_CONSUMPTION,
+        replace(POWER_TEMPLATE, key="power_consumption", name="Power Consumption"),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_HEATER_POWER,
+        replace(POWER_TEMPLATE, key="heater_power", name="Heater Power"),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_HEAT_RECOVERY,
+        replace(POWER_TEMPLATE, key="heat_recovery", name="Heat Recovery"),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_HEAT_EFFICIENCY,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="heat_exchanger_efficiency",
+            name="Heat Exchanger Efficiency",
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_ENERGY_SAVING,
+        replace(
+            PERCENTAGE_TEMPLATE,
+            key="energy_saving",
+            name="Energy Saving",
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        ConnectedPanelsSensor,
+        registers.REG_CONNECTED_PANELS,
+        SensorEntityDescription(
+            key="connected_panels",
+            name="Connected Panels",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        HeatExchangerTypeSensor,
+        registers.REG_HEAT_EXCHANGER_TYPE,
+        SensorEntityDescription(
+            key="heat_exchanger_type",
+            name="Heat Exchanger Type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        FlowSensor,
+        registers.REG_MAX_SUPPLY_FLOW,
+        SensorEntityDescription(
+            key="max_supply_flow",
+            name="Maximum Supply Flow",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        FlowSensor,
+        registers.REG_MAX_EXTRACT_FLOW,
+        SensorEntityDescription(
+            key="max_extract_flow",
+            name="Maximum Extract Flow",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        FlowSensor,
+        registers.REG_SUPPLY_FLOW,
+        SensorEntityDescription(
+            key="supply_flow",
+            name="Supply Flow",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+    ),
+    (
+        FlowSensor,
+        registers.REG_EXTRACT_FLOW,
+        SensorEntityDescription(
+            key="extract_flow",
+            name="Extract Flow",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+    ),
+    (
+        FirmwareVersionSensor,
+        registers.REG_FIRMWARE,
+        SensorEntityDescription(
+            key="controller_firmware",
+            name="Controller firmware",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+    (
+        SystemTimeSensor,
+        registers.REG_EPOCH_TIME,
+        SensorEntityDescription(
+            key="system_time",
+            name="System Time",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.TIMESTAMP,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+)
+
+C6_SENSOR_DESCRIPTIONS: Final[tuple[SensorDescription, ...]] = (
+    (
+        FlowUnitSensor,
+        registers.REG_FLOW_UNIT,
+        SensorEntityDescription(
+            key="flow_unit",
+            name="Flow Unit",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+    ),
+    (
+        SPISensor,
+        registers.REG_SPI,
+        SensorEntityDescription(
+            key="specific_power_input",
+            name="Specific Power Input",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=2,
+        ),
+    ),
+    (
+        FloatX1000Sensor,
+        registers.REG_AHU_TOTAL,
+        replace(ENERGY_TEMPLATE, key="total_ahu_energy", name="Total AHU Energy"),
+    ),
+    (
+        FloatX1000Sensor,
+        registers.REG_HEATER_TOTAL,
+        replace(ENERGY_TEMPLATE, key="total_heater_energy", name="Total Heater Energy"),
+    ),
+    (
+        FloatX1000Sensor,
+        registers.REG_RECOVERY_TOTAL,
+        replace(
+            ENERGY_TEMPLATE,
+            key="total_recovered_energy",
+            name="Total Recovered Energy",
+        ),
+    ),
+)
+
+VAV_SENSOR_DESCRIPTIONS: Final[tuple[SensorDescription, ...]] = (
+    (
+        KomfoventSensor,
+        registers.REG_MAX_SUPPLY_PRESSURE,
+        SensorEntityDescription(
+            key="max_supply_pressure",
+            name="Maximum Supply Pressure",
+            native_unit_of_measurement=UnitOfPressure.PA,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_MAX_EXTRACT_PRESSURE,
+        SensorEntityDescription(
+            key="max_extract_pressure",
+            name="Maximum Extract Pressure",
+            native_unit_of_measurement=UnitOfPressure.PA,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_SUPPLY_PRESSURE,
+        SensorEntityDescription(
+            key="supply_pressure",
+            name="Supply Pressure",
+            native_unit_of_measurement=UnitOfPressure.PA,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+    ),
+    (
+        KomfoventSensor,
+        registers.REG_EXTRACT_PRESSURE,
+        SensorEntityDescription(
+            key="extract_pressure",
+            name="Extract Pressure",
+            native_unit_of_measurement=UnitOfPressure.PA,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+    ),
+)
+
+INDOOR_ABS_HUMIDITY_SENSOR: Final[SensorDescription] = (
+    AbsoluteHumiditySensor,
+    registers.REG_INDOOR_ABS_HUMIDITY,
+    SensorEntityDescription(
+        key="indoor_absolute_humidity",
+        name="Indoor Absolute Humidity",
+        native_unit_of_measurement=CONCENTRATION_GRAMS_PER_CUBIC_METER,
+        device_class=SensorDeviceClass.ABSOLUTE_HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+)
+
+OUTDOOR_ABS_HUMIDITY_SENSOR: Final[SensorDescription] = (
+    AbsoluteHumiditySensor,
+    registers.REG_OUTDOOR_ABS_HUMIDITY,
+    SensorEntityDescription(
+        key="outdoor_absolute_humidity",
+        name="Outdoor Absolute Humidity",
+        native_unit_of_measurement=CONCENTRATION_GRAMS_PER_CUBIC_METER,
+        device_class=SensorDeviceClass.ABSOLUTE_HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+)
+
+EXHAUST_TEMP_SENSOR: Final[SensorDescription] = (
+    TemperatureSensor,
+    registers.REG_EXHAUST_TEMP,
+    replace(
+        TEMPERATURE_TEMPLATE,
+        key="exhaust_temperature",
+        name="Exhaust Temperature",
+    ),
+)
+
+PANEL1_SENSOR_DESCRIPTIONS: Final[tuple[SensorDescription, ...]] = (
+    (
+        TemperatureSensor,
+        registers.REG_PANEL1_TEMP,
+        replace(
+            TEMPERATURE_TEMPLATE,
+            key="panel_1_temperature",
+            name="Panel 1 Temperature",
+        ),
+    ),
+    (
+        RelativeHumiditySensor,
+        registers.REG_PANEL1_RH,
+        replace(HUMIDITY_TEMPLATE, key="panel_1_humidity", name="Panel 1 Humidity"),
+    ),
+    (
+        FirmwareVersionSensor,
+        registers.REG_PANEL1_FW,
+        SensorEntityDescription(
+            key="panel_1_firmware",
+            name="Panel 1 firmware",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+)
+
+PANEL2_SENSOR_DESCRIPTIONS: Final[tuple[SensorDescription, ...]] = (
+    (
+        TemperatureSensor,
+        registers.REG_PANEL2_TEMP,
+        replace(
+            TEMPERATURE_TEMPLATE,
+            key="panel_2_temperature",
+            name="Panel 2 Temperature",
+        ),
+    ),
+    (
+        RelativeHumiditySensor,
+        registers.REG_PANEL2_RH,
+        replace(HUMIDITY_TEMPLATE, key="panel_2_humidity", name="Panel 2 Humidity"),
+    ),
+    (
+        FirmwareVersionSensor,
+        registers.REG_PANEL2_FW,
+        SensorEntityDescription(
+            key="panel_2_firmware",
+            name="Panel 2 firmware",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+)
+
+AQSensorDescription = tuple[type[KomfoventSensor], SensorEntityDescription]
+
+AQ_SENSOR_DESCRIPTIONS: Final[dict[int, AQSensorDescription]] = {
+    AirQualitySensorType.CO2: (
+        CO2Sensor,
+        SensorEntityDescription(
+            key="extract_co2",
+            name="Extract CO2",
+            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+            device_class=SensorDeviceClass.CO2,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+    ),
+    AirQualitySensorType.VOC: (
+        VOCSensor,
+        replace(PERCENTAGE_TEMPLATE, key="extract_voc", name="Extract VOC"),
+    ),
+    AirQualitySensorType.HUMIDITY: (
+        RelativeHumiditySensor,
+        replace(HUMIDITY_TEMPLATE, key="extract_humidity", name="Extract Humidity"),
+    ),
+}
+
+OUTDOOR_HUMIDITY_SENSOR: Final[AQSensorDescription] = (
+    RelativeHumiditySensor,
+    replace(HUMIDITY_TEMPLATE, key="outdoor_humidity", name="Outdoor Humidity"),
+)
@@ -1,7 +1,6 @@
 """Services for Komfovent integration."""
 
 import logging
-import zoneinfo
 from datetime import datetime
 
 from homeassistant.core import HomeAssistant, ServiceCall
@@ -9,11 +8,29 @@ from homeassistant.helpers import device_registry as dr
 
 from . import KomfoventCoordinator, registers
 from .const import DOMAIN, OperationMode
+from .helpers import get_local_epoch
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_MODE_TIMER = 60
 
+# Modes selected by writing the operation mode register directly
+REGISTER_MODES = frozenset(
+    {
+        OperationMode.AWAY,
+        OperationMode.NORMAL,
+        OperationMode.INTENSIVE,
+        OperationMode.BOOST,
+    }
+)
+
+# Modes activated by writing their timer register (minutes)
+MODE_TIMERS = {
+    OperationMode.KITCHEN: registers.REG_KITCHEN_TIMER,
+    OperationMode.FIREPLACE: registers.REG_FIREPLACE_TIMER,
+    OperationMode.OVERRIDE: registers.REG_OVERRIDE_TIMER,
+}
+
 
 def get_coordinator_for_device(
     hass: HomeAssistant, device_id: str
@@ -31,7 +48,7 @@ def get_coordinator_for_device(
 
 async def clean_filters_calibration(coordinator: KomfoventCoordinator) -> None:
     """Reset filters counter."""
-    await coordinator.client.write(registers.REG_CLEAN_FILTERS, 1)
+    await coordinator.async_write(registers.REG_CLEAN_FILTERS, 1)
 
 
 async def set_operation_mode(
@@ -45,61 +62,42 @@ async def set_operation_mode(
         return
 
     if operation_mode == OperationMode.OFF:
-        await coordinator.client.write(registers.REG_POWER, 0)
+        write = (registers.REG_POWER, 0)
     elif operation_mode == OperationMode.AIR_QUALITY:
-        await coordinator.client.write(registers.REG_AUTO_MODE, 1)
-    elif operation_mode in {
-        OperationMode.AWAY,
-        OperationMode.NORMAL,
-        OperationMode.INTENSIVE,
-        OperationMode.BOOST,
-    }:
-        await coordinator.client.write(
-            registers.REG_OPERATION_MODE, operation_mode.value
-        )
-    elif operation_mode == OperationMode.KITCHEN:
-        await coordinator.client.write(
-            registers.REG_KITCHEN_TIMER,
-            minutes
-            or coordinator.data.get(registers.REG_KITCHEN_TIMER)
-            or DEFAULT_MODE_TIMER,
-        )
-    elif operation_mode == OperationMode.FIREPLACE:
-        await coordinator.client.write(
-            registers.REG_FIREPLACE_TIMER,
-            minutes
-            or coordinator.data.get(registers.REG_FIREPLACE_TIMER)
-            or DEFAULT_MODE_TIMER,
-        )
-    elif operation_mode == OperationMode.OVERRIDE:
-        await coordinator.client.write(
-            registers.REG_OVERRIDE_TIMER,
-            minutes
-            or coordinator.data.get(registers.REG_OVERRIDE_TIMER)
-            or DEFAULT_MODE_TIMER,
+        write = (registers.REG_AUTO_MODE, 1)
+    elif operation_mode in REGISTER_MODES:
+        write = (registers.REG_OPERATION_MODE, operation_mode.value)
+    elif (timer := MODE_TIMERS.get(operation_mode)) is not None:
+        write = (
+            timer,
+            minutes or coordinator.data.get(timer) or DEFAULT_MODE_TIMER,
         )
     else:
         # Log a warning, don't change the mode and proceed to request a refresh
         _LOGGER.warning("Unsupported operation mode: %s", mode)
+        write = None
 
     # Set cooldown to allow the controller to process the command before next poll
     coordinator.set_cooldown(1.0)
 
-    # Refresh the coordinator data to reflect the changes
-    await coordinator.async_request_refresh()
+    # Write through the coordinator, which refreshes the data to reflect the changes
+    if write is None:
+        await coordinator.async_request_refresh()
+    else:
+        await coordinator.async_write(*write)
 
 
 async def set_system_time(coordinator: KomfoventCoordinator) -> None:
     """Set system time on the Komfovent unit."""
-    # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-    local_tz = zoneinfo.ZoneInfo(str(coordinator.hass.config.time_zone))
-    local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
+    local_epoch = get_local_epoch(str(coordinator.hass.config.time_zone))
 
     # Calculate local time as seconds since local epoch
-    local_time = int((datetime.now(tz=local_tz) - local_epoch).total_seconds())
+    local_time = int(
+        (datetime.now(tz=local_epoch.tzinfo) - local_epoch).total_seconds()
+    )
 
     # Write local time to the Komfovent unit
-    await coordinator.client.write(registers.REG_EPOCH_TIME, local_time)
+    await coordinator.async_write(registers.REG_EPOCH_TIME, local_time)
 
 
 async def async_register_services(hass: HomeAssistant) -> None:
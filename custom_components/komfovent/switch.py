@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 if TYPE_CHECKING:
@@ -17,189 +19,171 @@ if TYPE_CHECKING:
 
 from . import registers
 from .const import DOMAIN
-from .helpers import build_device_info
 
-
-async def create_switches(coordinator: KomfoventCoordinator) -> list[KomfoventSwitch]:
+HEATER_SWITCH_TEMPLATE: Final = SwitchEntityDescription(
+    key="electric_heater",
+    entity_registry_enabled_default=True,
+    entity_registry_visible_default=False,
+    entity_category=EntityCategory.CONFIG,
+)
+
+SWITCH_DESCRIPTIONS: Final[tuple[tuple[int, SwitchEntityDescription], ...]] = (
+    (
+        registers.REG_POWER,
+        SwitchEntityDescription(
+            key="power",
+            name="Power",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_ECO_MODE,
+        SwitchEntityDescription(
+            key="eco_mode",
+            name="ECO Mode",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_AUTO_MODE,
+        SwitchEntityDescription(
+            key="auto_mode",
+            name="AUTO Mode",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_AQ_IMPURITY_CONTROL,
+        SwitchEntityDescription(
+            key="aq_impurity_control",
+            name="AQ Impurity Control",
+            entity_registry_enabled_default=True,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        registers.REG_AQ_HUMIDITY_CONTROL,
+        SwitchEntityDescription(
+            key="aq_humidity_control",
+            name="AQ Humidity Control",
+            entity_registry_enabled_default=True,
+            entity_category=EntityCategory.CONFIG,
+        ),
+    ),
+    (
+        registers.REG_AQ_ELECTRIC_HEATER,
+        SwitchEntityDescription(
+            key="aq_electric_heater",
+            name="AQ Electric Heater",
+            entity_registry_enabled_default=True,
+        ),
+    ),
+    (
+        registers.REG_ECO_FREE_HEAT_COOL,
+        SwitchEntityDescription(
+            key="eco_free_heat_cool",
+            name="ECO Free Heating/Cooling",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_ECO_HEATER_BLOCKING,
+        SwitchEntityDescription(
+            key="eco_heater_blocking",
+            name="ECO Heater Blocking",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_ECO_COOLER_BLOCKING,
+        SwitchEntityDescription(
+            key="eco_cooler_blocking",
+            name="ECO Cooler Blocking",
+            entity_registry_enabled_default=True,
+            entity_category=None,
+        ),
+    ),
+    (
+        registers.REG_AWAY_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="away_electric_heater",
+            name="Away Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_NORMAL_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="normal_electric_heater",
+            name="Normal Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_INTENSIVE_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="intensive_electric_heater",
+            name="Intensive Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_BOOST_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="boost_electric_heater",
+            name="Boost Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_KITCHEN_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="kitchen_electric_heater",
+            name="Kitchen Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_FIREPLACE_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="fireplace_electric_heater",
+            name="Fireplace Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_OVERRIDE_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="override_electric_heater",
+            name="Override Electric Heater",
+        ),
+    ),
+    (
+        registers.REG_HOLIDAYS_HEATER,
+        replace(
+            HEATER_SWITCH_TEMPLATE,
+            key="holidays_electric_heater",
+            name="Holidays Electric Heater",
+        ),
+    ),
+)
+
+
+def create_switches(coordinator: KomfoventCoordinator) -> list[KomfoventSwitch]:
     """Create switch entities for Komfovent device."""
     return [
         KomfoventSwitch(
             coordinator=coordinator,
-            register_id=registers.REG_POWER,
-            entity_description=SwitchEntityDescription(
-                key="power",
-                name="Power",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_ECO_MODE,
-            entity_description=SwitchEntityDescription(
-                key="eco_mode",
-                name="ECO Mode",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_AUTO_MODE,
-            entity_description=SwitchEntityDescription(
-                key="auto_mode",
-                name="AUTO Mode",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_IMPURITY_CONTROL,
-            entity_description=SwitchEntityDescription(
-                key="aq_impurity_control",
-                name="AQ Impurity Control",
-                entity_registry_enabled_default=True,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_HUMIDITY_CONTROL,
-            entity_description=SwitchEntityDescription(
-                key="aq_humidity_control",
-                name="AQ Humidity Control",
-                entity_registry_enabled_default=True,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_AQ_ELECTRIC_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="aq_electric_heater",
-                name="AQ Electric Heater",
-                entity_registry_enabled_default=True,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_ECO_FREE_HEAT_COOL,
-            entity_description=SwitchEntityDescription(
-                key="eco_free_heat_cool",
-                name="ECO Free Heating/Cooling",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_ECO_HEATER_BLOCKING,
-            entity_description=SwitchEntityDescription(
-                key="eco_heater_blocking",
-                name="ECO Heater Blocking",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_ECO_COOLER_BLOCKING,
-            entity_description=SwitchEntityDescription(
-                key="eco_cooler_blocking",
-                name="ECO Cooler Blocking",
-                entity_registry_enabled_default=True,
-                entity_category=None,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_AWAY_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="away_electric_heater",
-                name="Away Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_NORMAL_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="normal_electric_heater",
-                name="Normal Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_INTENSIVE_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="intensive_electric_heater",
-                name="Intensive Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_BOOST_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="boost_electric_heater",
-                name="Boost Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_KITCHEN_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="kitchen_electric_heater",
-                name="Kitchen Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_FIREPLACE_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="fireplace_electric_heater",
-                name="Fireplace Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_OVERRIDE_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="override_electric_heater",
-                name="Override Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
-        KomfoventSwitch(
-            coordinator=coordinator,
-            register_id=registers.REG_HOLIDAYS_HEATER,
-            entity_description=SwitchEntityDescription(
-                key="holidays_electric_heater",
-                name="Holidays Electric Heater",
-                entity_registry_enabled_default=True,
-                entity_registry_visible_default=False,
-                entity_category=EntityCategory.CONFIG,
-            ),
-        ),
+            register_id=register_id,
+            entity_description=description,
+        )
+        for register_id, description in SWITCH_DESCRIPTIONS
     ]
 
 
@@ -211,12 +195,14 @@ async def async_setup_entry(
     """Set up Komfovent switches."""
     coordinator: KomfoventCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(await create_switches(coordinator))
+    async_add_entities(create_switches(coordinator))
 
 
 class KomfoventSwitch(CoordinatorEntity["KomfoventCoordinator"], SwitchEntity):
     """Representation of a Komfovent switch."""
 
+    __slots__ = ("register_id",)
+
     _attr_has_entity_name = True
     coordinator: KomfoventCoordinator
 
@@ -230,28 +216,30 @@ class KomfoventSwitch(CoordinatorEntity["KomfoventCoordinator"], SwitchEntity):
         super().__init__(coordinator)
         self.register_id = register_id
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
-        )
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_description.key
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        if not self.coordinator.data:
-            return None
-        value = self.coordinator.data.get(self.register_id)
-        if value is None:
+        self._attr_device_info = coordinator.device_info
+        self._attr_is_on = self._state_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state from the latest coordinator data."""
+        self._attr_is_on = self._state_from_data()
+        super()._handle_coordinator_update()
+
+    def _state_from_data(self) -> bool | None:
+        """Return the current state from the coordinator data."""
+        if (
+            not (data := self.coordinator.data)
+            or (value := data.get(self.register_id)) is None
+        ):
             return None
         return bool(value)
 
     async def async_turn_on(self, **_kwargs: dict) -> None:
         """Turn the entity on."""
-        await self.coordinator.client.write(self.register_id, 1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.register_id, 1)
 
     async def async_turn_off(self, **_kwargs: dict) -> None:
         """Turn the entity off."""
-        await self.coordinator.client.write(self.register_id, 0)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.register_id, 0)
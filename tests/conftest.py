@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.komfovent.const import DOMAIN, Controller
+from custom_components.komfovent.helpers import build_device_info
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -101,6 +102,8 @@ def mock_coordinator(hass, mock_config_entry):
     coordinator.data = load_register_fixture("C6_registers_0.json")
     coordinator.controller = Controller.C6
     coordinator.func_version = 67
+    coordinator.device_info = build_device_info(coordinator)
+    coordinator.unique_id_prefix = f"{mock_config_entry.entry_id}_"
 
     # Mock the client
     coordinator.client = MagicMock()
@@ -133,6 +136,8 @@ def mock_coordinator_by_controller(request, hass, mock_config_entry):
     coordinator.data = load_register_fixture(fixture_name)
     coordinator.controller = controller
     coordinator.func_version = 67
+    coordinator.device_info = build_device_info(coordinator)
+    coordinator.unique_id_prefix = f"{mock_config_entry.entry_id}_"
 
     # Mock the client
     coordinator.client = MagicMock()
@@ -146,9 +151,11 @@ def mock_coordinator_by_controller(request, hass, mock_config_entry):
 
 
 @pytest.fixture(
+    scope="session",
     params=list(Path(__file__).parent.glob("fixtures/*_registers_*.json")),
 )
 def mock_registers(request):
+    """Load each register dump once per session; tests must not mutate it."""
     json_path = request.param
     with json_path.open() as f:
         return json_path.name, json.load(f)
@@ -178,7 +185,14 @@ def mock_modbus_client() -> MagicMock:
             result[reg] = transformed_data.get(reg, 0)
         return result
 
+    async def mock_read_blocks(ranges: list[tuple[int, int]]) -> dict[int, int]:
+        result = {}
+        for register, count in ranges:
+            result.update(await mock_read(register, count))
+        return result
+
     mock_client.read = AsyncMock(side_effect=mock_read)
+    mock_client.read_blocks = AsyncMock(side_effect=mock_read_blocks)
     mock_client.write = AsyncMock()
 
     return mock_client
@@ -5,18 +5,12 @@ from homeassistant.components.binary_sensor import BinarySensorEntityDescription
 
 from custom_components.komfovent import registers
 from custom_components.komfovent.binary_sensor import (
-    BITMASK_ALARM_F,
-    BITMASK_ALARM_W,
-    BITMASK_COOLING,
-    BITMASK_FAN,
-    BITMASK_HEATING,
-    BITMASK_STARTING,
-    BITMASK_STOPPING,
+    STATUS_DESCRIPTIONS,
     KomfoventBinarySensor,
     KomfoventStatusBinarySensor,
     create_binary_sensors,
 )
-from custom_components.komfovent.const import DOMAIN
+from custom_components.komfovent.const import DOMAIN, StatusFlag
 
 DESC = BinarySensorEntityDescription(key="test", name="Test")
 
@@ -25,16 +19,16 @@ DESC = BinarySensorEntityDescription(key="test", name="Test")
 IS_ON_CASES = [({100: 1}, True), ({100: 0}, False), (None, None), ({}, None)]
 
 BITMASK_CASES = [
-    (BITMASK_STARTING, 1, True),
-    (BITMASK_STARTING, 0, False),
-    (BITMASK_STOPPING, 2, True),
-    (BITMASK_STOPPING, 1, False),
-    (BITMASK_FAN, 4, True),
-    (BITMASK_FAN, 3, False),
-    (BITMASK_HEATING, 16, True),
-    (BITMASK_COOLING, 32, True),
-    (BITMASK_ALARM_F, 2048, True),
-    (BITMASK_ALARM_W, 4096, True),
+    (StatusFlag.STARTING, 1, True),
+    (StatusFlag.STARTING, 0, False),
+    (StatusFlag.STOPPING, 2, True),
+    (StatusFlag.STOPPING, 1, False),
+    (StatusFlag.FAN, 4, True),
+    (StatusFlag.FAN, 3, False),
+    (StatusFlag.HEATING, 16, True),
+    (StatusFlag.COOLING, 32, True),
+    (StatusFlag.ALARM_F, 2048, True),
+    (StatusFlag.ALARM_W, 4096, True),
 ]
 
 EXPECTED_KEYS = {
@@ -77,9 +71,9 @@ def test_is_on(mock_coordinator, data, expected):
 def test_status_sensor_bitmask(mock_coordinator):
     """Test status binary sensor has bitmask attribute."""
     s = KomfoventStatusBinarySensor(
-        mock_coordinator, registers.REG_STATUS, BITMASK_FAN, DESC
+        mock_coordinator, registers.REG_STATUS, StatusFlag.FAN, DESC
     )
-    assert s.bitmask == BITMASK_FAN
+    assert s.bitmask == StatusFlag.FAN
 
 
 @pytest.mark.parametrize(("bitmask", "status_value", "expected"), BITMASK_CASES)
@@ -97,13 +91,13 @@ def test_multiple_bits_set(mock_coordinator):
     mock_coordinator.data = {registers.REG_STATUS: 21}  # bits 0, 2, 4
     assert (
         KomfoventStatusBinarySensor(
-            mock_coordinator, registers.REG_STATUS, BITMASK_FAN, DESC
+            mock_coordinator, registers.REG_STATUS, StatusFlag.FAN, DESC
         ).is_on
         is True
     )
     assert (
         KomfoventStatusBinarySensor(
-            mock_coordinator, registers.REG_STATUS, BITMASK_STOPPING, DESC
+            mock_coordinator, registers.REG_STATUS, StatusFlag.STOPPING, DESC
         ).is_on
         is False
     )
@@ -115,7 +109,7 @@ def test_status_edge_cases(mock_coordinator, data, expected):
     mock_coordinator.data = data
     assert (
         KomfoventStatusBinarySensor(
-            mock_coordinator, registers.REG_STATUS, BITMASK_FAN, DESC
+            mock_coordinator, registers.REG_STATUS, StatusFlag.FAN, DESC
         ).is_on
         is expected
     )
@@ -124,8 +118,26 @@ def test_status_edge_cases(mock_coordinator, data, expected):
 # ==================== Factory Tests ====================
 
 
-async def test_create_binary_sensors(mock_coordinator):
+def test_create_binary_sensors(mock_coordinator):
     """Test all 13 status binary sensors are created."""
-    sensors = await create_binary_sensors(mock_coordinator)
+    sensors = create_binary_sensors(mock_coordinator)
     assert len(sensors) == 13
     assert {s.entity_description.key for s in sensors} == EXPECTED_KEYS
+
+
+def test_create_binary_sensors_shares_descriptions(mock_coordinator):
+    """Test entity descriptions are reused from the module-level table."""
+    sensors = create_binary_sensors(mock_coordinator)
+    for sensor, (description, bitmask) in zip(
+        sensors, STATUS_DESCRIPTIONS, strict=True
+    ):
+        assert sensor.entity_description is description
+        assert sensor.bitmask == bitmask
+
+
+def test_status_binary_sensor_slots(mock_coordinator):
+    """Test per-entity register attributes are stored in slots."""
+    sensor = create_binary_sensors(mock_coordinator)[0]
+    assert "register_id" not in vars(sensor)
+    assert "bitmask" not in vars(sensor)
+    assert sensor.register_id == registers.REG_STATUS
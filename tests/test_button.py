@@ -9,6 +9,7 @@ from custom_components.komfovent.button import (
     KomfoventButtonEntity,
     KomfoventCleanFiltersButton,
     KomfoventSetTimeButton,
+    create_buttons,
 )
 from custom_components.komfovent.const import DOMAIN
 
@@ -83,3 +84,15 @@ class TestButtonPress:
             await button.async_press()
 
             mock_service.assert_called_once_with(mock_coordinator)
+
+
+# ==================== Factory Tests ====================
+
+
+def test_create_buttons(mock_coordinator):
+    """Test all button entities are created."""
+    buttons = create_buttons(mock_coordinator)
+    assert [type(b) for b in buttons] == [
+        KomfoventSetTimeButton,
+        KomfoventCleanFiltersButton,
+    ]
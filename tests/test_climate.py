@@ -7,13 +7,18 @@ from homeassistant.components.climate import HVACAction, HVACMode
 from homeassistant.const import ATTR_TEMPERATURE
 
 from custom_components.komfovent import registers
-from custom_components.komfovent.binary_sensor import (
-    BITMASK_COOLING,
-    BITMASK_FAN,
-    BITMASK_HEATING,
+from custom_components.komfovent.climate import (
+    MODE_TEMP_MAPPING,
+    TEMP_CONTROL_MAPPING,
+    KomfoventClimate,
+    create_climate,
+)
+from custom_components.komfovent.const import (
+    DOMAIN,
+    OperationMode,
+    StatusFlag,
+    TemperatureControl,
 )
-from custom_components.komfovent.climate import KomfoventClimate
-from custom_components.komfovent.const import DOMAIN, OperationMode, TemperatureControl
 
 # ==================== Data Tables ====================
 
@@ -64,6 +69,19 @@ class TestKomfoventClimate:
         assert HVACMode.HEAT_COOL in c.hvac_modes
 
 
+def test_create_climate(mock_coordinator):
+    """Test a single climate entity is created."""
+    entities = create_climate(mock_coordinator)
+    assert len(entities) == 1
+    assert isinstance(entities[0], KomfoventClimate)
+
+
+def test_mappings_cover_enums():
+    """Test index mappings have one entry per enum value."""
+    assert len(MODE_TEMP_MAPPING) == len(OperationMode)
+    assert len(TEMP_CONTROL_MAPPING) == len(TemperatureControl)
+
+
 # ==================== Property Tests ====================
 
 
@@ -111,20 +129,24 @@ def test_hvac_mode(mock_coordinator, data, expected):
     [
         # Device off
         (0, 0, HVACAction.OFF),
-        (0, BITMASK_HEATING | BITMASK_FAN, HVACAction.OFF),
+        (0, StatusFlag.HEATING | StatusFlag.FAN, HVACAction.OFF),
         # Device on - heating
-        (1, BITMASK_HEATING, HVACAction.HEATING),
-        (1, BITMASK_HEATING | BITMASK_FAN, HVACAction.HEATING),
+        (1, StatusFlag.HEATING, HVACAction.HEATING),
+        (1, StatusFlag.HEATING | StatusFlag.FAN, HVACAction.HEATING),
         # Device on - cooling
-        (1, BITMASK_COOLING, HVACAction.COOLING),
+        (1, StatusFlag.COOLING, HVACAction.COOLING),
         # Device on - fan only
-        (1, BITMASK_FAN, HVACAction.FAN),
+        (1, StatusFlag.FAN, HVACAction.FAN),
         # Device on - idle
         (1, 0, HVACAction.IDLE),
         # Priority: heating > cooling > fan
-        (1, BITMASK_HEATING | BITMASK_COOLING, HVACAction.HEATING),
-        (1, BITMASK_HEATING | BITMASK_COOLING | BITMASK_FAN, HVACAction.HEATING),
-        (1, BITMASK_COOLING | BITMASK_FAN, HVACAction.COOLING),
+        (1, StatusFlag.HEATING | StatusFlag.COOLING, HVACAction.HEATING),
+        (
+            1,
+            StatusFlag.HEATING | StatusFlag.COOLING | StatusFlag.FAN,
+            HVACAction.HEATING,
+        ),
+        (1, StatusFlag.COOLING | StatusFlag.FAN, HVACAction.COOLING),
     ],
 )
 def test_hvac_action(mock_coordinator, power, status, expected):
@@ -156,8 +178,10 @@ def test_hvac_action_edge_cases(mock_coordinator, data):
     [
         (None, "current_temperature"),
         ({registers.REG_TEMP_CONTROL: 99}, "current_temperature"),
+        ({registers.REG_TEMP_CONTROL: -1}, "current_temperature"),
         (None, "target_temperature"),
         ({registers.REG_OPERATION_MODE: 99}, "target_temperature"),
+        ({registers.REG_OPERATION_MODE: -1}, "target_temperature"),
         (None, "preset_mode"),
         ({registers.REG_OPERATION_MODE: 99}, "preset_mode"),
     ],
@@ -186,12 +210,21 @@ async def test_set_temperature(
     await KomfoventClimate(mock_coordinator).async_set_temperature(
         **{ATTR_TEMPERATURE: temp}
     )
-    mock_coordinator.client.write.assert_called_once_with(expected_reg, expected_val)
+    mock_coordinator.async_write.assert_called_once_with(expected_reg, expected_val)
 
 
 @pytest.mark.parametrize(
     ("temp", "should_write"),
-    [(None, False), (45.0, False), (3.0, False), (5.0, True), (40.0, True)],
+    [
+        (None, False),
+        (45.0, False),
+        (3.0, False),
+        (4.9, False),
+        (5.0, True),
+        (40.0, True),
+        (40.05, False),
+        (40.1, False),
+    ],
 )
 async def test_set_temperature_boundaries(mock_coordinator, temp, should_write):
     """Test temperature boundary conditions."""
@@ -201,7 +234,7 @@ async def test_set_temperature_boundaries(mock_coordinator, temp, should_write):
         await c.async_set_temperature()
     else:
         await c.async_set_temperature(**{ATTR_TEMPERATURE: temp})
-    assert mock_coordinator.client.write.called == should_write
+    assert mock_coordinator.async_write.called == should_write
 
 
 async def test_set_temperature_invalid_mode(mock_coordinator):
@@ -210,7 +243,7 @@ async def test_set_temperature_invalid_mode(mock_coordinator):
     await KomfoventClimate(mock_coordinator).async_set_temperature(
         **{ATTR_TEMPERATURE: 21.0}
     )
-    mock_coordinator.client.write.assert_called_once_with(
+    mock_coordinator.async_write.assert_called_once_with(
         registers.REG_NORMAL_SETPOINT, 210
     )
 
@@ -218,7 +251,7 @@ async def test_set_temperature_invalid_mode(mock_coordinator):
 async def test_set_temperature_connection_error(mock_coordinator):
     """Test set_temperature handles connection errors."""
     mock_coordinator.data = {registers.REG_OPERATION_MODE: OperationMode.NORMAL}
-    mock_coordinator.client.write = AsyncMock(side_effect=ConnectionError())
+    mock_coordinator.async_write = AsyncMock(side_effect=ConnectionError())
     await KomfoventClimate(mock_coordinator).async_set_temperature(
         **{ATTR_TEMPERATURE: 21.0}
     )
@@ -230,7 +263,7 @@ async def test_set_temperature_connection_error(mock_coordinator):
 async def test_set_hvac_mode(mock_coordinator, hvac_mode, value):
     """Test setting HVAC mode."""
     await KomfoventClimate(mock_coordinator).async_set_hvac_mode(hvac_mode)
-    mock_coordinator.client.write.assert_called_once_with(registers.REG_POWER, value)
+    mock_coordinator.async_write.assert_called_once_with(registers.REG_POWER, value)
 
 
 @pytest.mark.parametrize("mode", ["away", "intensive"])
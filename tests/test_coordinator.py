@@ -1,17 +1,34 @@
 """Tests for the Komfovent coordinator."""
 
+import logging
 from datetime import timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util.dt import utcnow
+from pymodbus.exceptions import ModbusException
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.komfovent.const import DOMAIN
+from custom_components.komfovent.const import (
+    DOMAIN,
+    FIRMWARE_CACHE_TTL,
+    SETTINGS_CACHE_TTL,
+    ConnectedPanels,
+)
 from custom_components.komfovent.coordinator import KomfoventCoordinator
-from custom_components.komfovent.registers import REG_SUPPLY_TEMP
+from custom_components.komfovent.registers import (
+    REG_CONNECTED_PANELS,
+    REG_ECO_MIN_TEMP,
+    REG_EXHAUST_TEMP,
+    REG_FIRMWARE,
+    REG_PANEL1_FW,
+    REG_PANEL2_FW,
+    REG_STATUS,
+    REG_SUPPLY_TEMP,
+)
 
 
 @pytest.fixture
@@ -30,6 +47,7 @@ async def test_coordinator_updates_data(hass: HomeAssistant, mock_config_entry)
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock()  # Should not raise exception
     mock_client.read = AsyncMock(return_value={1: 42})
+    mock_client.read_blocks = AsyncMock(return_value={1: 42})
 
     # Patch the client class where it's used
     with patch(
@@ -53,6 +71,258 @@ async def test_coordinator_updates_data(hass: HomeAssistant, mock_config_entry)
         assert mock_client.read.called
 
 
+@pytest.mark.parametrize(
+    ("panels", "reads"),
+    [
+        (ConnectedPanels.NONE, [(REG_FIRMWARE, 2)]),
+        (ConnectedPanels.PANEL1, [(REG_FIRMWARE, 4)]),
+        (ConnectedPanels.PANEL2, [(REG_FIRMWARE, 2), (REG_PANEL2_FW, 2)]),
+        (ConnectedPanels.BOTH, [(REG_FIRMWARE, 6)]),
+    ],
+)
+async def test_firmware_versions_read_for_connected_panels(
+    hass: HomeAssistant, mock_config_entry, panels, reads
+) -> None:
+    """Test only connected panel versions are read, adjacent ones in one block."""
+    mock_client = AsyncMock()
+    mock_client.connect = AsyncMock(return_value=True)
+    mock_client.read = AsyncMock(return_value={})
+    mock_client.read_blocks = AsyncMock(return_value={REG_CONNECTED_PANELS: panels})
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        await coordinator.connect()
+        mock_client.read.reset_mock()
+        await coordinator.async_refresh()
+
+    firmware_reads = [
+        call.args
+        for call in mock_client.read.call_args_list
+        if call.args[0] >= REG_FIRMWARE
+    ]
+    assert firmware_reads == reads
+
+
+async def test_firmware_versions_read_separately_on_block_error(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test a rejected firmware block falls back to one read per version."""
+
+    async def read(register, count):
+        if register == REG_FIRMWARE and count == 6:
+            raise ModbusException("block rejected")
+        if register == REG_PANEL1_FW:
+            raise ModbusException("panel 1 missing")
+        return {register: 7}
+
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(side_effect=read)
+    mock_client.read_blocks = AsyncMock(
+        return_value={REG_CONNECTED_PANELS: ConnectedPanels.BOTH}
+    )
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        await coordinator.async_refresh()
+
+    # The controller firmware survives the failing panel
+    assert coordinator.data[REG_FIRMWARE] == 7
+    assert coordinator.data[REG_PANEL2_FW] == 7
+    assert REG_PANEL1_FW not in coordinator.data
+
+
+async def test_firmware_versions_reread_when_panels_change(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test the firmware cache follows the polled connected panels."""
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(return_value={})
+    mock_client.read_blocks = AsyncMock(
+        return_value={REG_CONNECTED_PANELS: ConnectedPanels.NONE}
+    )
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        await coordinator.async_refresh()
+        mock_client.read_blocks.return_value = {
+            REG_CONNECTED_PANELS: ConnectedPanels.PANEL1
+        }
+        await coordinator.async_refresh()
+
+    assert [call.args for call in mock_client.read.call_args_list] == [
+        (REG_FIRMWARE, 2),
+        (REG_FIRMWARE, 4),
+    ]
+
+
+async def test_firmware_versions_cached(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test firmware versions are cached until they expire or reads fail."""
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(return_value={REG_FIRMWARE: 123})
+    mock_client.read_blocks = AsyncMock(
+        return_value={REG_CONNECTED_PANELS: ConnectedPanels.NONE}
+    )
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert mock_client.read.call_count == 1
+        assert coordinator.data[REG_FIRMWARE] == 123
+
+        # Expired cache is re-read
+        with patch(
+            "custom_components.komfovent.coordinator.utcnow",
+            return_value=utcnow() + timedelta(seconds=FIRMWARE_CACHE_TTL),
+        ):
+            await coordinator.async_refresh()
+        assert mock_client.read.call_count == 2
+
+        # Communication errors invalidate the cache
+        mock_client.read_blocks.side_effect = ConnectionError
+        await coordinator.async_refresh()
+        mock_client.read_blocks.side_effect = None
+        await coordinator.async_refresh()
+        assert mock_client.read.call_count == 3
+
+
+async def test_settings_blocks_cached(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test settings blocks are re-read only when due or after a write."""
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(return_value={REG_FIRMWARE: 123})
+    mock_client.read_blocks = AsyncMock(
+        side_effect=lambda plan: {REG_STATUS: 1} | {start: 0 for start, _ in plan}
+    )
+
+    def read_settings() -> bool:
+        (plan,) = mock_client.read_blocks.call_args.args
+        return (REG_ECO_MIN_TEMP, 18) in plan
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        await coordinator.async_refresh()
+        assert read_settings()
+
+        await coordinator.async_refresh()
+        assert not read_settings()
+        assert coordinator.data[REG_ECO_MIN_TEMP] == 0
+
+        # Writes expire the cached settings so the device value is read back
+        with patch.object(DataUpdateCoordinator, "async_request_refresh"):
+            await coordinator.async_write(REG_ECO_MIN_TEMP, 180)
+        assert coordinator.data[REG_ECO_MIN_TEMP] == 180
+        await coordinator.async_refresh()
+        assert read_settings()
+        assert coordinator.data[REG_ECO_MIN_TEMP] == 0
+
+        # Expired cache is re-read
+        with patch(
+            "custom_components.komfovent.coordinator.utcnow",
+            return_value=utcnow() + timedelta(seconds=SETTINGS_CACHE_TTL),
+        ):
+            await coordinator.async_refresh()
+        assert read_settings()
+
+        # Requested refreshes re-read the settings
+        with patch.object(DataUpdateCoordinator, "async_request_refresh"):
+            await coordinator.async_request_refresh()
+        await coordinator.async_refresh()
+        assert read_settings()
+
+
+@pytest.mark.parametrize(
+    ("firmware", "reads"),
+    [
+        # C6 1.3.17.20 (func version 20): legacy AQ blocks, no exhaust temperature
+        (
+            (0 << 28) | (1 << 24) | (3 << 20) | (17 << 12) | 20,
+            [(REG_ECO_MIN_TEMP, 15), (REG_STATUS, 56)],
+        ),
+        # C6 1.3.28.67 (func version 67): exhaust temperature is read as well
+        (
+            (0 << 28) | (1 << 24) | (3 << 20) | (28 << 12) | 67,
+            [(REG_ECO_MIN_TEMP, 18), (REG_STATUS, 58), (REG_EXHAUST_TEMP, 1)],
+        ),
+        # C8: full blocks, no exhaust temperature
+        ((2 << 28) | 67, [(REG_ECO_MIN_TEMP, 18), (REG_STATUS, 58)]),
+    ],
+)
+async def test_read_plan_built_on_connect(
+    hass: HomeAssistant, mock_config_entry, firmware, reads
+) -> None:
+    """Test block reads are specialized for the detected controller."""
+    mock_client = AsyncMock()
+    mock_client.connect = AsyncMock(return_value=True)
+    mock_client.read = AsyncMock(return_value={REG_FIRMWARE: firmware})
+    mock_client.read_blocks = AsyncMock(return_value={})
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        await coordinator.connect()
+        mock_client.read.reset_mock()
+        await coordinator.async_refresh()
+
+    (blocks,) = mock_client.read_blocks.call_args.args
+    variable_blocks = sorted(
+        b for b in blocks if b[0] in {REG_ECO_MIN_TEMP, REG_STATUS}
+    )
+    single_reads = [
+        call.args
+        for call in mock_client.read.call_args_list
+        if call.args[0] < REG_FIRMWARE
+    ]
+    assert [*variable_blocks, *single_reads] == reads
+
+
+async def test_optional_read_failures_are_isolated(
+    hass: HomeAssistant, mock_config_entry, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing optional read does not drop the other optional reads."""
+
+    async def read(register, count):
+        if register == REG_EXHAUST_TEMP:
+            raise ModbusException("no exhaust sensor")
+        return {REG_FIRMWARE: 123}
+
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(side_effect=read)
+    mock_client.read_blocks = AsyncMock(return_value={1: 42})
+
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=mock_client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        coordinator._optional_plan = [
+            ("exhaust temperature", logging.DEBUG, REG_EXHAUST_TEMP, 1)
+        ]
+        with caplog.at_level(logging.DEBUG):
+            await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data == {1: 42, REG_FIRMWARE: 123}
+    assert "Failed to read exhaust temperature" in caplog.text
+
+
 async def test_coordinator_handles_connection_failure(
     hass: HomeAssistant, mock_config_entry
 ) -> None:
@@ -61,6 +331,7 @@ async def test_coordinator_handles_connection_failure(
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock(side_effect=ConnectionError)
     mock_client.read = AsyncMock(return_value={1: 42})
+    mock_client.read_blocks = AsyncMock(return_value={1: 42})
 
     # Patch the client class where it's used
     with patch(
@@ -80,6 +351,7 @@ async def test_cooldown_delays_update(hass: HomeAssistant, mock_config_entry) ->
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock()
     mock_client.read = AsyncMock(return_value={1: 42})
+    mock_client.read_blocks = AsyncMock(return_value={1: 42})
 
     with (
         patch(
@@ -105,6 +377,116 @@ async def test_cooldown_delays_update(hass: HomeAssistant, mock_config_entry) ->
         assert 0.9 < wait_time <= 1.0
 
 
+def test_device_info_is_shared(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test device info is built once and shared by reference."""
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=AsyncMock(),
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+        device_info = coordinator.device_info
+        assert device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
+        assert coordinator.device_info is device_info
+
+
+async def test_async_write_publishes_value(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test writes publish the value and then request a refresh."""
+    client = AsyncMock()
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        data = {REG_ECO_MIN_TEMP: 150}
+        coordinator.data = data
+
+        with (
+            patch.object(coordinator, "async_set_updated_data") as publish,
+            patch.object(coordinator, "async_request_refresh") as refresh,
+        ):
+            await coordinator.async_write(REG_ECO_MIN_TEMP, 180)
+
+        client.write.assert_called_once_with(REG_ECO_MIN_TEMP, 180)
+        publish.assert_called_once_with({REG_ECO_MIN_TEMP: 180})
+        # The polled data is not mutated, and the device value is read back
+        assert data == {REG_ECO_MIN_TEMP: 150}
+        refresh.assert_awaited_once()
+
+
+async def test_async_write_refreshes_without_data(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test writes before the first poll fall back to a refresh."""
+    client = AsyncMock()
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=client,
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+        with patch.object(coordinator, "async_request_refresh") as refresh:
+            await coordinator.async_write(REG_ECO_MIN_TEMP, 180)
+
+        client.write.assert_called_once_with(REG_ECO_MIN_TEMP, 180)
+        assert coordinator.data is None
+        refresh.assert_awaited_once()
+
+
+def test_unique_id_prefix(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test the entity unique ID prefix is derived from the config entry."""
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=AsyncMock(),
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+        assert coordinator.unique_id_prefix == "test_entry_id_"
+
+
+def test_settings_read_separately(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test the cached settings ranges are not part of the per-poll plan."""
+    with patch(
+        "custom_components.komfovent.coordinator.KomfoventModbusClient",
+        return_value=AsyncMock(),
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+    settings_starts = {start for start, _count in coordinator.settings_plan}
+    assert REG_ECO_MIN_TEMP in settings_starts
+    assert not settings_starts & {start for start, _count in coordinator.read_plan}
+
+
+async def test_always_update_disabled(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test listeners are only notified when the register data changes."""
+    mock_client = AsyncMock()
+    mock_client.read = AsyncMock(return_value={REG_FIRMWARE: 123})
+    mock_client.read_blocks = AsyncMock(side_effect=lambda _plan: {REG_STATUS: 1})
+
+    with (
+        patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ),
+        patch.object(DataUpdateCoordinator, "_schedule_refresh"),
+    ):
+        coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+        listener = Mock()
+        coordinator.async_add_listener(listener)
+
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert mock_client.read_blocks.call_count == 2
+        listener.assert_called_once()
+
+        # Changed data notifies again
+        mock_client.read_blocks.side_effect = lambda _plan: {REG_STATUS: 2}
+        await coordinator.async_refresh()
+        assert listener.call_count == 2
+
+
 class TestEmaFiltering:
     """Tests for EMA filtering in coordinator."""
 
@@ -38,6 +38,7 @@ def test_entity_properties(mock_coordinator):
     assert dt.register_id == 100
     assert dt.unique_id == "test_entry_id_test_datetime"
     assert dt.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
+    assert "register_id" not in vars(dt)
 
 
 # ==================== Native Value Tests ====================
@@ -56,6 +57,19 @@ def test_native_value(mock_coordinator, seconds, timezone, year, month, day):
     assert result.day == day
 
 
+def test_native_value_wall_clock_across_dst(mock_coordinator):
+    """Test native_value keeps local wall-clock time during daylight saving."""
+    tz = zoneinfo.ZoneInfo("Europe/Amsterdam")
+    local_epoch = datetime(1970, 1, 1, tzinfo=tz)
+    summer = datetime(2024, 7, 1, 12, 30, tzinfo=tz)
+    mock_coordinator.data = {100: int((summer - local_epoch).total_seconds())}
+    mock_coordinator.hass.config.time_zone = "Europe/Amsterdam"
+    result = KomfoventDateTime(mock_coordinator, 100, DESC).native_value
+    assert result is not None
+    assert result == summer
+    assert (result.hour, result.minute) == (12, 30)
+
+
 @pytest.mark.parametrize(("data", "expected"), EDGE_CASES)
 def test_native_value_edge_cases(mock_coordinator, data, expected):
     """Test native_value edge cases."""
@@ -72,8 +86,7 @@ async def test_set_value(mock_coordinator, timezone, dt_value, expected_seconds)
     """Test async_set_value with timezone-aware datetime."""
     mock_coordinator.hass.config.time_zone = timezone
     await KomfoventDateTime(mock_coordinator, 100, DESC).async_set_value(dt_value)
-    mock_coordinator.client.write.assert_called_once_with(100, expected_seconds)
-    mock_coordinator.async_request_refresh.assert_called_once()
+    mock_coordinator.async_write.assert_called_once_with(100, expected_seconds)
 
 
 async def test_set_value_naive_datetime(mock_coordinator):
@@ -81,7 +94,7 @@ async def test_set_value_naive_datetime(mock_coordinator):
     mock_coordinator.hass.config.time_zone = "UTC"
     value = datetime(1970, 1, 12, 13, 46, 40)  # noqa: DTZ001
     await KomfoventDateTime(mock_coordinator, 100, DESC).async_set_value(value)
-    mock_coordinator.client.write.assert_called_once_with(100, 1000000)
+    mock_coordinator.async_write.assert_called_once_with(100, 1000000)
 
 
 async def test_set_value_holidays_register(mock_coordinator):
@@ -94,6 +107,6 @@ async def test_set_value_holidays_register(mock_coordinator):
     expected = int(
         (value - datetime(1970, 1, 1, tzinfo=zoneinfo.ZoneInfo("UTC"))).total_seconds()
     )
-    mock_coordinator.client.write.assert_called_once_with(
+    mock_coordinator.async_write.assert_called_once_with(
         registers.REG_HOLIDAYS_FROM, expected
     )
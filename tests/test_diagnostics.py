@@ -1,5 +1,6 @@
 """Tests for Komfovent diagnostics."""
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,12 +8,13 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from pymodbus import ModbusException
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.komfovent.const import DOMAIN
+from custom_components.komfovent.const import DOMAIN, SETTINGS_CACHE_TTL
 from custom_components.komfovent.diagnostics import (
     ERR_READ_FAILED,
     RANGES,
     _check_response,
     async_get_config_entry_diagnostics,
+    describe_read_plan,
     dump_registers,
 )
 
@@ -29,6 +31,9 @@ def mock_entry(hass):
     )
     mock_coordinator = MagicMock()
     mock_coordinator.data = {"test": "data"}
+    mock_coordinator.read_plan = [(900, 58), (961, 1)]
+    mock_coordinator.settings_plan = [(100, 59)]
+    mock_coordinator.update_interval = timedelta(seconds=30)
     hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
     return entry
 
@@ -152,3 +157,21 @@ async def test_diagnostics_entry(hass, mock_entry, side_effect, expected_registe
     assert "config_entry" in result
     assert result["registers"] == expected_registers
     assert result["coordinator_data"] == {"test": "data"}
+    assert result["read_plan"] == {
+        "poll": {
+            "interval": 30,
+            "blocks": [{"start": 900, "count": 58}, {"start": 961, "count": 1}],
+        },
+        "settings": {
+            "interval": SETTINGS_CACHE_TTL,
+            "blocks": [{"start": 100, "count": 59}],
+        },
+    }
+
+
+def test_describe_read_plan():
+    """Test each block read is described with its start and count."""
+    assert describe_read_plan([(1, 34), (100, 59)]) == [
+        {"start": 1, "count": 34},
+        {"start": 100, "count": 59},
+    ]
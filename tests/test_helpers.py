@@ -1,7 +1,12 @@
 """Test cases for Komfovent helper functions."""
 
-from custom_components.komfovent.const import DOMAIN, Controller
-from custom_components.komfovent.helpers import build_device_info, get_version_from_int
+from custom_components.komfovent.const import DOMAIN, Controller, SchedulerMode
+from custom_components.komfovent.helpers import (
+    build_device_info,
+    get_local_epoch,
+    get_version_from_int,
+    option_names,
+)
 
 
 def uint32(high, low):
@@ -39,6 +44,16 @@ def test_get_version_from_int():
     # Test boundary values
     assert get_version_from_int(0) == (Controller.C6, 0, 0, 0, 0)
     assert get_version_from_int(0xFFFFFFFF) == (Controller.NA, 15, 15, 255, 4095)
+    assert get_version_from_int(18886660) is get_version_from_int(18886660)
+
+
+def test_get_local_epoch():
+    """Test local epoch is resolved once per time zone."""
+    epoch = get_local_epoch("Europe/Vilnius")
+    assert (epoch.year, epoch.month, epoch.day, epoch.hour) == (1970, 1, 1, 0)
+    assert str(epoch.tzinfo) == "Europe/Vilnius"
+    assert get_local_epoch("Europe/Vilnius") is epoch
+    assert get_local_epoch("UTC") != epoch
 
 
 def test_build_device_info(mock_coordinator):
@@ -61,3 +76,10 @@ def test_build_device_info_with_different_controllers(
     controller = mock_coordinator_by_controller.controller
     assert device_info["model"] == controller.name
     assert device_info["configuration_url"] == "http://192.168.1.100"
+
+
+def test_option_names():
+    """Test enum option names are lowercase and built once per enum."""
+    names = option_names(SchedulerMode)
+    assert names[SchedulerMode.OFFICE] == "office"
+    assert option_names(SchedulerMode) is names
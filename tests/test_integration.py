@@ -55,6 +55,7 @@ async def test_setup_entry(hass: HomeAssistant, mock_config_entry, mock_modbus_c
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock()  # Should not raise exception
     mock_client.read = AsyncMock(return_value={1: 42})
+    mock_client.read_blocks = AsyncMock(return_value={1: 42})
 
     # Patch the client class where it's used and services registration
     with (
@@ -2,7 +2,7 @@
 
 import asyncio
 import contextlib
-import random
+import socket
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -15,27 +15,60 @@ from custom_components.komfovent.coordinator import KomfoventCoordinator
 from custom_components.komfovent.modbus import KomfoventModbusClient
 from scripts.modbus_server import run_server
 
+TEST_HOST = "127.0.0.1"
+
+
+def _free_port(host: str) -> int:
+    """Return a port the OS reports as free on the given host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_ready(host: str, port: int) -> None:
+    """Wait until the server accepts connections."""
+    while True:
+        try:
+            _reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(0.01)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+@pytest.fixture
+async def modbus_server(mock_registers):
+    """Run a simulated modbus server with the register fixture data."""
+    _register_name, register_data = mock_registers
+
+    # Let the OS pick an unused port
+    test_port = _free_port(TEST_HOST)
+    server_task = asyncio.create_task(run_server(TEST_HOST, test_port, register_data))
+
+    # Wait for server to start
+    async with asyncio.timeout(2):
+        await _wait_ready(TEST_HOST, test_port)
+
+    yield TEST_HOST, test_port
+
+    server_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await server_task
+
 
 @pytest.mark.enable_socket
 @pytest.mark.asyncio
-async def test_live_modbus_connection(hass: HomeAssistant, mock_registers):
+async def test_live_modbus_connection(hass: HomeAssistant, modbus_server):
     """
     Test actual connection to modbus server.
 
     This test requires a running modbus server and will be skipped by default.
     To run: pytest tests/test_live_modbus.py -v --socket-enabled
     """
-    _register_name, register_data = mock_registers
-
-    # Use non-privileged port for testing
-    test_port = random.randint(1024, 50000)
-    server_task = asyncio.create_task(run_server("127.0.0.1", test_port, register_data))
-
-    # Wait for server to start
-    await asyncio.sleep(0.1)
-
     # Create and connect to the server
-    client = KomfoventModbusClient("127.0.0.1", test_port)
+    client = KomfoventModbusClient(*modbus_server)
 
     try:
         # Test connection - should not raise
@@ -51,67 +84,56 @@ async def test_live_modbus_connection(hass: HomeAssistant, mock_registers):
     finally:
         # Clean up
         await client.close()
-        server_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await server_task
-
-
-@pytest.mark.enable_socket
-@pytest.mark.asyncio
-async def test_live_coordinator(hass: HomeAssistant, mock_registers):
-    """
-    Test coordinator with actual modbus server.
-
-    This test requires a running modbus server and will be skipped by default.
-    To run: pytest tests/test_live_modbus.py -v --socket-enabled
-    """
-    register_name, register_data = mock_registers
-    controller = Controller[register_name.split("_registers_")[0]]
 
-    # Use non-privileged port for testing
-    test_port = random.randint(1024, 50000)
-    server_task = asyncio.create_task(run_server("127.0.0.1", test_port, register_data))
 
-    # Wait for server to start
-    await asyncio.sleep(0.1)
+@pytest.fixture
+async def live_coordinator(hass: HomeAssistant, modbus_server):
+    """Create a coordinator connected to the simulated modbus server."""
+    host, port = modbus_server
 
     # Create mock config entry
     mock_config_entry = MockConfigEntry(
         domain=DOMAIN,
-        data={CONF_HOST: "127.0.0.1", CONF_PORT: test_port},
+        data={CONF_HOST: host, CONF_PORT: port},
         entry_id="test_entry_id",
     )
 
-    # Create coordinator
     coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
-
     try:
         # Connect - should not raise
         await coordinator.connect()
+        yield coordinator
+    finally:
+        await coordinator.client.close()
 
-        # Update data
-        await coordinator.async_refresh()
 
-        # Verify data
-        assert coordinator.data is not None
-        assert len(coordinator.data) > 0
+@pytest.mark.enable_socket
+@pytest.mark.asyncio
+async def test_live_coordinator(mock_registers, live_coordinator):
+    """
+    Test coordinator with actual modbus server.
 
-        # Verify 16-bit register
-        assert coordinator.data[1] == register_data["1"][0]
+    This test requires a running modbus server and will be skipped by default.
+    To run: pytest tests/test_live_modbus.py -v --socket-enabled
+    """
+    register_name, register_data = mock_registers
+    controller = Controller[register_name.split("_registers_")[0]]
 
-        # Verify 32-bit register
-        assert (
-            coordinator.data[1000]
-            == (register_data["1000"][0] << 16) + register_data["1000"][1]
-        )
+    # Update data
+    await live_coordinator.async_refresh()
 
-        # Verify controller type
-        assert coordinator.controller == controller
+    # Verify data
+    assert live_coordinator.data is not None
+    assert len(live_coordinator.data) > 0
 
-    finally:
-        # Ensure client is closed
-        if hasattr(coordinator, "client") and coordinator.client:
-            await coordinator.client.close()
-        server_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await server_task
+    # Verify 16-bit register
+    assert live_coordinator.data[1] == register_data["1"][0]
+
+    # Verify 32-bit register
+    assert (
+        live_coordinator.data[1000]
+        == (register_data["1000"][0] << 16) + register_data["1000"][1]
+    )
+
+    # Verify controller type
+    assert live_coordinator.controller == controller
@@ -1,17 +1,52 @@
 """Tests for Komfovent modbus client."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from pymodbus import ModbusException
 
-from custom_components.komfovent.modbus import KomfoventModbusClient
+from custom_components.komfovent import modbus, registers
+from custom_components.komfovent.modbus import KomfoventModbusClient, plan_reads
 
 # Patch paths
 MODBUS_CLIENT = "custom_components.komfovent.modbus.AsyncModbusTcpClient"
 REG_32U = "custom_components.komfovent.modbus.REGISTERS_32BIT_UNSIGNED"
 REG_16U = "custom_components.komfovent.modbus.REGISTERS_16BIT_UNSIGNED"
 REG_16S = "custom_components.komfovent.modbus.REGISTERS_16BIT_SIGNED"
+ENCODERS = "custom_components.komfovent.modbus.ENCODERS_16BIT"
+REG_KIND = "custom_components.komfovent.modbus.REGISTER_KIND"
+
+
+@contextmanager
+def register_types(u16=(), s16=(), u32=()):
+    """Patch the register type sets to the given register numbers."""
+    modbus.block_layout.cache_clear()
+    modbus.block_decoder.cache_clear()
+    with (
+        patch(REG_16U, set(u16)),
+        patch(REG_16S, set(s16)),
+        patch(REG_32U, set(u32)),
+        patch(
+            REG_KIND,
+            {
+                **dict.fromkeys(u16, registers.KIND_16BIT_UNSIGNED),
+                **dict.fromkeys(s16, registers.KIND_16BIT_SIGNED),
+                **dict.fromkeys(u32, registers.KIND_32BIT_UNSIGNED),
+            },
+        ),
+        patch(
+            ENCODERS,
+            {
+                **dict.fromkeys(u16, modbus._uint16),
+                **dict.fromkeys(s16, modbus._to_uint16),
+            },
+        ),
+    ):
+        yield
+    modbus.block_layout.cache_clear()
+    modbus.block_decoder.cache_clear()
 
 
 @pytest.fixture
@@ -19,6 +54,7 @@ def mock_pymodbus():
     """Create a mock pymodbus client."""
     with patch(MODBUS_CLIENT) as mock_class:
         mock = MagicMock()
+        mock.ctx.reconnect_task = None
         mock_class.return_value = mock
         yield mock
 
@@ -31,7 +67,8 @@ def test_init_creates_client():
     with patch(MODBUS_CLIENT) as mock_class:
         client = KomfoventModbusClient("192.168.1.100", 502)
         mock_class.assert_called_once()
-        assert client._lock is not None
+        assert client.client is mock_class.return_value
+        assert not hasattr(client, "__dict__")
 
 
 # ==================== Read Tests ====================
@@ -43,9 +80,7 @@ async def test_read_32bit_missing_second_register(mock_pymodbus):
         return_value=MagicMock(isError=lambda: False, registers=[1234])
     )
     with (
-        patch(REG_32U, {1000}),
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
+        register_types(u32={1000}),
         pytest.raises(ValueError, match="value not retrieved"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).read(1000, 1)
@@ -57,38 +92,158 @@ async def test_read_unknown_register_type(mock_pymodbus):
         return_value=MagicMock(isError=lambda: False, registers=[1234])
     )
     with (
-        patch(REG_32U, set()),
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
+        register_types(),
         pytest.raises(NotImplementedError, match="not found"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).read(500, 1)
 
 
+def test_decode_registers_uses_register_types():
+    """Test raw values are converted by the register type tables."""
+    assert modbus.decode_registers(registers.REG_NORMAL_SETPOINT, [0xFFF6]) == {
+        registers.REG_NORMAL_SETPOINT: -10
+    }
+    assert modbus.decode_registers(registers.REG_POWER, [1]) == {registers.REG_POWER: 1}
+    assert modbus.decode_registers(registers.REG_FIRMWARE, [0x1234, 0x5678]) == {
+        registers.REG_FIRMWARE: 0x12345678
+    }
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(0, 0), (1, 1), (0x7FFF, 32767), (0x8000, -32768), (0xFFFF, -1)],
+)
+def test_int16_sign_extension(raw, expected):
+    """Test raw uint16 values are sign extended to int16."""
+    with register_types(s16={10}):
+        assert modbus.decode_registers(10, [raw]) == {10: expected}
+    assert modbus._to_uint16(expected) == raw
+
+
+def test_decode_registers_mixed_block():
+    """Test a block mixing all register types is decoded in one pass."""
+    with register_types(u16={10}, s16={11, 14}, u32={12}):
+        data = modbus.decode_registers(10, [0xFFFF, 0xFFFF, 0x1234, 0x5678, 0x8000])
+        assert data == {10: 65535, 11: -1, 12: 0x12345678, 14: -32768}
+        assert modbus.block_layout(10, 5) == ((0,), (1, 4), (2,))
+
+
+def test_unsigned_block_skips_struct_conversion():
+    """Test blocks of only unsigned registers are returned without unpacking."""
+    with register_types(u16={10, 11}):
+        assert modbus.block_decoder(10, 2) == ((10, 11), None, None)
+        assert modbus.decode_registers(10, [0xFFFF, 7]) == {10: 65535, 11: 7}
+
+
+# ==================== Block Read Tests ====================
+
+
+@pytest.mark.parametrize(
+    ("ranges", "expected"),
+    [
+        ([], []),
+        ([(1, 34)], [(1, 34)]),
+        # Ranges with unused registers between them are read separately
+        ([(961, 1), (900, 58)], [(900, 58), (961, 1)]),
+        ([(1000, 2), (1004, 2)], [(1000, 2), (1004, 2)]),
+        # Adjacent and overlapping ranges are merged
+        ([(1000, 2), (1002, 2), (1001, 4)], [(1000, 5)]),
+        # Merged block may not exceed the per-request register limit
+        ([(1, 100), (101, 26)], [(1, 100), (101, 26)]),
+    ],
+)
+def test_plan_reads(ranges, expected):
+    """Test adjacent register ranges are merged into single requests."""
+    assert plan_reads(ranges) == expected
+
+
+async def test_read_blocks_one_request_per_range(mock_pymodbus):
+    """Test each range is read on its own, without the registers in between."""
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        side_effect=[
+            MagicMock(isError=lambda: False, registers=[1, 2]),
+            MagicMock(isError=lambda: False, registers=[5]),
+        ]
+    )
+    with (
+        register_types(u16={10, 11, 14}),
+    ):
+        data = await KomfoventModbusClient("192.168.1.100", 502).read_blocks(
+            [(10, 2), (14, 1)]
+        )
+
+    assert mock_pymodbus.read_holding_registers.call_args_list == [
+        call(address=9, count=2),
+        call(address=13, count=1),
+    ]
+    assert data == {10: 1, 11: 2, 14: 5}
+
+
+async def test_read_blocks_reuses_unchanged_ranges(mock_pymodbus):
+    """Test ranges whose raw words did not change are not decoded again."""
+    responses = [[1, 2], [1, 2], [1, 3]]
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        side_effect=[
+            MagicMock(isError=lambda: False, registers=values) for values in responses
+        ]
+    )
+    client = KomfoventModbusClient("192.168.1.100", 502)
+    with (
+        register_types(u16={10, 11}),
+        patch.object(
+            modbus, "decode_registers", wraps=modbus.decode_registers
+        ) as decode,
+    ):
+        assert await client.read_blocks([(10, 2)]) == {10: 1, 11: 2}
+        assert await client.read_blocks([(10, 2)]) == {10: 1, 11: 2}
+        assert decode.call_count == 1
+        assert await client.read_blocks([(10, 2)]) == {10: 1, 11: 3}
+        assert decode.call_count == 2
+
+
+async def test_read_blocks_issues_requests_concurrently(mock_pymodbus):
+    """Test block reads are in flight at the same time."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def read_holding_registers(address, count):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return MagicMock(isError=lambda: False, registers=[0] * count)
+
+    mock_pymodbus.read_holding_registers = read_holding_registers
+    with (
+        register_types(u16={1, 100}),
+    ):
+        data = await KomfoventModbusClient("192.168.1.100", 502).read_blocks(
+            [(1, 1), (100, 1)]
+        )
+
+    assert data == {1: 0, 100: 0}
+    assert max_in_flight == 2
+
+
 # ==================== Write Tests ====================
 
 
 @pytest.mark.parametrize(
-    ("register_set", "register", "value", "method", "expected_args"),
+    ("register_type", "register", "value", "method", "expected_args"),
     [
-        (REG_16U, 100, 42, "write_register", (99, 42)),
-        (REG_16S, 100, -10, "write_register", (99, 65526)),
+        ("u16", 100, 42, "write_register", (99, 42)),
+        ("s16", 100, -10, "write_register", (99, 65526)),
     ],
 )
 async def test_write_16bit(
-    mock_pymodbus, register_set, register, value, method, expected_args
+    mock_pymodbus, register_type, register, value, method, expected_args
 ):
     """Test write to 16-bit registers."""
     mock_pymodbus.write_register = AsyncMock(
         return_value=MagicMock(isError=lambda: False)
     )
-    patches = [(REG_16U, set()), (REG_16S, set()), (REG_32U, set())]
-    patches = [(p, {register} if p == register_set else s) for p, s in patches]
-    with (
-        patch(patches[0][0], patches[0][1]),
-        patch(patches[1][0], patches[1][1]),
-        patch(patches[2][0], patches[2][1]),
-    ):
+    with register_types(**{register_type: {register}}):
         await KomfoventModbusClient("192.168.1.100", 502).write(register, value)
     getattr(mock_pymodbus, method).assert_called_once_with(*expected_args)
 
@@ -98,7 +253,7 @@ async def test_write_32bit_unsigned(mock_pymodbus):
     mock_pymodbus.write_registers = AsyncMock(
         return_value=MagicMock(isError=lambda: False)
     )
-    with patch(REG_16U, set()), patch(REG_16S, set()), patch(REG_32U, {100}):
+    with register_types(u32={100}):
         await KomfoventModbusClient("192.168.1.100", 502).write(100, 0x12345678)
     mock_pymodbus.write_registers.assert_called_once_with(
         address=99, values=[0x1234, 0x5678]
@@ -108,9 +263,7 @@ async def test_write_32bit_unsigned(mock_pymodbus):
 async def test_write_unknown_register_type(mock_pymodbus):
     """Test write raises NotImplementedError for unknown register type."""
     with (
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
-        patch(REG_32U, set()),
+        register_types(),
         pytest.raises(NotImplementedError, match="not found"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).write(500, 42)
@@ -122,7 +275,81 @@ async def test_write_error_response(mock_pymodbus):
         return_value=MagicMock(isError=lambda: True)
     )
     with (
-        patch(REG_16U, {100}),
+        register_types(u16={100}),
         pytest.raises(ModbusException, match="Error writing register"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).write(100, 42)
+
+
+# ==================== Reconnect Tests ====================
+
+
+async def test_read_reconnects_dropped_connection(mock_pymodbus):
+    """Test a dropped connection is re-established before reading."""
+    mock_pymodbus.connected = False
+    mock_pymodbus.connect = AsyncMock(return_value=True)
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: False, registers=[1])
+    )
+    with register_types(u16={100}):
+        assert await KomfoventModbusClient("192.168.1.100", 502).read(100, 1) == {
+            100: 1
+        }
+    mock_pymodbus.connect.assert_awaited_once()
+
+
+async def test_reconnect_fails_fast(mock_pymodbus):
+    """Test requests fail with ConnectionError after one failed connect."""
+    mock_pymodbus.connected = False
+    mock_pymodbus.connect = AsyncMock(return_value=False)
+    mock_pymodbus.write_register = AsyncMock()
+    with register_types(u16={100}), pytest.raises(ConnectionError):
+        await KomfoventModbusClient("192.168.1.100", 502).write(100, 1)
+    mock_pymodbus.connect.assert_awaited_once()
+    mock_pymodbus.write_register.assert_not_called()
+
+
+async def test_pending_pymodbus_reconnect_not_duplicated(mock_pymodbus):
+    """Test requests fail fast while pymodbus is already reconnecting."""
+    mock_pymodbus.connected = False
+    mock_pymodbus.ctx.reconnect_task = MagicMock()
+    mock_pymodbus.connect = AsyncMock(return_value=True)
+    mock_pymodbus.read_holding_registers = AsyncMock()
+    with register_types(u16={100}), pytest.raises(ConnectionError):
+        await KomfoventModbusClient("192.168.1.100", 502).read(100, 1)
+    mock_pymodbus.connect.assert_not_called()
+    mock_pymodbus.read_holding_registers.assert_not_called()
+
+
+async def test_concurrent_reads_share_reconnect(mock_pymodbus):
+    """Test block reads share one connect attempt while the device is down."""
+    mock_pymodbus.connected = False
+    mock_pymodbus.connect = AsyncMock(return_value=False)
+    mock_pymodbus.read_holding_registers = AsyncMock()
+    client = KomfoventModbusClient("192.168.1.100", 502)
+    with register_types(u16={100, 300, 500, 700, 900}):
+        with pytest.raises(ConnectionError):
+            await client.read_blocks([(100, 1), (300, 1), (500, 1), (700, 1), (900, 1)])
+        assert mock_pymodbus.connect.call_count == 1
+
+        # The failed attempt is not reused by the next poll
+        with pytest.raises(ConnectionError):
+            await client.read(100, 1)
+        assert mock_pymodbus.connect.call_count == 2
+    mock_pymodbus.read_holding_registers.assert_not_called()
+
+
+async def test_write_sent_when_read_value_matches(mock_pymodbus):
+    """Test writes are sent even when the last read already showed the value."""
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: False, registers=[42])
+    )
+    mock_pymodbus.write_register = AsyncMock(
+        return_value=MagicMock(isError=lambda: False)
+    )
+    with register_types(u16={100}):
+        client = KomfoventModbusClient("192.168.1.100", 502)
+        await client.read(100, 1)
+        # The panel may have changed the register since the read
+        await client.write(100, 42)
+    mock_pymodbus.write_register.assert_called_once_with(99, 42)
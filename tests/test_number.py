@@ -1,20 +1,27 @@
 """Tests for Komfovent number platform."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.const import PERCENTAGE, UnitOfVolumeFlowRate
 
 from custom_components.komfovent import registers
 from custom_components.komfovent.const import (
+    DEFAULT_STEP_TEMPERATURE,
     DOMAIN,
+    OPT_STEP_FLOW,
+    AirQualitySensorType,
     Controller,
     FlowControl,
     FlowUnit,
 )
 from custom_components.komfovent.number import (
+    NUMBER_DESCRIPTIONS,
     FlowNumber,
     KomfoventNumber,
     TemperatureNumber,
+    async_setup_entry,
 )
 
 DESC = NumberEntityDescription(key="test_number", name="Test")
@@ -74,6 +81,13 @@ def test_entity_properties(mock_coordinator):
     assert n.register_id == 100
     assert n.unique_id == "test_entry_id_test_number"
     assert n.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
+    assert n.device_info is mock_coordinator.device_info
+
+
+@pytest.mark.parametrize("cls", [KomfoventNumber, FlowNumber, TemperatureNumber])
+def test_number_slots(mock_coordinator, cls):
+    """Test the register attribute is stored in a slot."""
+    assert "register_id" not in vars(cls(mock_coordinator, 100, DESC))
 
 
 @pytest.mark.parametrize(("data", "expected"), NATIVE_VALUE_CASES)
@@ -83,12 +97,24 @@ def test_native_value(mock_coordinator, data, expected):
     assert KomfoventNumber(mock_coordinator, 100, DESC).native_value == expected
 
 
+def test_native_value_follows_coordinator_update(mock_coordinator):
+    """Test the cached native value refreshes on coordinator updates."""
+    mock_coordinator.data = {100: 42}
+    number = TemperatureNumber(mock_coordinator, 100, DESC)
+    mock_coordinator.data = {100: 215}
+    assert number.native_value == 4.2
+
+    with patch.object(number, "async_write_ha_state"):
+        number._handle_coordinator_update()
+    assert number.native_value == 21.5
+
+
 @pytest.mark.parametrize(("value", "expected_int"), SET_VALUE_CASES)
 async def test_set_native_value(mock_coordinator, value, expected_int):
     """Test async_set_native_value writes to register."""
     await KomfoventNumber(mock_coordinator, 100, DESC).async_set_native_value(value)
-    mock_coordinator.client.write.assert_called_once_with(100, expected_int)
-    mock_coordinator.async_request_refresh.assert_called_once()
+    mock_coordinator.async_write.assert_called_once_with(100, expected_int)
+    mock_coordinator.async_request_refresh.assert_not_called()
 
 
 # ==================== Temperature Number Tests ====================
@@ -101,9 +127,10 @@ def test_temperature_native_value(mock_coordinator, raw, expected):
     assert TemperatureNumber(mock_coordinator, 100, DESC).native_value == expected
 
 
-def test_temperature_native_value_none(mock_coordinator):
-    """Test TemperatureNumber returns None when no data."""
-    mock_coordinator.data = None
+@pytest.mark.parametrize("data", [None, {}, {100: "not a number"}])
+def test_temperature_native_value_none(mock_coordinator, data):
+    """Test TemperatureNumber returns None when no valid data."""
+    mock_coordinator.data = data
     assert TemperatureNumber(mock_coordinator, 100, DESC).native_value is None
 
 
@@ -111,7 +138,7 @@ def test_temperature_native_value_none(mock_coordinator):
 async def test_temperature_set_value(mock_coordinator, value, expected_raw):
     """Test TemperatureNumber multiplies by 10."""
     await TemperatureNumber(mock_coordinator, 100, DESC).async_set_native_value(value)
-    mock_coordinator.client.write.assert_called_once_with(100, expected_raw)
+    mock_coordinator.async_write.assert_called_once_with(100, expected_raw)
 
 
 # ==================== Flow Number Tests ====================
@@ -145,3 +172,93 @@ def test_flow_number_edge_cases(mock_coordinator, data, flow_unit, expected):
     assert (
         FlowNumber(mock_coordinator, 100, DESC).native_unit_of_measurement == expected
     )
+
+
+def test_flow_number_unit_follows_coordinator_update(mock_coordinator):
+    """Test FlowNumber refreshes its cached unit on coordinator updates."""
+    mock_coordinator.data = {
+        registers.REG_FLOW_CONTROL: FlowControl.CONSTANT,
+        registers.REG_FLOW_UNIT: FlowUnit.M3H,
+    }
+    number = FlowNumber(mock_coordinator, 100, DESC)
+    assert (
+        number.native_unit_of_measurement == UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR
+    )
+
+    mock_coordinator.data[registers.REG_FLOW_UNIT] = FlowUnit.LS
+    assert (
+        number.native_unit_of_measurement == UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR
+    )
+
+    with patch.object(number, "async_write_ha_state"):
+        number._handle_coordinator_update()
+    assert number.native_unit_of_measurement == UnitOfVolumeFlowRate.LITERS_PER_SECOND
+
+
+# ==================== Setup Tests ====================
+
+
+async def test_setup_entry_applies_step_options(hass, mock_coordinator):
+    """Test setup applies configured steps without mutating shared descriptions."""
+    hass.data[DOMAIN] = {mock_coordinator.config_entry.entry_id: mock_coordinator}
+    mock_coordinator.data[registers.REG_AQ_SENSOR1_TYPE] = AirQualitySensorType.CO2
+    mock_coordinator.data[registers.REG_AQ_SENSOR2_TYPE] = (
+        AirQualitySensorType.NOT_INSTALLED
+    )
+    entry = MagicMock(entry_id=mock_coordinator.config_entry.entry_id)
+    entry.options = {OPT_STEP_FLOW: 10.0}
+    add_entities = MagicMock()
+
+    await async_setup_entry(hass, entry, add_entities)
+
+    entities = {e.entity_description.key: e for e in add_entities.call_args[0][0]}
+    assert len(entities) == len(NUMBER_DESCRIPTIONS) + 1
+    assert entities["away_supply_flow"].entity_description.native_step == 10.0
+    assert (
+        entities["away_temperature"].entity_description.native_step
+        == DEFAULT_STEP_TEMPERATURE
+    )
+    assert entities["aq_check_period"].entity_description.native_step == 1
+    timer = entities["kitchen_timer"].entity_description
+    assert (timer.name, timer.native_max_value) == ("Kitchen Timer", 300)
+    assert "aq_co2_setpoint" in entities
+    assert all(
+        desc.native_step is None for _, _, desc, opt in NUMBER_DESCRIPTIONS if opt
+    )
+
+
+AQ = AirQualitySensorType
+
+
+@pytest.mark.parametrize(
+    ("controller", "sensor1", "sensor2", "expected"),
+    [
+        (Controller.C6, AQ.CO2, AQ.VOC, {"aq_co2_setpoint"}),
+        (Controller.C6, AQ.NOT_INSTALLED, AQ.VOC, {"aq_voc_setpoint"}),
+        (
+            Controller.C6,
+            AQ.HUMIDITY,
+            AQ.CO2,
+            {"aq_co2_setpoint", "aq_humidity_setpoint"},
+        ),
+        (Controller.C6, AQ.NOT_INSTALLED, AQ.NOT_INSTALLED, set()),
+        (Controller.C8, AQ.NOT_INSTALLED, AQ.NOT_INSTALLED, {"aq_humidity_setpoint"}),
+    ],
+)
+async def test_setup_entry_aq_setpoints(
+    hass, mock_coordinator, controller, sensor1, sensor2, expected
+):
+    """Test AQ setpoints are added based on the installed sensor types."""
+    hass.data[DOMAIN] = {mock_coordinator.config_entry.entry_id: mock_coordinator}
+    mock_coordinator.controller = controller
+    mock_coordinator.data[registers.REG_AQ_SENSOR1_TYPE] = sensor1
+    mock_coordinator.data[registers.REG_AQ_SENSOR2_TYPE] = sensor2
+    entry = MagicMock(entry_id=mock_coordinator.config_entry.entry_id, options={})
+    add_entities = MagicMock()
+
+    await async_setup_entry(hass, entry, add_entities)
+
+    keys = {e.entity_description.key for e in add_entities.call_args[0][0]}
+    assert {k for k in keys if k.endswith("_setpoint")} - {
+        "aq_temperature_setpoint"
+    } == expected
@@ -0,0 +1,44 @@
+"""Tests for Komfovent register definitions."""
+
+from collections import Counter
+
+from custom_components.komfovent import registers
+
+REGISTER_ADDRESSES = {
+    name: value for name, value in vars(registers).items() if name.startswith("REG_")
+}
+
+
+def test_register_addresses_unique():
+    """Test no two register constants share an address."""
+    duplicates = [
+        address
+        for address, count in Counter(REGISTER_ADDRESSES.values()).items()
+        if count > 1
+    ]
+    assert duplicates == []
+
+
+def test_register_kind_covers_all_registers():
+    """Test every register maps to exactly one value type."""
+    sets = (
+        registers.REGISTERS_16BIT_UNSIGNED,
+        registers.REGISTERS_16BIT_SIGNED,
+        registers.REGISTERS_32BIT_UNSIGNED,
+    )
+    assert sum(map(len, sets)) == len(registers.REGISTER_KIND)
+    assert set(REGISTER_ADDRESSES.values()) == set(registers.REGISTER_KIND)
+    assert registers.REGISTER_KIND[registers.REG_POWER] == (
+        registers.KIND_16BIT_UNSIGNED
+    )
+    assert registers.REGISTER_KIND[registers.REG_SUPPLY_TEMP] == (
+        registers.KIND_16BIT_SIGNED
+    )
+    assert registers.REGISTER_KIND[registers.REG_FIRMWARE] == (
+        registers.KIND_32BIT_UNSIGNED
+    )
+
+
+def test_derived_register_sets_are_classified():
+    """Test EMA registers are known registers."""
+    assert registers.REGISTER_KIND.keys() >= registers.REGISTERS_APPLY_EMA
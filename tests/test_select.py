@@ -1,6 +1,6 @@
 """Tests for Komfovent select platform."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.select import SelectEntityDescription
@@ -8,13 +8,19 @@ from homeassistant.components.select import SelectEntityDescription
 from custom_components.komfovent import registers
 from custom_components.komfovent.const import (
     DOMAIN,
+    Controller,
     OperationMode,
     SchedulerMode,
     TemperatureControl,
 )
 from custom_components.komfovent.select import (
+    C6_SELECT_DESCRIPTIONS,
+    SELECT_DESCRIPTIONS,
     KomfoventOperationModeSelect,
     KomfoventSelect,
+    async_setup_entry,
+    enum_options,
+    option_values,
 )
 
 DESC = SelectEntityDescription(key="test", name="Test", options=["a"])
@@ -37,6 +43,30 @@ SELECT_OPTION_CASES = [
 
 EDGE_CASES = [(None, None), ({100: 99}, None)]
 
+# ==================== Setup Tests ====================
+
+
+@pytest.mark.parametrize(
+    ("controller", "expected"),
+    [
+        (Controller.C6, len(SELECT_DESCRIPTIONS) + len(C6_SELECT_DESCRIPTIONS)),
+        (Controller.C8, len(SELECT_DESCRIPTIONS)),
+    ],
+)
+async def test_setup_entry(hass, mock_coordinator, controller, expected):
+    """Test setup adds C6-only selects for C6 controllers."""
+    hass.data[DOMAIN] = {mock_coordinator.config_entry.entry_id: mock_coordinator}
+    mock_coordinator.controller = controller
+    entry = MagicMock(entry_id=mock_coordinator.config_entry.entry_id)
+    add_entities = MagicMock()
+
+    await async_setup_entry(hass, entry, add_entities)
+
+    entities = list(add_entities.call_args[0][0])
+    assert len(entities) == expected
+    assert isinstance(entities[0], KomfoventOperationModeSelect)
+
+
 # ==================== Entity Tests ====================
 
 
@@ -49,6 +79,13 @@ def test_entity_properties(mock_coordinator):
     assert s.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
 
 
+def test_option_names_cached():
+    """Test option tables are built once per enum."""
+    assert option_values(SchedulerMode) is option_values(SchedulerMode)
+    assert option_values(SchedulerMode)["office"] == SchedulerMode.OFFICE
+    assert enum_options(SchedulerMode) == [m.name.lower() for m in SchedulerMode]
+
+
 # ==================== Current Option Tests ====================
 
 
@@ -75,31 +112,42 @@ def test_current_option_edge_cases(mock_coordinator, data, expected):
     )
 
 
+def test_current_option_updates_on_coordinator_update(mock_coordinator):
+    """Test current_option is cached until the coordinator publishes new data."""
+    mock_coordinator.data = {100: SchedulerMode.OFFICE}
+    select = KomfoventSelect(mock_coordinator, 100, SchedulerMode, DESC)
+    mock_coordinator.data = {100: SchedulerMode.WORKING_WEEK}
+    assert select.current_option == "office"
+
+    with patch.object(select, "async_write_ha_state"):
+        select._handle_coordinator_update()
+    assert select.current_option == "working_week"
+
+
 # ==================== Select Option Tests ====================
 
 
 @pytest.mark.parametrize(("option", "expected_value"), SELECT_OPTION_CASES)
 async def test_select_option(mock_coordinator, option, expected_value):
-    """Test async_select_option writes enum value."""
+    """Test async_select_option writes enum value through the coordinator."""
     desc = SelectEntityDescription(
         key="t", name="T", options=[m.name.lower() for m in SchedulerMode]
     )
     await KomfoventSelect(
         mock_coordinator, 100, SchedulerMode, desc
     ).async_select_option(option)
-    mock_coordinator.client.write.assert_called_once_with(100, expected_value)
-    mock_coordinator.async_request_refresh.assert_called_once()
+    mock_coordinator.async_write.assert_called_once_with(100, expected_value)
 
 
 async def test_select_invalid_option(mock_coordinator):
-    """Test async_select_option raises KeyError for invalid option."""
+    """Test async_select_option ignores unknown options."""
     desc = SelectEntityDescription(
         key="t", name="T", options=[m.name.lower() for m in SchedulerMode]
     )
-    with pytest.raises(KeyError):
-        await KomfoventSelect(
-            mock_coordinator, 100, SchedulerMode, desc
-        ).async_select_option("invalid")
+    await KomfoventSelect(
+        mock_coordinator, 100, SchedulerMode, desc
+    ).async_select_option("invalid")
+    mock_coordinator.async_write.assert_not_called()
 
 
 # ==================== Operation Mode Select Tests ====================
@@ -1,6 +1,7 @@
 """Tests for Komfovent sensor platform."""
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 from homeassistant.components.sensor import SensorEntityDescription
@@ -18,6 +19,7 @@ from custom_components.komfovent.const import (
     OutdoorHumiditySensor,
 )
 from custom_components.komfovent.sensor import (
+    SENSOR_DESCRIPTIONS,
     AbsoluteHumiditySensor,
     CO2Sensor,
     ConnectedPanelsSensor,
@@ -124,6 +126,14 @@ class TestKomfoventSensor:
         sensor = KomfoventSensor(mock_coordinator, registers.REG_POWER, DESC)
         assert sensor.register_id == registers.REG_POWER
 
+    @pytest.mark.parametrize(
+        "sensor_class", [KomfoventSensor, TemperatureSensor, FlowSensor]
+    )
+    def test_slots(self, mock_coordinator, sensor_class):
+        """Test the register attribute is stored in a slot."""
+        sensor = sensor_class(mock_coordinator, registers.REG_POWER, DESC)
+        assert "register_id" not in vars(sensor)
+
     def test_unique_id(self, mock_coordinator):
         """Test unique_id generation."""
         sensor = KomfoventSensor(mock_coordinator, registers.REG_POWER, DESC)
@@ -306,6 +316,15 @@ class TestFirmwareVersionSensor:
             FirmwareVersionSensor(mock_coordinator, 100, DESC).native_value == expected
         )
 
+    def test_firmware_version_follows_register(self, mock_coordinator):
+        """Test the version string tracks the current register value."""
+        mock_coordinator.data = {100: 18886660}
+        sensor = FirmwareVersionSensor(mock_coordinator, 100, DESC)
+        assert sensor.native_value == "C6 1.2.3.4"
+
+        mock_coordinator.data = {100: 18886661}
+        assert sensor.native_value == "C6 1.2.3.5"
+
 
 # ==================== Dynamic Unit Sensors ====================
 
@@ -335,6 +354,23 @@ def test_flow_sensor_no_data(mock_coordinator):
     assert FlowSensor(mock_coordinator, 100, DESC).native_unit_of_measurement is None
 
 
+def test_flow_sensor_unit_updates(mock_coordinator):
+    """Test FlowSensor refreshes its cached unit on coordinator updates."""
+    mock_coordinator.data = {
+        registers.REG_FLOW_CONTROL: FlowControl.CONSTANT,
+        registers.REG_FLOW_UNIT: FlowUnit.M3H,
+    }
+    sensor = FlowSensor(mock_coordinator, 100, DESC)
+    mock_coordinator.data[registers.REG_FLOW_UNIT] = FlowUnit.LS
+    assert (
+        sensor.native_unit_of_measurement == UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR
+    )
+
+    with patch.object(sensor, "async_write_ha_state"):
+        sensor._handle_coordinator_update()
+    assert sensor.native_unit_of_measurement == UnitOfVolumeFlowRate.LITERS_PER_SECOND
+
+
 # ==================== System Time Sensor ====================
 
 
@@ -359,35 +395,44 @@ def test_system_time_sensor(mock_coordinator, data, is_datetime):
         (Controller.C8, {"supply_temperature"}, {"flow_unit", "specific_power_input"}),
     ],
 )
-async def test_create_sensors_controller(
-    mock_coordinator, controller, expected, unexpected
-):
+def test_create_sensors_controller(mock_coordinator, controller, expected, unexpected):
     """Test controller-specific sensor creation."""
     mock_coordinator.controller = controller
-    sensors = await create_sensors(mock_coordinator)
+    sensors = create_sensors(mock_coordinator)
     keys = {s.entity_description.key for s in sensors}
     assert expected <= keys
     assert not (unexpected & keys)
 
 
-async def test_create_sensors_count(mock_coordinator):
+def test_create_sensors_count(mock_coordinator):
     """Test that minimum number of sensors are created."""
-    assert len(await create_sensors(mock_coordinator)) > 20
+    assert len(create_sensors(mock_coordinator)) > 20
+
+
+def test_create_sensors_shares_descriptions(mock_coordinator):
+    """Test sensors reuse the module-level descriptions."""
+    sensors = create_sensors(mock_coordinator)
+    for sensor, (sensor_cls, register_id, description) in zip(
+        sensors, SENSOR_DESCRIPTIONS, strict=False
+    ):
+        assert type(sensor) is sensor_cls
+        assert sensor.register_id == register_id
+        assert sensor.entity_description is description
 
 
 @pytest.mark.parametrize(
     ("panels", "expected_in", "expected_out"),
     [
         (ConnectedPanels.PANEL1, {"panel_1_temperature"}, {"panel_2_temperature"}),
+        (ConnectedPanels.PANEL2, {"panel_2_temperature"}, {"panel_1_temperature"}),
+        (ConnectedPanels.BOTH, {"panel_1_temperature", "panel_2_temperature"}, set()),
         (ConnectedPanels.NONE, set(), {"panel_1_temperature", "panel_2_temperature"}),
     ],
 )
-async def test_create_sensors_panels(
-    mock_coordinator, panels, expected_in, expected_out
-):
+def test_create_sensors_panels(mock_coordinator, panels, expected_in, expected_out):
     """Test panel sensor creation based on connected panels."""
     mock_coordinator.data[registers.REG_CONNECTED_PANELS] = panels
-    keys = {s.entity_description.key for s in await create_sensors(mock_coordinator)}
+    keys = {s.entity_description.key for s in create_sensors(mock_coordinator)}
     assert expected_in <= keys
     assert not (expected_out & keys)
 
@@ -416,6 +461,32 @@ def test_create_aq_sensor_no_data(mock_coordinator):
     assert create_aq_sensor(mock_coordinator, registers.REG_EXTRACT_AQ_1) is None
 
 
+@pytest.mark.parametrize(
+    ("sensor_type", "outdoor", "expected_key"),
+    [
+        (
+            AirQualitySensorType.HUMIDITY,
+            OutdoorHumiditySensor.SENSOR2,
+            "outdoor_humidity",
+        ),
+        (
+            AirQualitySensorType.HUMIDITY,
+            OutdoorHumiditySensor.SENSOR1,
+            "extract_humidity",
+        ),
+        (AirQualitySensorType.CO2, OutdoorHumiditySensor.SENSOR2, "extract_co2"),
+        (99, OutdoorHumiditySensor.NONE, None),
+    ],
+)
+def test_create_aq_sensor2(mock_coordinator, sensor_type, outdoor, expected_key):
+    """Test AQ sensor 2 creation uses its own type and outdoor setting."""
+    mock_coordinator.data[registers.REG_AQ_SENSOR2_TYPE] = sensor_type
+    mock_coordinator.data[registers.REG_AQ_OUTDOOR_HUMIDITY] = outdoor
+    result = create_aq_sensor(mock_coordinator, registers.REG_EXTRACT_AQ_2)
+    key = result.entity_description.key if result else None
+    assert key == expected_key
+
+
 def test_create_aq_sensor_unknown_register(mock_coordinator):
     """Test unknown register returns None."""
     assert create_aq_sensor(mock_coordinator, 99999) is None
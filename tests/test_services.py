@@ -36,28 +36,26 @@ TIMER_MODES = [
 async def test_clean_filters_calibration(mock_coordinator):
     """Test clean_filters_calibration writes to register."""
     await clean_filters_calibration(mock_coordinator)
-    mock_coordinator.client.write.assert_called_once_with(
-        registers.REG_CLEAN_FILTERS, 1
-    )
+    mock_coordinator.async_write.assert_called_once_with(registers.REG_CLEAN_FILTERS, 1)
 
 
 async def test_set_operation_mode_off(mock_coordinator):
     """Test OFF mode sets power to 0."""
     await set_operation_mode(mock_coordinator, "off")
-    mock_coordinator.client.write.assert_called_once_with(registers.REG_POWER, 0)
+    mock_coordinator.async_write.assert_called_once_with(registers.REG_POWER, 0)
 
 
 async def test_set_operation_mode_air_quality(mock_coordinator):
     """Test AIR_QUALITY mode enables auto mode."""
     await set_operation_mode(mock_coordinator, "air_quality")
-    mock_coordinator.client.write.assert_called_once_with(registers.REG_AUTO_MODE, 1)
+    mock_coordinator.async_write.assert_called_once_with(registers.REG_AUTO_MODE, 1)
 
 
 @pytest.mark.parametrize(("mode_name", "mode_enum"), STANDARD_MODES)
 async def test_standard_modes(mock_coordinator, mode_name, mode_enum):
     """Test standard modes write to operation mode register."""
     await set_operation_mode(mock_coordinator, mode_name)
-    mock_coordinator.client.write.assert_called_once_with(
+    mock_coordinator.async_write.assert_called_once_with(
         registers.REG_OPERATION_MODE, mode_enum.value
     )
 
@@ -66,7 +64,7 @@ async def test_standard_modes(mock_coordinator, mode_name, mode_enum):
 async def test_timer_modes_with_minutes(mock_coordinator, mode, timer_reg):
     """Test timer modes write provided minutes."""
     await set_operation_mode(mock_coordinator, mode, minutes=30)
-    mock_coordinator.client.write.assert_called_once_with(timer_reg, 30)
+    mock_coordinator.async_write.assert_called_once_with(timer_reg, 30)
 
 
 @pytest.mark.parametrize(("mode", "timer_reg"), TIMER_MODES)
@@ -74,7 +72,7 @@ async def test_timer_modes_use_existing(mock_coordinator, mode, timer_reg):
     """Test timer modes use existing timer value."""
     mock_coordinator.data = {timer_reg: 45}
     await set_operation_mode(mock_coordinator, mode)
-    mock_coordinator.client.write.assert_called_once_with(timer_reg, 45)
+    mock_coordinator.async_write.assert_called_once_with(timer_reg, 45)
 
 
 @pytest.mark.parametrize(("mode", "timer_reg"), TIMER_MODES)
@@ -82,13 +80,13 @@ async def test_timer_modes_use_default(mock_coordinator, mode, timer_reg):
     """Test timer modes use default when no value available."""
     mock_coordinator.data = {}
     await set_operation_mode(mock_coordinator, mode)
-    mock_coordinator.client.write.assert_called_once_with(timer_reg, DEFAULT_MODE_TIMER)
+    mock_coordinator.async_write.assert_called_once_with(timer_reg, DEFAULT_MODE_TIMER)
 
 
 async def test_case_insensitive_mode(mock_coordinator):
     """Test mode names are case insensitive."""
     await set_operation_mode(mock_coordinator, "AWAY")
-    mock_coordinator.client.write.assert_called_once_with(
+    mock_coordinator.async_write.assert_called_once_with(
         registers.REG_OPERATION_MODE, OperationMode.AWAY.value
     )
 
@@ -101,11 +99,28 @@ async def test_unsupported_mode_logs_warning(mock_coordinator, mode):
         mock_logger.warning.assert_called_once()
 
 
+async def test_cooldown_set_before_write(mock_coordinator):
+    """Test the cooldown is set before the write requests its refresh."""
+    calls = []
+    mock_coordinator.set_cooldown.side_effect = lambda _s: calls.append("cooldown")
+    mock_coordinator.async_write.side_effect = lambda *_a: calls.append("write")
+    await set_operation_mode(mock_coordinator, "away")
+    assert calls == ["cooldown", "write"]
+    mock_coordinator.async_request_refresh.assert_not_called()
+
+
+async def test_unsupported_mode_requests_refresh(mock_coordinator):
+    """Test unsupported modes skip the write but still refresh."""
+    await set_operation_mode(mock_coordinator, "standby")
+    mock_coordinator.async_write.assert_not_called()
+    mock_coordinator.async_request_refresh.assert_awaited_once()
+
+
 async def test_set_system_time(mock_coordinator):
     """Test set_system_time writes epoch time."""
     mock_coordinator.hass.config.time_zone = "UTC"
     await set_system_time(mock_coordinator)
-    call_args = mock_coordinator.client.write.call_args[0]
+    call_args = mock_coordinator.async_write.call_args[0]
     assert call_args[0] == registers.REG_EPOCH_TIME
     assert isinstance(call_args[1], int)
     assert call_args[1] > 0
@@ -1,5 +1,7 @@
 """Tests for Komfovent switch platform."""
 
+from unittest.mock import patch
+
 import pytest
 from homeassistant.components.switch import SwitchEntityDescription
 
@@ -53,12 +55,29 @@ def test_is_on(mock_coordinator, data, expected):
     assert KomfoventSwitch(mock_coordinator, 100, DESC).is_on is expected
 
 
+def test_is_on_updates_on_coordinator_update(mock_coordinator):
+    """Test is_on is cached until the coordinator publishes new data."""
+    mock_coordinator.data = {100: 1}
+    switch = KomfoventSwitch(mock_coordinator, 100, DESC)
+    mock_coordinator.data = {100: 0}
+    assert switch.is_on is True
+
+    with patch.object(switch, "async_write_ha_state"):
+        switch._handle_coordinator_update()
+    assert switch.is_on is False
+
+
+def test_switch_slots(mock_coordinator):
+    """Test the register attribute is stored in a slot."""
+    assert "register_id" not in vars(KomfoventSwitch(mock_coordinator, 100, DESC))
+
+
 @pytest.mark.parametrize(("method", "expected_value"), TURN_CASES)
 async def test_turn_on_off(mock_coordinator, method, expected_value):
-    """Test turn on/off writes correct value."""
+    """Test turn on/off writes through the coordinator."""
     await getattr(KomfoventSwitch(mock_coordinator, 100, DESC), method)()
-    mock_coordinator.client.write.assert_called_once_with(100, expected_value)
-    mock_coordinator.async_request_refresh.assert_called_once()
+    mock_coordinator.async_write.assert_called_once_with(100, expected_value)
+    mock_coordinator.client.write.assert_not_called()
 
 
 @pytest.mark.parametrize(("method", "expected_value"), TURN_CASES)
@@ -68,7 +87,7 @@ async def test_power_switch(mock_coordinator, method, expected_value):
     await getattr(
         KomfoventSwitch(mock_coordinator, registers.REG_POWER, desc), method
     )()
-    mock_coordinator.client.write.assert_called_once_with(
+    mock_coordinator.async_write.assert_called_once_with(
         registers.REG_POWER, expected_value
     )
 
@@ -76,8 +95,8 @@ async def test_power_switch(mock_coordinator, method, expected_value):
 # ==================== Factory Tests ====================
 
 
-async def test_create_switches(mock_coordinator):
+def test_create_switches(mock_coordinator):
     """Test all 17 switch entities are created."""
-    switches = await create_switches(mock_coordinator)
+    switches = create_switches(mock_coordinator)
     assert len(switches) == 17
     assert {s.entity_description.key for s in switches} == EXPECTED_KEYS